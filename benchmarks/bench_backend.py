@@ -0,0 +1,80 @@
+"""Benchmark `create_and_push_branch` with each git backend.
+
+Every run starts a fresh interpreter, so the time includes importing
+gibr (and GitPython, for that backend) as a real `gibr create` would.
+
+    python benchmarks/bench_backend.py [--repo /path/to/repo] [--runs 10]
+
+Without --repo a small throwaway repository is used. Branches are not
+pushed.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gibr.gitbackend import GIT_BACKENDS
+
+SCRIPT = """
+import sys
+from gibr.git import create_and_push_branch
+create_and_push_branch(sys.argv[1], is_push=False, git_backend=sys.argv[2])
+"""
+
+
+def make_repo(path: Path) -> None:
+    """Create a repo at path with a single commit."""
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com"]
+        + ["commit", "-q", "--allow-empty", "-m", "initial"],
+        cwd=path,
+        check=True,
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repo", type=Path)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    path = args.repo or Path(tempfile.mkdtemp(prefix="gibr-bench-")) / "repo"
+    if not (path / ".git").exists():
+        make_repo(path)
+    start_branch = subprocess.run(
+        ["git", "branch", "--show-current"],
+        cwd=path,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+    for backend in GIT_BACKENDS:
+        timings = []
+        for run in range(args.runs):
+            subprocess.run(["git", "checkout", "-q", start_branch], cwd=path)
+            branch = f"bench-{backend}-{time.time_ns()}-{run}"
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-c", SCRIPT, branch, backend],
+                cwd=path,
+                check=True,
+                capture_output=True,
+            )
+            timings.append(time.perf_counter() - start)
+            subprocess.run(["git", "checkout", "-q", start_branch], cwd=path)
+            subprocess.run(["git", "branch", "-q", "-D", branch], cwd=path)
+        print(
+            f"{backend:>10}: median {statistics.median(timings) * 1000:8.1f} ms"
+            f"  (min {min(timings) * 1000:.1f} ms, {args.runs} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
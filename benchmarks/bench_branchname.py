@@ -0,0 +1,73 @@
+"""Benchmark rendering branch names in bulk.
+
+Compares the `str.format` call gibr used to make per issue with the
+compiled `BranchName` template, with and without ref validation.
+
+    python benchmarks/bench_branchname.py [--issues 100000]
+"""
+
+import argparse
+import time
+from types import SimpleNamespace
+
+from gibr.branch import BranchName
+
+FORMAT = "{issuetype|map:bug=fix,feature=feat}/{issue}-{title|truncate:40}"
+PLAIN_FORMAT = "{issuetype}/{issue}-{title}"
+# Names per second the compiled template must reach with validation
+TARGET_PER_SECOND = 100_000
+
+
+def str_format(issues: list) -> list[str]:
+    """Render names the way gibr used to."""
+    return [
+        PLAIN_FORMAT.format(
+            **{
+                "issuetype": issue.type,
+                "issue": issue.id,
+                "title": issue.sanitized_title,
+                "assignee": issue.assignee,
+            }
+        )
+        for issue in issues
+    ]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Stand-ins for Issue with the title already slugified, so that only
+    # templating is measured
+    issues = [
+        SimpleNamespace(
+            id=i,
+            type="bug",
+            sanitized_title=f"fix-bug-number-{i}-in-the-login-flow",
+            assignee=None,
+        )
+        for i in range(args.issues)
+    ]
+    branch = BranchName(FORMAT)
+    variants = (
+        ("str.format", str_format),
+        ("compiled", lambda issues: [branch.render(i) for i in issues]),
+        ("compiled+check", lambda issues: [branch.generate(i) for i in issues]),
+    )
+    rates = {}
+    for name, func in variants:
+        start = time.perf_counter()
+        func(issues)
+        rates[name] = args.issues / (time.perf_counter() - start)
+        print(f"{name:>15}: {rates[name]:>12,.0f} names/s")
+
+    rate = rates["compiled+check"]
+    status = "OK" if rate >= TARGET_PER_SECOND else "SLOW"
+    print(f"{status}: {rate:,.0f} names/s, target {TARGET_PER_SECOND:,}")
+    raise SystemExit(status != "OK")
+
+
+if __name__ == "__main__":
+    main()
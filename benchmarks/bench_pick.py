@@ -0,0 +1,67 @@
+"""Benchmark filtering in the issue picker, keystroke by keystroke.
+
+Types and deletes queries over a large list of issues the way a user
+would, timing each key including the rows redrawn, against the 16 ms a
+frame lasts at 60 Hz.
+
+    python benchmarks/bench_pick.py [--issues 50000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from gibr.cli.pick import BACKSPACE_KEYS, CLEAR_KEY, Picker
+
+# Seconds one keystroke may take
+BUDGET = 0.016
+WORDS = (
+    "fix add remove login logout page crash button api sync cache token user "
+    "admin report export import search filter sort mobile layout dark mode"
+).split()
+QUERIES = ["login", "cache sync", "xq", "expo"]
+
+
+def make_issues(count: int) -> list[tuple[int, str]]:
+    """Return count (id, title) pairs with varied titles."""
+    rng = random.Random(0)
+    return [
+        (i, " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))))
+        for i in range(count)
+    ]
+
+
+def keystrokes() -> list[str]:
+    """Return the keys typed: each query, then deleting it letter by letter."""
+    keys = []
+    for query in QUERIES:
+        keys += list(query) + [BACKSPACE_KEYS[0]] * 2 + list(query[-2:])
+        keys.append(CLEAR_KEY)
+    return keys
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=50_000)
+    args = parser.parse_args()
+
+    picker = Picker(make_issues(args.issues))
+    timings = []
+    for key in keystrokes():
+        start = time.perf_counter()
+        picker.handle(key)
+        picker.lines(width=100)
+        timings.append(time.perf_counter() - start)
+    worst = max(timings)
+    print(
+        f"{args.issues:,} issues, {len(timings)} keys: "
+        f"median {statistics.median(timings) * 1000:.2f} ms, "
+        f"worst {worst * 1000:.2f} ms "
+        f"({'within' if worst <= BUDGET else 'over'} {BUDGET * 1000:.0f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark slugifying issue titles for a large listing.
+
+Compares python-slugify with gibr.slug on ASCII and non-ASCII titles,
+and checks that both produce the same slugs.
+
+    python benchmarks/bench_slug.py [--titles 10000]
+"""
+
+import argparse
+import time
+
+from slugify import slugify as reference_slugify
+
+from gibr.issue import Issue
+from gibr.slug import slugify
+
+TITLES = {
+    "ascii": "Fix login bug #{i}: can't sign in with SSO (v1,200)",
+    "unicode": "Corriger la connexion n°{i} — échec après la mise à jour",
+}
+
+
+def rate(func, titles: list[str]) -> float:
+    """Return how many titles per second func slugifies."""
+    start = time.perf_counter()
+    for title in titles:
+        func(title)
+    return len(titles) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--titles", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for kind, template in TITLES.items():
+        titles = [template.format(i=i) for i in range(args.titles)]
+        assert [slugify(t) for t in titles] == [reference_slugify(t) for t in titles]
+        before = rate(reference_slugify, titles)
+        after = rate(slugify, titles)
+        print(
+            f"{kind:>8}: python-slugify {before:>10,.0f}/s, "
+            f"gibr.slug {after:>10,.0f}/s ({after / before:.1f}x)"
+        )
+
+    issues = [Issue(id=i, title=TITLES["ascii"], assignee=None) for i in range(10)]
+    start = time.perf_counter()
+    for _ in range(args.titles // 10):
+        for issue in issues:
+            issue.sanitized_title
+    repeated = args.titles / (time.perf_counter() - start)
+    print(f"memoized: sanitized_title {repeated:>10,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
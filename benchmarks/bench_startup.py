@@ -0,0 +1,123 @@
+"""Benchmark gibr's fast paths against a bare interpreter.
+
+Each run starts a fresh Python process, the way a shell prompt, git
+hook or shell completion does, for `gibr status --prompt`, the
+commit-msg hook and completing `gibr create <TAB>`.
+Interpreter startup is measured separately and subtracted, and the
+benchmark fails if what gibr adds on top exceeds the target of either.
+
+    python benchmarks/bench_startup.py [--runs 30]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gibr.branchindex import BranchIndex
+from gibr.completion import write_snapshot
+from gibr.issue import Issue
+
+PROMPT = "import sys; sys.argv[1:] = ['status', '--prompt']; "
+HOOK = "open('MSG', 'w').write('Fix it\\n'); "
+COMPLETE = (
+    "import os; os.environ.update(_GIBR_COMPLETE='zsh_complete', "
+    "COMP_WORDS='gibr create 12', COMP_CWORD='2'); "
+)
+COMMANDS = {
+    "python": "pass",
+    "prompt": PROMPT + "from gibr.prompt import main; main()",
+    "hook": HOOK + "from gibr.commitmsg import main; main(['MSG'])",
+    "complete": COMPLETE + "from gibr.prompt import main; main()",
+    "full cli": PROMPT + "from gibr.cli import cli; cli()",
+}
+# Milliseconds each fast path may add to interpreter startup
+TARGETS_MS = {"prompt": 10, "hook": 20, "complete": 30}
+
+
+def make_repo(path: Path, branches: int, issues: int) -> None:
+    """Create a repo whose branch index holds branches entries.
+
+    Its completion snapshot holds issues open issues.
+    """
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+    subprocess.run(
+        ["git", "commit", "-q", "--allow-empty", "-m", "initial"],
+        cwd=path,
+        check=True,
+        env={
+            **os.environ,
+            "GIT_AUTHOR_NAME": "b",
+            "GIT_AUTHOR_EMAIL": "b@b",
+            "GIT_COMMITTER_NAME": "b",
+            "GIT_COMMITTER_EMAIL": "b@b",
+        },
+    )
+    (path / ".gibrconfig").write_text(
+        "[DEFAULT]\nbranch_name_format = {issue}-{title}\n"
+        "[issue-tracker]\nname = jira\n"
+    )
+    index = BranchIndex.for_repo(path)
+    for i in range(branches):
+        index.record(
+            "jira",
+            Issue(id=f"PROJ-{i}", title=f"Issue {i}", assignee=None),
+            f"proj-{i}",
+        )
+    subprocess.run(["git", "checkout", "-q", "-b", f"proj-{branches - 1}"], cwd=path)
+    write_snapshot(
+        [
+            Issue(id=i, title=f"Issue {i} with a longer title", assignee=None)
+            for i in range(issues)
+        ],
+        path,
+    )
+
+
+def run_ms(code: str, cwd: Path) -> float:
+    """Return the wall time in ms of running code in a fresh interpreter."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code], cwd=cwd, check=True, stdout=subprocess.DEVNULL
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--branches", type=int, default=200)
+    parser.add_argument("--issues", type=int, default=10_000)
+    args = parser.parse_args()
+
+    path = Path(tempfile.mkdtemp(prefix="gibr-bench-")) / "repo"
+    make_repo(path, args.branches, args.issues)
+    timings = {label: [] for label in COMMANDS}
+    for run in range(args.runs + 1):
+        # Interleave the commands so drift affects them alike; skip a warm-up
+        for label, code in COMMANDS.items():
+            ms = run_ms(code, path)
+            if run:
+                timings[label].append(ms)
+    results = {label: statistics.median(ms) for label, ms in timings.items()}
+    for label, ms in results.items():
+        extra = ms - results["python"]
+        print(f"{label:>10}: median {ms:7.1f} ms  ({extra:+.1f} ms over python)")
+
+    failed = False
+    for label, target in TARGETS_MS.items():
+        overhead = results[label] - results["python"]
+        status = "OK" if overhead <= target else "FAIL"
+        failed |= status == "FAIL"
+        print(f"{status}: {label} adds {overhead:.1f} ms, target {target} ms")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
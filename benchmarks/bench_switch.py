@@ -0,0 +1,97 @@
+"""Benchmark branch creation + checkout on a large synthetic repository.
+
+Compares GitPython's `is_dirty()` + `create_head().checkout()` with the
+ref-only path used by `gibr create` (`warn_if_dirty` + `switch_to_new_branch`).
+
+    python benchmarks/bench_switch.py --files 500000 [--repo /tmp/big-repo]
+
+The synthetic repository is generated once with `git fast-import` and
+reused on later runs when --repo points at an existing directory.
+"""
+
+import argparse
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from git import Repo
+
+from gibr.git import switch_to_new_branch, warn_if_dirty
+from gibr.gitbackend import GitPythonBackend
+
+
+def make_repo(path: Path, files: int) -> None:
+    """Create a repo at path with one commit holding files small files."""
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+    lines = ["blob", "mark :1", "data 6", "hello", ""]
+    lines += [
+        "commit refs/heads/main",
+        "committer bench <bench@example.com> 0 +0000",
+        "data 7",
+        "initial",
+    ]
+    lines += [f"M 100644 :1 d{i // 1000:04d}/f{i:07d}.txt" for i in range(files)]
+    stream = "\n".join(lines) + "\n"
+    subprocess.run(
+        ["git", "fast-import", "--quiet"], cwd=path, input=stream, text=True, check=True
+    )
+    subprocess.run(["git", "reset", "-q", "--hard"], cwd=path, check=True)
+
+
+def gitpython_switch(repo: Repo, name: str) -> None:
+    """Switch branches the way gibr used to."""
+    repo.is_dirty(untracked_files=False)
+    repo.create_head(name).checkout()
+
+
+def ref_only_switch(repo: Repo, name: str) -> None:
+    """Switch branches the way gibr does now."""
+    backend = GitPythonBackend(repo.working_dir)
+    warn_if_dirty(backend)
+    head, current = backend.head()
+    switch_to_new_branch(backend, name, current, head)
+
+
+def ref_only_switch_no_dirty_check(repo: Repo, name: str) -> None:
+    """Switch branches with `dirty_check_timeout = 0`."""
+    backend = GitPythonBackend(repo.working_dir)
+    head, current = backend.head()
+    switch_to_new_branch(backend, name, current, head)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500_000)
+    parser.add_argument("--repo", type=Path)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    path = args.repo or Path(tempfile.mkdtemp(prefix="gibr-bench-")) / "repo"
+    if not (path / ".git").exists():
+        print(f"Generating {args.files} files in {path} ...")
+        make_repo(path, args.files)
+    repo = Repo(path)
+
+    variants = (
+        ("gitpython", gitpython_switch),
+        ("ref-only", ref_only_switch),
+        ("no-dirty", ref_only_switch_no_dirty_check),
+    )
+    for label, switch in variants:
+        timings = []
+        for run in range(args.runs):
+            repo.git.checkout("-q", "main")
+            start = time.perf_counter()
+            switch(repo, f"bench-{label}-{time.time_ns()}-{run}")
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{label:>10}: median {statistics.median(timings) * 1000:8.1f} ms"
+            f"  (min {min(timings) * 1000:.1f} ms, {args.runs} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,199 @@
-"""Branch name generation logic."""
+"""Branch name generation logic.
+
+`branch_name_format` is compiled once into a list of literal strings and
+field renderers. A field is a placeholder optionally followed by filters,
+e.g. `{title|truncate:40}`, `{assignee|lower}` or
+`{issuetype|map:bug=fix,feature=feat}`. A placeholder without filters may
+instead take a `str.format` spec, e.g. `{title:.30}`.
+"""
+
+import re
+from functools import lru_cache
+from operator import attrgetter
+from string import Formatter
+
+# The config placeholders and the Issue attribute each one renders
+FIELDS = {
+    "issuetype": attrgetter("type"),
+    "issue": attrgetter("id"),
+    "title": attrgetter("sanitized_title"),
+    "assignee": attrgetter("assignee"),
+}
+# Longest path component most file systems allow for a loose ref
+MAX_REF_COMPONENT_BYTES = 255
+# What `git check-ref-format --branch` rejects, with the reason shown
+REF_RULES = [
+    (re.compile(r"[\x00-\x20\x7f]"), "contains a space or control character"),
+    (re.compile(r"[~^:?*\[\\]"), "contains one of ~ ^ : ? * [ \\"),
+    (re.compile(r"\.\."), "contains '..'"),
+    (re.compile(r"@\{"), "contains '@{'"),
+    (re.compile(r"^/|/$|//"), "has an empty path component"),
+    (re.compile(r"(?:^|/)\."), "has a path component starting with '.'"),
+    (re.compile(r"\.lock(?:/|$)"), "has a path component ending with '.lock'"),
+    (re.compile(r"\.$"), "ends with '.'"),
+    (re.compile(r"^-"), "starts with '-'"),
+    (re.compile(r"^HEAD$"), "is 'HEAD'"),
+]
+INVALID_REF = re.compile("|".join(f"(?:{rule.pattern})" for rule, _ in REF_RULES))
+# Names made of these alone only need the length check
+SIMPLE_REF = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_-]*(?:/[A-Za-z0-9_-]+)*")
+
+
+def _truncate(arg: str):
+    """Return a filter keeping the first arg characters, without a trailing -."""
+    try:
+        length = int(arg)
+    except ValueError:
+        raise ValueError(f"truncate needs a length, got '{arg}'") from None
+    return lambda value: value[:length].rstrip("-")
+
+
+def _map(arg: str):
+    """Return a filter replacing values as listed in arg, e.g. bug=fix,a=b."""
+    try:
+        mapping = dict(pair.split("=", 1) for pair in arg.split(",") if pair)
+    except ValueError:
+        raise ValueError(f"map needs old=new pairs, got '{arg}'") from None
+    return lambda value: mapping.get(value, value)
+
+
+def _no_argument(name: str, func):
+    """Return a filter factory for func, which takes no argument."""
+
+    def factory(arg):
+        if arg is not None:
+            raise ValueError(f"{name} takes no argument")
+        return func
+
+    return factory
+
+
+FILTERS = {
+    "truncate": _truncate,
+    "map": _map,
+    "lower": _no_argument("lower", str.lower),
+    "upper": _no_argument("upper", str.upper),
+}
+
+
+def check_ref_format(name: str) -> str | None:
+    """Return why git would reject name as a branch name, or None if valid.
+
+    Follows the rules of `git check-ref-format --branch` without running
+    git, plus the file system limit on path component length.
+    """
+    if not SIMPLE_REF.fullmatch(name) or name == "HEAD":
+        if not name:
+            return "is empty"
+        if INVALID_REF.search(name):
+            for rule, reason in REF_RULES:
+                if rule.search(name):
+                    return reason
+    if len(name) * 4 > MAX_REF_COMPONENT_BYTES and any(
+        len(part.encode()) > MAX_REF_COMPONENT_BYTES for part in name.split("/")
+    ):
+        return f"has a path component longer than {MAX_REF_COMPONENT_BYTES} bytes"
+    return None
+
+
+def _compile_spec(name: str, spec: str):
+    """Return a function rendering placeholder name with a str.format spec."""
+    getter = FIELDS[name]
+
+    def render(issue):
+        value = getter(issue)
+        try:
+            return format(value, spec)
+        except ValueError:
+            raise ValueError(
+                f"Format spec ':{spec}' does not apply to {name} '{value}'."
+            ) from None
+
+    return render
+
+
+def _compile_field(expression: str):
+    """Return a function rendering one placeholder with its filters."""
+    name, *filter_specs = expression.split("|")
+    if name not in FIELDS:
+        raise ValueError(f"Unknown placeholder in format: {name}")
+    getter = FIELDS[name]
+    filters = []
+    for spec in filter_specs:
+        filter_name, sep, arg = spec.partition(":")
+        if filter_name not in FILTERS:
+            raise ValueError(f"Unknown filter in format: {filter_name}")
+        filters.append(FILTERS[filter_name](arg if sep else None))
+
+    if not filters:
+        return lambda issue: str(getter(issue))
+
+    def render(issue):
+        value = str(getter(issue))
+        for f in filters:
+            value = f(value)
+        return value
+
+    return render
+
+
+@lru_cache(maxsize=32)
+def compile_format(format_string: str) -> tuple[tuple, frozenset]:
+    """Return the parts of format_string and the placeholders it uses.
+
+    Parts are literal strings or functions rendering an issue's field.
+    """
+    parts = []
+    fields = set()
+    try:
+        parsed = list(Formatter().parse(format_string))
+    except ValueError as e:
+        raise ValueError(f"Invalid format: {e}") from None
+    for literal, field, spec, conversion in parsed:
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        if conversion or "{" in spec:
+            raise ValueError(f"Unsupported placeholder in format: {{{field}}}")
+        if spec and "|" not in field:
+            # A format spec such as {title:.30}, as plain str.format took
+            if field not in FIELDS:
+                raise ValueError(f"Unknown placeholder in format: {field}")
+            parts.append(_compile_spec(field, spec))
+            fields.add(field)
+            continue
+        # str.format splits "{title|truncate:40}" at the colon
+        expression = f"{field}:{spec}" if spec else field
+        parts.append(_compile_field(expression))
+        fields.add(expression.partition("|")[0])
+    return tuple(parts), frozenset(fields)
 
 
 class BranchName:
     """Generate branch names based on config and issue info."""
 
     def __init__(self, format_string: str):
-        """Construct BranchName object."""
+        """Construct BranchName object, compiling format_string.
+
+        Raises ValueError for unknown placeholders or filters.
+        """
         self.format = format_string
+        self.parts, self.fields = compile_format(format_string)
+
+    def render(self, issue) -> str:
+        """Return the branch name for issue, without validating it."""
+        return "".join(
+            [part if part.__class__ is str else part(issue) for part in self.parts]
+        )
 
     def generate(self, issue) -> str:
-        """Return formatted branch name."""
-        # The config placeholders match keys in this mapping
-        data = {
-            "issuetype": issue.type,
-            "issue": issue.id,
-            "title": issue.sanitized_title,
-            "assignee": issue.assignee,
-        }
-
-        # Simple Python str.format expansion
-        try:
-            branch_name = self.format.format(**data)
-        except KeyError as e:
-            raise ValueError(f"Unknown placeholder in format: {e.args[0]}")
+        """Return formatted branch name.
 
+        Raises ValueError if git would not accept it as a branch name.
+        """
+        branch_name = self.render(issue)
+        reason = check_ref_format(branch_name)
+        if reason:
+            raise ValueError(f"Branch name '{branch_name}' {reason}.")
         return branch_name
@@ -0,0 +1,143 @@
+"""Index of the branches gibr created for each issue, under .git/gibr/.
+
+Entries are keyed by tracker and issue ID, so looking up the branch of
+an issue is a single dictionary access. Each branch also gets a
+`branch.<name>.gibr-issue` git config entry; `git branch -m` carries
+that over to the new name, which is how renamed branches are found.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+
+from gibr.paths import state_dir
+from gibr.prompt import branch_pattern
+from gibr.store import locked_json, read_json
+
+BRANCH_INDEX_FILENAME = "branches.json"
+CONFIG_KEY = "gibr-issue"
+
+
+def issue_key(tracker: str, issue_id) -> str:
+    """Return the index key of an issue, e.g. "jira:proj-123"."""
+    return f"{tracker}:{str(issue_id).lstrip('#').lower()}"
+
+
+class BranchIndex:
+    """Map issues to the branches created for them in one repository."""
+
+    def __init__(self, directory: Path):
+        """Construct BranchIndex object for a gibr state directory."""
+        self.directory = Path(directory)
+        self.path = self.directory / BRANCH_INDEX_FILENAME
+
+    @classmethod
+    def for_repo(cls, start: Path | None = None):
+        """Return the index of the repository containing start, or None."""
+        directory = state_dir(start)
+        return cls(directory) if directory else None
+
+    @property
+    def git_dir(self) -> Path:
+        """Git directory the index belongs to."""
+        return self.directory.parent
+
+    def _git_config(self, *args) -> subprocess.CompletedProcess:
+        """Run `git config` on the repository."""
+        return subprocess.run(
+            ["git", "--git-dir", str(self.git_dir), "config", *args],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+        )
+
+    def record(self, tracker: str, issue, branch_name: str) -> None:
+        """Remember that branch_name was created for issue."""
+        key = issue_key(tracker, issue.id)
+        with locked_json(self.path, {}) as data:
+            entries = [e for e in data.get(key, []) if e["branch"] != branch_name]
+            entries.append(
+                {
+                    "branch": branch_name,
+                    "issue": str(issue.id),
+                    "title": issue.title,
+                    "created_at": time.time(),
+                }
+            )
+            data[key] = entries
+        self._git_config(f"branch.{branch_name}.{CONFIG_KEY}", key)
+
+    def forget(self, branch_names: list[str]) -> None:
+        """Drop the entries of deleted branches."""
+        deleted = set(branch_names)
+        with locked_json(self.path, {}) as data:
+            for key in list(data):
+                data[key] = [e for e in data[key] if e["branch"] not in deleted]
+                if not data[key]:
+                    del data[key]
+
+    def entries(self, tracker: str, issue_id) -> list[dict]:
+        """Return the recorded branches of an issue, oldest first."""
+        return read_json(self.path, {}).get(issue_key(tracker, issue_id), [])
+
+    def issues_by_branch(self) -> dict[str, str]:
+        """Return the issue ID recorded for each branch."""
+        return {
+            entry["branch"]: entry.get("issue") or key.partition(":")[2]
+            for key, entries in read_json(self.path, {}).items()
+            for entry in entries
+        }
+
+    def find(self, tracker: str, issue_id, refs) -> dict | None:
+        """Return the newest entry whose branch still exists, or None.
+
+        refs is a gibr.git.RefIndex. Branches renamed since they were
+        recorded are looked up through git config and updated here.
+        """
+        entries = self.entries(tracker, issue_id)
+        for entry in reversed(entries):
+            if refs.branch_exists(entry["branch"]):
+                return entry
+        renamed = [
+            branch
+            for branch in self._renamed_branches(issue_key(tracker, issue_id))
+            if refs.branch_exists(branch)
+        ]
+        if not entries or not renamed:
+            return None
+        entry = dict(entries[-1], branch=renamed[-1])
+        with locked_json(self.path, {}) as data:
+            data[issue_key(tracker, issue_id)] = [*entries[:-1], entry]
+        return entry
+
+    def _renamed_branches(self, key: str) -> list[str]:
+        """Return the branches whose git config points at key."""
+        proc = self._git_config("--get-regexp", rf"^branch\..*\.{CONFIG_KEY}$")
+        branches = []
+        for line in proc.stdout.splitlines():
+            name, _, value = line.partition(" ")
+            if value == key:
+                branch = name.removeprefix("branch.").removesuffix(f".{CONFIG_KEY}")
+                branches.append(branch)
+        return branches
+
+
+def branch_issue_ids(
+    branches: list[str], index: BranchIndex | None, branch_name_format: str
+) -> dict[str, str]:
+    """Map the branches that belong to an issue to its ID.
+
+    Branches recorded in the index are looked up there; the others are
+    matched against branch_name_format.
+    """
+    recorded = index.issues_by_branch() if index else {}
+    pattern = branch_pattern(branch_name_format)
+    if "issue" not in pattern.groupindex:
+        pattern = None
+    issue_ids = {}
+    for branch in branches:
+        if branch in recorded:
+            issue_ids[branch] = recorded[branch]
+        elif pattern and (match := pattern.fullmatch(branch)):
+            issue_ids[branch] = match["issue"]
+    return issue_ids
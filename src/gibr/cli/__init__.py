@@ -1,6 +1,8 @@
 """CLI for gibr."""
 
 import logging
+import sys
+from functools import partial
 
 import click
 
@@ -8,33 +10,87 @@ from gibr.config import GibrConfig
 from gibr.factory import get_tracker
 from gibr.logger import configure_logger
 from gibr.notify import warning
+from gibr.spans import OTLP_ENV_VAR, SpanRecorder, span
 
 from .alias import alias
+from .bench import bench
+from .branches import branches
 from .create import create
 from .group import GibrGroup
+from .hook import hook
 from .init import init
 from .issues import issues
+from .pick import pick
+from .prune import prune
+from .push import push, report_background_pushes
+from .status import status
+from .switch import switch
+from .worktrees import worktrees
+
+# Commands that work without a .gibrconfig or an issue tracker
+NO_CONFIG_COMMANDS = ("hook", "init", "push", "status")
+# Commands that read .gibrconfig but need no tracker; switch builds one
+# itself if it has to create a missing branch
+NO_TRACKER_COMMANDS = ("switch", "worktrees")
+# Commands that build the tracker themselves: create to work offline if it
+# can't be reached, pick to show cached issues meanwhile, bench to time it
+LAZY_TRACKER_COMMANDS = ("create", "pick", "bench")
 
 
 @click.group(cls=GibrGroup)
 @click.option("--verbose", is_flag=True, help="Turn on verbose logging")
+@click.option(
+    "--trace", is_flag=True, help="Show the issue tracker requests made, timed"
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the issue tracker requests made to a file, one JSON per line",
+)
+@click.option(
+    "--otlp-file",
+    envvar=OTLP_ENV_VAR,
+    type=click.Path(writable=True),
+    help="Export a trace of the command's phases as OTLP/JSON to a file or directory",
+)
 @click.pass_context
-def cli(ctx, verbose):
+def cli(ctx, verbose, trace, trace_file, otlp_file):
     """GIBR — streamline your git branch creation workflow."""
     # Configure logging and echo verbose mode
     configure_logger(verbose)
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
     logging.debug("Verbose modes enabled.")
+    if trace or trace_file:
+        from gibr.tracing import HttpTracer, report_trace
+
+        tracer = HttpTracer()
+        tracer.install()
+        ctx.call_on_close(partial(report_trace, tracer, trace_file))
+    if otlp_file:
+        recorder = SpanRecorder(
+            otlp_file,
+            f"gibr {ctx.invoked_subcommand}",
+            **{"gibr.command": ctx.invoked_subcommand},
+        )
+        recorder.start()
+        ctx.call_on_close(partial(_export_spans, recorder))
+    report_background_pushes()
 
     # Initialize shared config and tracker once
-    if ctx.invoked_subcommand == "init":
-        logging.debug("Skipping config loading for init command.")
+    if ctx.invoked_subcommand in NO_CONFIG_COMMANDS:
+        logging.debug(f"Skipping config loading for {ctx.invoked_subcommand} command.")
         return
     try:
-        config = GibrConfig().load()
+        with span("config discovery"):
+            config = GibrConfig().load()
         ctx.obj["config"] = config
-        ctx.obj["tracker"] = get_tracker(config.config)
+        if ctx.invoked_subcommand in NO_TRACKER_COMMANDS:
+            logging.debug(f"Skipping tracker for {ctx.invoked_subcommand} command.")
+        elif ctx.invoked_subcommand in LAZY_TRACKER_COMMANDS:
+            ctx.obj["tracker_factory"] = partial(get_tracker, config.config)
+        else:
+            ctx.obj["tracker"] = get_tracker(config.config)
     except FileNotFoundError as e:
         warning(str(e))
         click.echo("👉 Run `gibr init` to create a new configuration file.\n")
@@ -43,7 +99,22 @@ def cli(ctx, verbose):
         ctx.exit(0)
 
 
+def _export_spans(recorder):
+    """Export the trace, with the error the command failed with if any."""
+    path = recorder.finish(sys.exc_info()[1])
+    logging.debug(f"Exported trace {recorder.trace_id} to {path}.")
+
+
 cli.add_command(create)
 cli.add_command(issues)
 cli.add_command(alias)
 cli.add_command(init)
+cli.add_command(push)
+cli.add_command(worktrees)
+cli.add_command(switch)
+cli.add_command(status)
+cli.add_command(hook)
+cli.add_command(branches)
+cli.add_command(prune)
+cli.add_command(pick)
+cli.add_command(bench)
@@ -3,17 +3,20 @@
 import os
 
 import click
-from git import GitConfigParser
 
 from gibr.notify import party, success
 
-DO_NOT_ALIAS = ["alias", "init"]
+# "hook", "prune", "push", "status" and "switch" would shadow built-in git
+# commands, which git does not allow
+DO_NOT_ALIAS = ["alias", "hook", "init", "prune", "push", "status", "switch"]
 
 
 @click.command("alias")
 @click.pass_context
 def alias(ctx):
     """Add git aliases for gibr commands."""
+    from git import GitConfigParser
+
     commands = [
         name
         for name, cmd in ctx.parent.command.commands.items()
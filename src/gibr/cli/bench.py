@@ -0,0 +1,178 @@
+"""CLI command to measure the configured issue tracker from this machine."""
+
+import contextlib
+import io
+import json
+import math
+import time
+
+import click
+from tabulate import tabulate
+
+from gibr.notify import error, info
+from gibr.tracing import HttpTracer
+
+from .create import create
+
+# Operations timed, in the order they are shown
+OPERATIONS = ("construct", "get_issue", "list_issues", "iter_issues", "create")
+PERCENTILES = (50, 95, 99)
+DEFAULT_ITERATIONS = 5
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of values."""
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def measure(setup, operation, iterations: int) -> dict:
+    """Time operation(setup()) iterations times; return its statistics.
+
+    setup is neither timed nor traced. Requests and bytes are per run,
+    averaged.
+    """
+    durations, requests, sent, received = [], 0, 0, 0
+    for _ in range(iterations):
+        subject = setup()
+        with HttpTracer() as tracer:
+            start = time.perf_counter()
+            operation(subject)
+            durations.append((time.perf_counter() - start) * 1000)
+        requests += len(tracer.records)
+        sent += sum(record["bytes_out"] for record in tracer.records)
+        received += sum(record["bytes_in"] for record in tracer.records)
+    result = {f"p{pct}_ms": percentile(durations, pct) for pct in PERCENTILES}
+    result.update(
+        runs=iterations,
+        requests=requests / iterations,
+        bytes_out=sent / iterations,
+        bytes_in=received / iterations,
+    )
+    return result
+
+
+def _first_issue(tracker):
+    """Return the first issue iter_issues yields, if any."""
+    return next(iter(tracker.iter_issues()), None)
+
+
+def _dry_run_create(ctx, issue_id):
+    """Return an operation running `create --dry-run` with a given tracker.
+
+    The offline deadline is off, so a slow tracker is timed rather than
+    replaced by the issue cache.
+    """
+
+    def run(tracker):
+        ctx.obj.update(tracker=tracker, offline_timeout=0)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                ctx.invoke(create, issue_numbers=(issue_id,), dry_run=True)
+        finally:
+            del ctx.obj["tracker"], ctx.obj["offline_timeout"]
+
+    return run
+
+
+def _compare(result: dict, baseline: dict | None) -> str:
+    """Return the change in p50 against the baseline result, if there is one."""
+    if not baseline or not baseline.get("p50_ms"):
+        return ""
+    return f"{(result['p50_ms'] / baseline['p50_ms'] - 1) * 100:+.0f}%"
+
+
+def _load_baseline(path):
+    """Return the results saved in a baseline file."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["results"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        error(f"Can't read baseline {path}: {e}")
+
+
+@click.command("bench")
+@click.option(
+    "-n",
+    "--iterations",
+    type=click.IntRange(min=1),
+    default=DEFAULT_ITERATIONS,
+    show_default=True,
+    help="Runs of each operation, cold and warm.",
+)
+@click.option(
+    "--issue",
+    "issue_id",
+    metavar="ID",
+    help="Issue to fetch (default: the first open issue).",
+)
+@click.option(
+    "--only",
+    type=click.Choice(OPERATIONS),
+    multiple=True,
+    help="Only time these operations. Repeatable.",
+)
+@click.option(
+    "--save",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Save the results as JSON, to compare against later.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare p50 against results saved with --save.",
+)
+@click.pass_context
+def bench(ctx, iterations, issue_id, only, save, baseline):  # noqa: PLR0913, PLR0917
+    """Time requests to the issue tracker from this machine.
+
+    Cold runs use a new tracker client, so they include connecting;
+    warm runs share one client that has already made each request.
+    """
+    factory = ctx.obj["tracker_factory"]
+    baseline = _load_baseline(baseline) if baseline else {}
+    tracker = factory()
+    if issue_id is None:
+        first = _first_issue(tracker)
+        if first is None:
+            error("No open issues to fetch; pass --issue.")
+        issue_id = str(first.id)
+    operations = {
+        "construct": lambda _: factory(),
+        "get_issue": lambda t: t.get_issue(issue_id),
+        "list_issues": lambda t: t.list_issues(),
+        "iter_issues": _first_issue,
+        "create": _dry_run_create(ctx, issue_id),
+    }
+    info(f"Timing {iterations} run(s) of each operation, using issue {issue_id}.")
+    results = {}
+    for name in only or OPERATIONS:
+        operation = operations[name]
+        if name == "construct":
+            # The operation builds the client itself; setup need not
+            results[f"{name}/cold"] = measure(lambda: None, operation, iterations)
+            continue
+        results[f"{name}/cold"] = measure(factory, operation, iterations)
+        # One unmeasured run opens the connections the warm runs reuse
+        operation(tracker)
+        results[f"{name}/warm"] = measure(lambda: tracker, operation, iterations)
+
+    rows = [
+        [
+            *key.split("/"),
+            *(result[f"p{pct}_ms"] for pct in PERCENTILES),
+            result["requests"],
+            result["bytes_out"],
+            result["bytes_in"],
+        ]
+        + ([_compare(result, baseline.get(key))] if baseline else [])
+        for key, result in results.items()
+    ]
+    headers = ["Operation", "Mode", "p50 ms", "p95 ms", "p99 ms", "Requests"]
+    headers += ["Sent", "Received"] + (["p50 vs baseline"] if baseline else [])
+    click.echo(tabulate(rows, headers=headers, tablefmt="github", floatfmt=".1f"))
+    if save:
+        with open(save, "w", encoding="utf-8") as f:
+            json.dump({"iterations": iterations, "results": results}, f, indent=2)
+        info(f"Saved results to {save}.")
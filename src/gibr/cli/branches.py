@@ -0,0 +1,63 @@
+"""CLI command to list local branches with the state of their issues."""
+
+import click
+from tabulate import tabulate
+
+from gibr.branchindex import BranchIndex, branch_issue_ids
+from gibr.git import RefIndex
+from gibr.gitbackend import GitBackendError
+from gibr.issuecache import ISSUE_CACHE_TTL, IssueCache
+from gibr.notify import error, warning
+
+
+def local_branches(refs: RefIndex) -> list[str]:
+    """Return the names of all local branches, sorted."""
+    return [ref.removeprefix("refs/heads/") for ref in refs.with_prefix("refs/heads/")]
+
+
+def lookup_branch_issues(config, tracker, branches: list[str]) -> tuple[dict, dict]:
+    """Return the issue ID of each branch and the issues found for them.
+
+    Issues are fetched in bulk and served from the issue cache while it
+    is fresh.
+    """
+    defaults = config.config["DEFAULT"]
+    tracker_name = config.config.get("issue-tracker", {}).get("name", "")
+    issue_ids = branch_issue_ids(
+        branches, BranchIndex.for_repo(), defaults.get("branch_name_format", "")
+    )
+    if tracker.numeric_issues:
+        issue_ids = {b: i for b, i in issue_ids.items() if i.isdigit()}
+    ttl = float(defaults.get("issue_cache_ttl", ISSUE_CACHE_TTL))
+    cache = IssueCache.for_repo(tracker_name, ttl)
+    issues = cache.find_issues(tracker, list(issue_ids.values()))
+    return issue_ids, issues
+
+
+@click.command("branches")
+@click.pass_context
+def branches(ctx):
+    """List local branches with the state of their issues."""
+    try:
+        refs = RefIndex.for_path()
+    except GitBackendError:
+        error("Not inside a git repository.")
+    names = local_branches(refs)
+    issue_ids, issues = lookup_branch_issues(
+        ctx.obj["config"], ctx.obj["tracker"], names
+    )
+    if not issue_ids:
+        warning("No branches belong to an issue.")
+    table = []
+    for name in names:
+        issue_id = issue_ids.get(name)
+        issue = issues.get(issue_id)
+        if issue:
+            table.append([name, issue.id, issue.state, issue.assignee])
+        else:
+            table.append([name, issue_id, "not found" if issue_id else None, None])
+    click.echo(
+        tabulate(
+            table, headers=["Branch", "Issue", "State", "Assignee"], tablefmt="github"
+        )
+    )
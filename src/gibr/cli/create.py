@@ -1,36 +1,414 @@
 """CLI command to create a branch based on an issue number."""
 
+from pathlib import Path
+
 import click
+from tabulate import tabulate
 
 from gibr.branch import BranchName
-from gibr.git import create_and_push_branch
-from gibr.notify import error
+from gibr.branchindex import BranchIndex
+from gibr.completion import lookup
+from gibr.git import (
+    DIRTY_CHECK_TIMEOUT,
+    SUFFIX_POLICIES,
+    create_and_push_branch,
+    create_branches,
+    create_in_repos,
+    fetch_base,
+    find_submodules,
+)
+from gibr.gitbackend import DEFAULT_GIT_BACKEND, get_git_backend
+from gibr.issue import Issue
+from gibr.issuecache import IssueCache
+from gibr.notify import error, info, warning
+from gibr.offline import OFFLINE_TIMEOUT, OfflineError, call_with_deadline
+from gibr.pushqueue import PushQueue
+from gibr.registry import get_tracker_class
+from gibr.remotecache import REMOTE_CACHE_TTL
+from gibr.spans import span
+from gibr.worktree import create_worktree
+
+
+def _read_issue_numbers():
+    """Read whitespace-separated issue numbers from stdin."""
+    stdin = click.get_text_stream("stdin")
+    if stdin.isatty():
+        error("Provide at least one issue number (or pipe them in via stdin).")
+    return stdin.read().split()
+
+
+def _target_repos(repos, recurse_submodules, git_backend):
+    """Return the repositories to create the branch in."""
+    paths = [path.strip() for path in repos.split(",") if path.strip()] if repos else []
+    paths = paths or ["."]
+    if recurse_submodules:
+        for path in list(paths):
+            paths.extend(find_submodules(path, git_backend))
+    return list(dict.fromkeys(paths))
+
+
+def _complete_issue_numbers(ctx, param, incomplete):
+    """Offer the issue IDs in the completion snapshot."""
+    return [
+        click.shell_completion.CompletionItem(issue_id, help=title or None)
+        for issue_id, title in lookup(incomplete)
+    ]
 
 
 @click.command("create")
-@click.argument("issue_number")
+@click.argument("issue_numbers", nargs=-1, shell_complete=_complete_issue_numbers)
+@click.option(
+    "--repos",
+    metavar="PATH[,PATH...]",
+    help="Comma-separated repositories to create the branch in.",
+)
+@click.option(
+    "--recurse-submodules",
+    is_flag=True,
+    help="Also create the branch in every submodule.",
+)
+@click.option(
+    "--worktree",
+    is_flag=False,
+    flag_value="",
+    default=None,
+    metavar="[PATH]",
+    help="Create the branch in a new worktree instead of checking it out here.",
+)
+@click.option(
+    "--sparse",
+    multiple=True,
+    metavar="DIR",
+    help="With --worktree, only check out DIR (sparse, cone mode). Repeatable.",
+)
+@click.option(
+    "--suffix",
+    type=click.Choice(SUFFIX_POLICIES),
+    help="How to rename a branch that already exists (default: branch_suffix).",
+)
+@click.option(
+    "--from",
+    "base",
+    metavar="BASE",
+    help="Branch from BASE (e.g. origin/main), fetching just that branch first.",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Use cached issue data instead of the tracker and queue the push.",
+)
+@click.option(
+    "--title",
+    help="Offline, the title of an issue that is not cached.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Fetch the issues and show the branch names without creating branches.",
+)
 @click.pass_context
-def create(ctx, issue_number):
-    """Generate a branch based on the issue number provided."""
+def create(  # noqa: PLR0913, PLR0917
+    ctx,
+    issue_numbers,
+    repos,
+    recurse_submodules,
+    worktree,
+    sparse,
+    suffix,
+    base,
+    offline,
+    title,
+    dry_run,
+):
+    """Generate a branch for each issue number provided.
+
+    Pass "-" (or no issue numbers) to read them from stdin.
+    """
+    config = ctx.obj["config"]
+    # The tracker itself is only built when fetching, in case it's offline
+    tracker = ctx.obj.get("tracker") or get_tracker_class(_tracker_name(config))
+    if not issue_numbers or issue_numbers == ("-",):
+        issue_numbers = _read_issue_numbers()
+    for issue_number in issue_numbers:
+        if tracker.numeric_issues and not issue_number.isdigit():
+            error(
+                f"Issue number must be numeric for {tracker.display_name} issue "
+                "tracker."
+            )
+
+    multi_repo = bool(repos) or recurse_submodules
+    _check_options(issue_numbers, multi_repo, worktree, sparse, base)
+    if title and len(issue_numbers) > 1:
+        error("--title works with a single issue.")
+    branch = _branch_name(config)
+
+    issues, offline = _get_issues(ctx, issue_numbers, offline, title, dry_run)
+    with span("branch generation"):
+        branch_names = _generate_branch_names(branch, issues)
+    if dry_run:
+        return
+
+    is_push, push_async = _push_mode(config)
+    # Offline, pushes wait in the queue for the next online run
+    push_async = push_async or offline
+    suffix_policy = suffix or _suffix_policy(config)
+    # Offline, origin's branches come from the tracking refs: ls-remote
+    # would hang on the network that just failed
+    remote_cache_ttl = (
+        0
+        if offline
+        else float(config.config["DEFAULT"].get("remote_cache_ttl", REMOTE_CACHE_TTL))
+    )
+    git_backend = _git_backend(config)
+    start_point = (
+        None
+        if multi_repo
+        else _start_point(
+            config, base, remote_cache_ttl, fetch=not offline, git_backend=git_backend
+        )
+    )
+    if worktree is not None:
+        create_worktree(
+            branch_names[0],
+            path=worktree or None,
+            worktree_dir=config.config["DEFAULT"].get("worktree_dir"),
+            sparse_paths=sparse,
+            is_push=is_push,
+            push_async=push_async,
+            start_point=start_point,
+        )
+        created = [(None, branch_names[0], issues[0])]
+    elif multi_repo:
+        paths = _create_in_repos(
+            branch_names[0],
+            _target_repos(repos, recurse_submodules, git_backend),
+            is_push,
+            push_async,
+            git_backend,
+        )
+        created = [(path, branch_names[0], issues[0]) for path in paths]
+    elif len(branch_names) == 1:
+        branch_name = create_and_push_branch(
+            branch_names[0],
+            is_push,
+            push_async=push_async,
+            dirty_check_timeout=float(
+                config.config["DEFAULT"].get("dirty_check_timeout", DIRTY_CHECK_TIMEOUT)
+            ),
+            suffix_policy=suffix_policy,
+            remote_cache_ttl=remote_cache_ttl,
+            start_point=start_point,
+            git_backend=git_backend,
+        )
+        created = [(None, branch_name, issues[0])] if branch_name else []
+    else:
+        renamed = create_branches(
+            branch_names,
+            is_push,
+            push_async=push_async,
+            suffix_policy=suffix_policy,
+            remote_cache_ttl=remote_cache_ttl,
+            start_point=start_point,
+            git_backend=git_backend,
+        )
+        created = [
+            (None, renamed[name], issue)
+            for name, issue in zip(branch_names, issues, strict=True)
+            if name in renamed
+        ]
+    _record_branches(config, created)
+
+
+def _check_options(issue_numbers, multi_repo, worktree, sparse, base):
+    """Reject option combinations create can't handle."""
+    if multi_repo and len(issue_numbers) > 1:
+        error("--repos and --recurse-submodules work with a single issue.")
+    if worktree is not None and (multi_repo or len(issue_numbers) > 1):
+        error("--worktree works with a single issue in the current repository.")
+    if sparse and worktree is None:
+        error("--sparse requires --worktree.")
+    if base and multi_repo:
+        error("--from works in the current repository only.")
+
+
+def _start_point(
+    config, base, remote_cache_ttl, fetch=True, git_backend=DEFAULT_GIT_BACKEND
+):
+    """Fetch the base to branch from (--from or base_branch), if any."""
+    base = base or config.config["DEFAULT"].get("base_branch")
+    if not base:
+        return None
+    fetch_filter = config.config["DEFAULT"].get("fetch_filter")
+    with span("base fetch", **{"gibr.base": base}):
+        return fetch_base(
+            base, fetch_filter, remote_cache_ttl, fetch=fetch, git_backend=git_backend
+        )
+
+
+def _tracker_name(config):
+    """Return the name of the configured issue tracker."""
+    return config.config.get("issue-tracker", {}).get("name", "")
+
+
+def _get_issues(ctx, issue_numbers, offline, title, dry_run=False):
+    """Return the issues and whether they came from the cache, offline.
+
+    Without --offline the tracker is asked first; if it can't be reached
+    within offline_timeout seconds, create carries on offline. A dry run
+    leaves the issue cache and the push queue alone.
+    """
     config = ctx.obj["config"]
-    tracker = ctx.obj["tracker"]
-    if tracker.numeric_issues and not issue_number.isdigit():
-        error(f"Issue number must be numeric for {tracker.display_name} issue tracker.")
+    if not offline:
+        # ctx.obj["offline_timeout"] lets callers such as bench override it
+        timeout = float(
+            ctx.obj.get(
+                "offline_timeout",
+                config.config["DEFAULT"].get("offline_timeout", OFFLINE_TIMEOUT),
+            )
+        )
+
+        def fetch():
+            tracker = ctx.obj.get("tracker") or ctx.obj["tracker_factory"]()
+            with span("issue fetch", **{"gibr.issue_count": len(issue_numbers)}):
+                return tracker, _fetch_issues(tracker, issue_numbers)
+
+        try:
+            tracker, issues = call_with_deadline(fetch, timeout)
+        except OfflineError as e:
+            warning(f"Can't reach the issue tracker ({e}), working offline.")
+        else:
+            if not dry_run:
+                _reconcile(config, tracker, dict(zip(issue_numbers, issues)))
+            return issues, False
+    with span("issue fetch", **{"gibr.offline": True}):
+        return _cached_issues(config, issue_numbers, title, mark=not dry_run), True
+
+
+def _fetch_issues(tracker, issue_numbers):
+    """Return the issues from the tracker."""
+    if len(issue_numbers) == 1:
+        return [tracker.get_issue(issue_numbers[0])]
+    return tracker.get_issues(list(issue_numbers))
+
+
+def _cached_issues(config, issue_numbers, title, mark=True):
+    """Return the issues from the issue cache or completion snapshot, or --title.
+
+    With mark, the issues are marked in the cache so they are fetched
+    again on the next online run.
+    """
+    cache = IssueCache.for_repo(_tracker_name(config), ttl=float("inf"))
+    if cache is None:
+        error("Not inside a git repository.")
+    found = cache.get(list(issue_numbers))
+    for issue_number in issue_numbers:
+        if issue_number in found:
+            continue
+        titles = dict(lookup(issue_number))
+        if title or issue_number in titles:
+            found[issue_number] = Issue(
+                id=issue_number, title=title or titles[issue_number], assignee=None
+            )
+        else:
+            error(
+                f"Issue {issue_number} is not cached; pass --title to create "
+                "its branch offline."
+            )
+    if mark:
+        cache.put(found, offline=True)
+    return [found[issue_number] for issue_number in issue_numbers]
+
+
+def _reconcile(config, tracker, issues):
+    """Cache fetched issues and catch up on what was done offline."""
+    cache = IssueCache.for_repo(_tracker_name(config))
+    if cache is None:
+        return
+    cache.put(issues)
+    for used, current in cache.reconcile(tracker):
+        if current is None:
+            warning(f"Issue {used.id}, used offline, was not found.")
+        elif current.title != used.title:
+            info(f"Issue {used.id}, used offline, is titled: {current.title}")
+    queue = PushQueue.for_repo()
+    if queue and queue.pending():
+        queue.spawn_worker()
+        info("Pushing the branches queued while offline in the background.")
 
-    issue = tracker.get_issue(issue_number)
-    branch_name_format = config.config["DEFAULT"]["branch_name_format"]
 
+def _branch_name(config):
+    """Compile branch_name_format, so mistakes show before issues are fetched."""
+    try:
+        return BranchName(config.config["DEFAULT"]["branch_name_format"])
+    except ValueError as e:
+        error(f"Invalid branch_name_format: {e}")
+
+
+def _generate_branch_names(branch, issues):
+    """Return the branch name for each issue, echoing them as we go."""
     # TODO In the future, instead of setting an error here, we should ask if
     # they want to assign the issue to the current user
-    if not issue.assignee and "{assignee}" in branch_name_format:
+    if "assignee" in branch.fields and not all(i.assignee for i in issues):
         error(
             "Can't create branch, issue has no assignee and branch format requires it"
         )
-    branch_name = BranchName(config.config["DEFAULT"]["branch_name_format"]).generate(
-        issue
+    branch_names = []
+    for issue in issues:
+        try:
+            branch_name = branch.generate(issue)
+        except ValueError as e:
+            error(f"{e} Use filters in branch_name_format to shorten or map it.")
+        click.echo(f"Generating branch name for issue #{issue.id}: {issue.title}")
+        click.echo(f"Branch name: {branch_name}")
+        branch_names.append(branch_name)
+    return branch_names
+
+
+def _push_mode(config):
+    """Return (is_push, push_async) from the `push` setting."""
+    push = str(config.config["DEFAULT"].get("push", "true")).lower()
+    return push in ("true", "1", "yes", "on", "async"), push == "async"
+
+
+def _suffix_policy(config):
+    """Return the suffix policy from the `branch_suffix` setting."""
+    policy = str(config.config["DEFAULT"].get("branch_suffix", "prompt")).lower()
+    if policy not in SUFFIX_POLICIES:
+        warning(
+            f"Ignoring unknown branch_suffix '{policy}', expected one of: "
+            + ", ".join(SUFFIX_POLICIES)
+        )
+        return "prompt"
+    return policy
+
+
+def _git_backend(config):
+    """Return the name of the git backend from the `git_backend` setting."""
+    name = str(config.config["DEFAULT"].get("git_backend", DEFAULT_GIT_BACKEND))
+    try:
+        get_git_backend(name)
+    except ValueError as e:
+        error(str(e))
+    return name
+
+
+def _record_branches(config, created):
+    """Add (repository path, branch name, issue) triples to the branch index."""
+    tracker_name = _tracker_name(config)
+    for path, branch_name, issue in created:
+        index = BranchIndex.for_repo(Path(path) if path else None)
+        if index:
+            index.record(tracker_name, issue, branch_name)
+
+
+def _create_in_repos(branch_name, paths, is_push, push_async, git_backend):
+    """Create the branch in all repositories, print a summary, return the paths."""
+    results = create_in_repos(
+        branch_name, paths, is_push, push_async=push_async, git_backend=git_backend
     )
-    click.echo(f"Generating branch name for issue #{issue.id}: {issue.title}")
-    click.echo(f"Branch name: {branch_name}")
-    is_push = config.config["DEFAULT"].get("push", "true")
-    is_push = str(is_push).lower() in ("true", "1", "yes", "on")
-    create_and_push_branch(branch_name, is_push)
+    table = [[path, "✅" if ok else "❌", message] for path, ok, message in results]
+    click.echo(tabulate(table, headers=["Repository", "", "Result"], tablefmt="github"))
+    failed = sum(1 for _, ok, _ in results if not ok)
+    if failed:
+        warning(f"Branch could not be created in {failed} of {len(results)} repos.")
+    return [path for path, ok, _ in results if ok]
@@ -8,24 +8,41 @@ from gibr.trackers.jira import JiraTracker
 class GibrGroup(click.Group):
     """Custom Click group."""
 
+    def _option_arity(self, arg):
+        """Return how many args a group option in arg spans, or 0 if it isn't one."""
+        name, has_value, _ = arg.partition("=")
+        for param in self.params:
+            if isinstance(param, click.Option) and name in param.opts:
+                return 1 if param.is_flag or has_value else 2
+        return 0
+
     def parse_args(self, ctx, args):
         """Parse args to handle 'git' alias routing and default command (create)."""
         # If 'git' alias is present, handle it
         if args and args[0] == "git":
             args.pop(0)
 
-            # Move all flags (starting with '--') to the front
-            flags = [a for a in args if a.startswith("--")]
-            rest = [a for a in args if not a.startswith("--")]
-            args[:] = flags + rest
+            # Move the group's own options, with their values, to the front;
+            # the command's options stay where they are
+            group_options, rest = [], []
+            i = 0
+            while i < len(args):
+                arity = self._option_arity(args[i])
+                (group_options if arity else rest).extend(args[i : i + (arity or 1)])
+                i += arity or 1
+            args[:] = group_options + rest
 
         # Treat numeric as 'create' (gibr 123 -> gibr create 123)
-        for i, arg in enumerate(args):
-            if not arg.startswith("--"):
-                if arg not in self.commands and (
-                    arg.isdigit() or JiraTracker.is_jira_issue(arg)
-                ):
-                    args.insert(i, "create")
-                break
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg.startswith("--"):
+                i += self._option_arity(arg) or 1
+                continue
+            if arg not in self.commands and (
+                arg.isdigit() or JiraTracker.is_jira_issue(arg)
+            ):
+                args.insert(i, "create")
+            break
 
         return super().parse_args(ctx, args)
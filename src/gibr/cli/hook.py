@@ -0,0 +1,82 @@
+"""CLI commands to install and remove gibr's commit message hook."""
+
+import shlex
+import sys
+from pathlib import Path
+
+import click
+
+from gibr.gitbackend import GitBackendError, PlumbingBackend
+from gibr.notify import error, info, success, warning
+
+HOOK_MARKER = "# Installed by `gibr hook install`"
+HOOK_TYPES = ("commit-msg", "prepare-commit-msg")
+
+
+def hook_script() -> str:
+    """Return the hook, running gibr.commitmsg with this interpreter."""
+    # Calling python directly skips the console script and any shims in
+    # front of it; a broken hook must never stop the commit
+    return (
+        "#!/bin/sh\n"
+        f"{HOOK_MARKER}\n"
+        f'{shlex.quote(sys.executable)} -m gibr.commitmsg "$@" || true\n'
+    )
+
+
+def _hook_path(hook_type: str) -> Path:
+    """Return the path of a hook, honouring core.hooksPath."""
+    try:
+        hooks_dir = PlumbingBackend(".").run("rev-parse", "--git-path", "hooks")
+    except GitBackendError:
+        error("Not inside a git repository.")
+    return Path(hooks_dir) / hook_type
+
+
+def _is_ours(path: Path) -> bool:
+    """Return True if the hook at path was written by gibr."""
+    try:
+        return HOOK_MARKER in path.read_text()
+    except OSError:
+        return False
+
+
+@click.group("hook")
+def hook():
+    """Manage the hook that adds the issue key to commit messages."""
+
+
+@hook.command("install")
+@click.option(
+    "--type",
+    "hook_type",
+    type=click.Choice(HOOK_TYPES),
+    default="commit-msg",
+    show_default=True,
+    help="Git hook to install.",
+)
+@click.option("--force", is_flag=True, help="Replace a hook not written by gibr.")
+def install(hook_type, force):
+    """Install the hook into this repository."""
+    path = _hook_path(hook_type)
+    if path.exists() and not _is_ours(path) and not force:
+        error(f"{path} already exists. Use --force to replace it.")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(hook_script())
+    path.chmod(0o755)
+    success(f"Installed {hook_type} hook at {path}.")
+    info("Set `commit_msg_format` in .gibrconfig to change how messages look.")
+
+
+@hook.command("uninstall")
+def uninstall():
+    """Remove the hooks installed by gibr."""
+    removed = False
+    for hook_type in HOOK_TYPES:
+        path = _hook_path(hook_type)
+        if _is_ours(path):
+            path.unlink()
+            success(f"Removed {hook_type} hook.")
+            removed = True
+    if not removed:
+        warning("No gibr hook is installed.")
@@ -3,22 +3,82 @@
 import click
 from tabulate import tabulate
 
-from gibr.notify import warning
+from gibr.branch import BranchName
+from gibr.completion import write_snapshot
+from gibr.git import RefIndex
+from gibr.gitbackend import GitBackendError
+from gibr.notify import error, warning
+from gibr.remotecache import REMOTE_CACHE_TTL, RemoteRefCache
+
+from .branches import local_branches
+
+REMOTE = "origin"
+
+
+def existing_branches(config) -> tuple[set, set]:
+    """Return the local and origin branch names, or empty sets outside a repo.
+
+    Both are read once, so checking many names costs no git calls.
+    """
+    try:
+        refs = RefIndex.for_path()
+    except GitBackendError:
+        return set(), set()
+    ttl = float(config.config["DEFAULT"].get("remote_cache_ttl", REMOTE_CACHE_TTL))
+    remote = RemoteRefCache(refs, REMOTE, ttl=ttl).branches()
+    return set(local_branches(refs)), set(remote)
+
+
+def branch_name_rows(branch: BranchName, config, issues) -> list[list]:
+    """Return the branch name gibr would create for each issue and where it exists."""
+    local, remote = existing_branches(config)
+    needs_assignee = "assignee" in branch.fields
+    rows = []
+    for issue in issues:
+        if needs_assignee and not issue.assignee:
+            rows.append(["", ""])
+            continue
+        try:
+            name = branch.generate(issue)
+        except ValueError:
+            rows.append(["", ""])
+            continue
+        exists = [
+            where
+            for where, names in (("local", local), (REMOTE, remote))
+            if name in names
+        ]
+        rows.append([name, ", ".join(exists)])
+    return rows
 
 
 @click.command("issues")
+@click.option(
+    "--branch-names",
+    is_flag=True,
+    help="Show the branch gibr would create for each issue and where it exists.",
+)
 @click.pass_context
-def issues(ctx):
+def issues(ctx, branch_names):
     """List open issues from the tracker."""
     tracker = ctx.obj["tracker"]
+    if branch_names:
+        config = ctx.obj["config"]
+        try:
+            branch = BranchName(config.config["DEFAULT"]["branch_name_format"])
+        except ValueError as e:
+            error(f"Invalid branch_name_format: {e}")
     issues = tracker.list_issues()
+    write_snapshot(issues)
     if not issues:
         warning("No open issues found.")
         return
     table = [[issue.id, issue.type, issue.title, issue.assignee] for issue in issues]
+    headers = ["Issue", "Type", "Title", "Assignee"]
+    if branch_names:
+        rows = branch_name_rows(branch, config, issues)
+        for row, extra in zip(table, rows, strict=True):
+            row.extend(extra)
+        headers += ["Branch", "Exists"]
 
-    click.echo(
-        tabulate(
-            table, headers=["Issue", "Type", "Title", "Assignee"], tablefmt="github"
-        )
-    )
+    click.echo(tabulate(table, headers=headers, tablefmt="github"))
@@ -0,0 +1,246 @@
+"""CLI command to pick an issue interactively and create its branch."""
+
+import functools
+import logging
+import shutil
+import sys
+import threading
+import time
+from itertools import groupby
+
+import click
+
+from gibr.completion import lookup, write_snapshot
+from gibr.fuzzy import FuzzyMatcher
+from gibr.notify import error, warning
+
+from .create import create
+
+# Most issues shown at once
+MAX_ROWS = 15
+# Seconds between redraws while issues stream in from the tracker
+BATCH_SECONDS = 0.05
+# Keys, as click.getchar returns them on POSIX and Windows terminals
+ENTER_KEYS = ("\r", "\n")
+CANCEL_KEYS = ("\x1b", "\x07")
+BACKSPACE_KEYS = ("\x7f", "\x08")
+UP_KEYS = ("\x1b[A", "\x1bOA", "\xe0H", "\x00H", "\x10")
+DOWN_KEYS = ("\x1b[B", "\x1bOB", "\xe0P", "\x00P", "\x0e")
+CLEAR_KEY = "\x15"
+DELETE_WORD_KEY = "\x17"
+
+
+def _highlight(text: str, positions: set) -> str:
+    """Return text with the characters at positions styled."""
+    runs = groupby(enumerate(text), key=lambda item: item[0] in positions)
+    return "".join(
+        click.style(part, fg="yellow", bold=True) if matched else part
+        for matched, part in (
+            (matched, "".join(char for _, char in run)) for matched, run in runs
+        )
+    )
+
+
+class Picker:
+    """Issues to pick from, the query typed so far and the selected row."""
+
+    def __init__(self, issues=(), rows=MAX_ROWS):
+        """Construct Picker object from (id, title) pairs."""
+        self.issues = []
+        self.positions = {}
+        self.matcher = FuzzyMatcher()
+        self.query = ""
+        self.selected = 0
+        self.rows = rows
+        self.status = "loading"
+        self.merge(issues)
+
+    def merge(self, issues) -> None:
+        """Add (id, title) pairs, updating the titles of known issues."""
+        added, changed = [], {}
+        for issue_id, title in issues:
+            issue_id = str(issue_id)
+            pos = self.positions.get(issue_id)
+            if pos is None:
+                self.positions[issue_id] = len(self.issues)
+                self.issues.append((issue_id, title))
+                added.append(f"{issue_id} {title}")
+            elif self.issues[pos][1] != title:
+                self.issues[pos] = (issue_id, title)
+                changed[pos] = f"{issue_id} {title}"
+        self.matcher.extend(added)
+        if changed:
+            self.matcher.replace(changed)
+
+    def keep_only(self, issue_ids) -> None:
+        """Drop the issues not among issue_ids, e.g. closed since the snapshot."""
+        keep = {str(issue_id) for issue_id in issue_ids}
+        gone = {
+            pos: None
+            for issue_id, pos in self.positions.items()
+            if issue_id not in keep and pos not in self.matcher.removed
+        }
+        if gone:
+            self.matcher.replace(gone)
+
+    def visible(self) -> list[int]:
+        """Return the positions of the issues shown, best match first."""
+        return self.matcher.matches(self.rows)
+
+    def selection(self):
+        """Return the selected (id, title), or None if nothing matches."""
+        visible = self.visible()
+        if not visible:
+            return None
+        return self.issues[visible[min(self.selected, len(visible) - 1)]]
+
+    def handle(self, key: str) -> str | None:
+        """Apply a key; return "pick" or "cancel" when picking is over."""
+        if key in ENTER_KEYS:
+            return "pick" if self.selection() else None
+        if key in CANCEL_KEYS:
+            return "cancel"
+        if key in UP_KEYS:
+            self.selected = max(self.selected - 1, 0)
+        elif key in DOWN_KEYS:
+            self.selected = max(min(self.selected + 1, len(self.visible()) - 1), 0)
+        elif key in BACKSPACE_KEYS:
+            self.set_query(self.query[:-1])
+        elif key == CLEAR_KEY:
+            self.set_query("")
+        elif key == DELETE_WORD_KEY:
+            self.set_query(self.query.rstrip().rpartition(" ")[0])
+        elif key.isprintable():
+            self.set_query(self.query + key)
+        return None
+
+    def set_query(self, query: str) -> None:
+        """Filter the issues by query and select the best match."""
+        self.query = query
+        self.matcher.set_query(query)
+        self.selected = 0
+
+    def lines(self, width: int) -> list[str]:
+        """Return the prompt line and a line per issue shown, styled."""
+        status = f"{self.matcher.count()}/{len(self.matcher)}"
+        if self.status:
+            status += f" ({self.status})"
+        lines = [f"> {self.query}  " + click.style(status, dim=True)]
+        visible = self.visible()
+        selected = min(self.selected, len(visible) - 1)
+        for row, pos in enumerate(visible):
+            issue_id, title = self.issues[pos]
+            text = f"{issue_id} {title}"[: max(width - 3, 1)]
+            styled = _highlight(text, set(self.matcher.positions(pos)))
+            marker = (
+                click.style("▶ ", fg="cyan", bold=True) if row == selected else "  "
+            )
+            lines.append(marker + styled)
+        return lines
+
+
+class Screen:
+    """Draw the picker below the cursor, redrawing it in place."""
+
+    def __init__(self, picker: Picker):
+        """Construct Screen object for picker."""
+        self.picker = picker
+        self.lock = threading.Lock()
+
+    def draw(self) -> None:
+        """Redraw the picker and put the cursor after the query."""
+        lines = self.picker.lines(shutil.get_terminal_size().columns)
+        # Raw mode (while waiting for a key) does not turn \n into \r\n
+        out = "\r\x1b[J" + "\r\n".join(lines)
+        if len(lines) > 1:
+            out += f"\x1b[{len(lines) - 1}A"
+        out += f"\r\x1b[{len(self.picker.query) + 2}C"
+        click.echo(out, nl=False)
+        sys.stdout.flush()
+
+    def clear(self) -> None:
+        """Erase the picker."""
+        click.echo("\r\x1b[J", nl=False)
+
+    def update(self, func, *args) -> None:
+        """Apply func to the picker from another thread, then redraw."""
+        with self.lock:
+            func(*args)
+            self.draw()
+
+
+def load_issues(tracker_factory, screen: Screen) -> None:
+    """Stream the open issues into the picker, then save them as the snapshot.
+
+    The tracker is built here too, as building it may already go to the
+    network, so that the picker shows the cached issues meanwhile.
+    """
+    picker = screen.picker
+    fetched, batch = [], []
+    last = time.monotonic()
+    try:
+        for issue in tracker_factory().iter_issues():
+            fetched.append(issue)
+            batch.append((issue.id, issue.title))
+            if time.monotonic() - last >= BATCH_SECONDS:
+                screen.update(picker.merge, batch)
+                batch, last = [], time.monotonic()
+    except Exception as e:
+        logging.debug(f"Loading issues failed: {e}")
+        screen.update(setattr, picker, "status", "offline")
+        return
+    screen.update(picker.merge, batch)
+    screen.update(picker.keep_only, [issue.id for issue in fetched])
+    screen.update(setattr, picker, "status", "")
+    write_snapshot(fetched)
+
+
+def _issue_sort_key(issue):
+    """Sort snapshot issues newest first: longer IDs, then higher ones."""
+    return len(issue[0]), issue[0]
+
+
+def _is_interactive() -> bool:
+    """Return True if both stdin and stdout are terminals."""
+    return sys.stdin.isatty() and sys.stdout.isatty()
+
+
+def run_picker(tracker_factory) -> tuple | None:
+    """Let the user pick an issue; return its (id, title), or None if cancelled."""
+    rows = min(MAX_ROWS, max(shutil.get_terminal_size().lines - 2, 1))
+    cached = sorted(lookup("", limit=sys.maxsize), key=_issue_sort_key, reverse=True)
+    picker = Picker(cached, rows)
+    screen = Screen(picker)
+    with screen.lock:
+        screen.draw()
+    threading.Thread(
+        target=load_issues, args=(tracker_factory, screen), daemon=True
+    ).start()
+    action = None
+    while action is None:
+        try:
+            key = click.getchar()
+        except (KeyboardInterrupt, EOFError):
+            key = CANCEL_KEYS[0]
+        with screen.lock:
+            action = picker.handle(key)
+            if action is None:
+                screen.draw()
+            else:
+                screen.clear()
+    return picker.selection() if action == "pick" else None
+
+
+@click.command("pick")
+@click.pass_context
+def pick(ctx):
+    """Pick an issue with fuzzy search and create its branch."""
+    if not _is_interactive():
+        error("gibr pick needs an interactive terminal; use `gibr create` instead.")
+    # Built once, by the loader or by create, whichever needs it first
+    ctx.obj["tracker_factory"] = functools.cache(ctx.obj["tracker_factory"])
+    selection = run_picker(ctx.obj["tracker_factory"])
+    if selection is None:
+        warning("No issue picked.")
+        return
+    ctx.invoke(create, issue_numbers=(selection[0],))
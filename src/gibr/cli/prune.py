@@ -0,0 +1,101 @@
+"""CLI command to delete branches whose issues are closed."""
+
+import click
+from tabulate import tabulate
+
+from gibr.branchindex import BranchIndex
+from gibr.git import RefIndex, checked_out_branches, delete_branches
+from gibr.gitbackend import GitBackendError
+from gibr.notify import error, info, success, warning
+from gibr.pushqueue import delete_remote_branches
+from gibr.remotecache import REMOTE_CACHE_TTL, RemoteRefCache
+
+from .branches import local_branches, lookup_branch_issues
+
+REMOTE = "origin"
+
+
+@click.command("prune")
+@click.option(
+    "--remote", "include_remote", is_flag=True, help=f"Also delete them on {REMOTE}."
+)
+@click.option("--dry-run", is_flag=True, help="Only show what would be deleted.")
+@click.option("--yes", is_flag=True, help="Delete without asking for confirmation.")
+@click.pass_context
+def prune(ctx, include_remote, dry_run, yes):
+    """Delete branches whose issues are closed."""
+    try:
+        refs = RefIndex.for_path()
+    except GitBackendError:
+        error("Not inside a git repository.")
+    config = ctx.obj["config"]
+    local = set(local_branches(refs))
+    remote = set()
+    protected = checked_out_branches(refs.git_dir)
+    if include_remote:
+        remote_refs = RemoteRefCache(
+            refs,
+            REMOTE,
+            ttl=float(
+                config.config["DEFAULT"].get("remote_cache_ttl", REMOTE_CACHE_TTL)
+            ),
+        )
+        remote = set(remote_refs.branches())
+        protected.add(remote_refs.default_branch())
+
+    candidates = sorted((local | remote) - protected)
+    issue_ids, issues = lookup_branch_issues(config, ctx.obj["tracker"], candidates)
+    plan = [
+        (branch, issues[issue_ids[branch]])
+        for branch in candidates
+        if branch in issue_ids
+        and issue_ids[branch] in issues
+        and issues[issue_ids[branch]].closed
+    ]
+    if not plan:
+        info("No branches belong to closed issues.")
+        return
+
+    table = [
+        [
+            branch,
+            issue.id,
+            issue.state,
+            "yes" if branch in local else "",
+            "yes" if branch in remote else "",
+        ]
+        for branch, issue in plan
+    ]
+    click.echo(
+        tabulate(
+            table,
+            headers=["Branch", "Issue", "State", "Local", REMOTE.capitalize()],
+            tablefmt="github",
+        )
+    )
+    if dry_run:
+        return
+    if not yes and not click.confirm(f"Delete {len(plan)} branch(es)?", default=False):
+        return
+
+    to_delete = [branch for branch, _ in plan if branch in local]
+    if to_delete:
+        try:
+            delete_branches(refs.git_dir, to_delete)
+        except GitBackendError as e:
+            error(f"Could not delete local branches: {e}")
+        BranchIndex.for_repo().forget(to_delete)
+        success(f"Deleted {len(to_delete)} local branch(es).")
+
+    to_delete = [branch for branch, _ in plan if branch in remote]
+    if to_delete:
+        outcome = delete_remote_branches(".", REMOTE, to_delete)
+        deleted = [branch for branch in to_delete if outcome[branch][0]]
+        remote_refs.discard(deleted)
+        for branch in to_delete:
+            if not outcome[branch][0]:
+                warning(
+                    f"Could not delete '{branch}' on {REMOTE}: {outcome[branch][1]}"
+                )
+        if deleted:
+            success(f"Deleted {len(deleted)} branch(es) on {REMOTE}.")
@@ -0,0 +1,51 @@
+"""CLI command to inspect and retry queued background pushes."""
+
+import click
+
+from gibr.notify import error, info, success, warning
+from gibr.pushqueue import PushQueue
+
+
+def report_push_results(results):
+    """Display the outcome of queued pushes."""
+    for result in results:
+        if result["ok"]:
+            success(f"Pushed branch '{result['branch']}' to {result['remote']}.")
+        else:
+            warning(
+                f"Push of '{result['branch']}' to {result['remote']} failed: "
+                f"{result['message']}"
+            )
+
+
+def report_background_pushes():
+    """Report pushes finished by the background worker since the last run."""
+    queue = PushQueue.for_repo()
+    if queue is None or not queue.path.exists():
+        return
+    results = queue.take_results()
+    report_push_results(results)
+    if any(not result["ok"] for result in results):
+        info("Run `gibr push --pending` to retry.")
+
+
+@click.command("push")
+@click.option("--pending", is_flag=True, help="Retry all queued pushes now.")
+def push(pending):
+    """Show or retry branch pushes queued by `push = async`."""
+    queue = PushQueue.for_repo()
+    if queue is None:
+        error("Not inside a git repository.")
+    jobs = queue.pending()
+    if not jobs:
+        info("No pending pushes.")
+        return
+    if not pending:
+        for job in jobs:
+            status = (
+                f" (failed {job['attempts']}x: {job['error']})" if job["error"] else ""
+            )
+            click.echo(f"{job['remote']} {job['branch']}{status}")
+        info("Run `gibr push --pending` to push them now.")
+        return
+    report_push_results(queue.run(record=False))
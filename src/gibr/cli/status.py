@@ -0,0 +1,27 @@
+"""CLI command to show the issue of the checked-out branch."""
+
+import click
+
+from gibr.notify import info, warning
+from gibr.prompt import branch_issue, prompt_text
+
+
+@click.command("status")
+@click.option(
+    "--prompt", is_flag=True, help="Print only '<issue> <title>', for shell prompts."
+)
+def status(prompt):
+    """Show the issue the checked-out branch was created for."""
+    if prompt:
+        # `gibr status --prompt` normally never gets here, see gibr.prompt.main
+        text = prompt_text()
+        if text:
+            click.echo(text)
+        return
+    branch, issue, title = branch_issue()
+    if branch is None:
+        warning("Not on a branch.")
+    elif not issue:
+        warning(f"No issue found for branch '{branch}'.")
+    else:
+        info(f"On branch '{branch}' for issue {issue}: {title or '(title unknown)'}")
@@ -0,0 +1,50 @@
+"""CLI command to check out the branch gibr created for an issue."""
+
+import click
+
+from gibr.branchindex import BranchIndex
+from gibr.factory import get_tracker
+from gibr.git import RefIndex, switch_branch
+from gibr.gitbackend import DEFAULT_GIT_BACKEND
+from gibr.notify import error, success, warning
+from gibr.registry import get_tracker_class
+
+from .create import create
+
+
+def _resolve_issue_id(config, tracker_name, issue_number):
+    """Return issue_number as the tracker records it, e.g. "PROJ-12" for "12"."""
+    try:
+        tracker_cls = get_tracker_class(tracker_name)
+    except ValueError:
+        return issue_number
+    return tracker_cls.resolve_issue_id(
+        issue_number, config.config.get(tracker_name, {})
+    )
+
+
+@click.command("switch")
+@click.argument("issue_number")
+@click.pass_context
+def switch(ctx, issue_number):
+    """Check out the branch created for an issue, or offer to create one."""
+    config = ctx.obj["config"]
+    index = BranchIndex.for_repo()
+    if index is None:
+        error("Not inside a git repository.")
+    tracker_name = config.config.get("issue-tracker", {}).get("name", "")
+    issue_id = _resolve_issue_id(config, tracker_name, issue_number)
+    entry = index.find(tracker_name, issue_id, RefIndex(index.git_dir))
+    if entry:
+        switch_branch(
+            entry["branch"],
+            config.config["DEFAULT"].get("git_backend", DEFAULT_GIT_BACKEND),
+        )
+        success(f"Switched to branch '{entry['branch']}' ({entry['title']}).")
+        return
+
+    warning(f"No branch found for issue {issue_number}.")
+    if click.confirm("Would you like to create one?", default=True):
+        # Only creating a branch needs the issue tracker
+        ctx.obj["tracker"] = get_tracker(config.config)
+        ctx.invoke(create, issue_numbers=(issue_number,))
@@ -0,0 +1,40 @@
+"""CLI command to list, prune and pre-create gibr worktrees."""
+
+import click
+from tabulate import tabulate
+
+from gibr.notify import info, success, warning
+from gibr.worktree import fill_pool, list_worktrees, prune_worktrees
+
+
+@click.command("worktrees")
+@click.option("--prune", is_flag=True, help="Forget worktrees that were deleted.")
+@click.option(
+    "--pool",
+    type=click.IntRange(min=1),
+    metavar="N",
+    help="Pre-create N spare worktrees for `create --worktree` to reuse.",
+)
+@click.pass_context
+def worktrees(ctx, prune, pool):
+    """List the worktrees of this repository."""
+    from git import Repo
+
+    worktree_dir = ctx.obj["config"].config["DEFAULT"].get("worktree_dir")
+    repo = Repo(".")
+    if prune:
+        for worktree in prune_worktrees(repo):
+            warning(f"Pruned {worktree['path']}: {worktree['prunable']}")
+    if pool:
+        added = fill_pool(repo, pool, worktree_dir)
+        success(f"Added {added} worktree(s) to the pool.")
+
+    table = [
+        [w["path"], w["branch"] or "(detached)", w["head"][:8]]
+        for w in list_worktrees(repo)
+    ]
+    repo.close()
+    if not table:
+        info("No worktrees found.")
+        return
+    click.echo(tabulate(table, headers=["Path", "Branch", "HEAD"], tablefmt="github"))
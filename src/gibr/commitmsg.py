@@ -0,0 +1,99 @@
+"""Git hook prefixing commit messages with the issue of the current branch.
+
+Installed by `gibr hook install` and run as `python -m gibr.commitmsg`
+for every commit, so like gibr.prompt it avoids click, GitPython and the
+trackers: the issue comes from the branch index or `branch_name_format`
+and the title from the index, never from the tracker. gibr.config is
+only imported when the branch is not in the index; otherwise
+`commit_msg_format` is read straight from .gibrconfig.
+"""
+
+import os
+import re
+import sys
+
+from gibr.prompt import branch_issue
+
+DEFAULT_COMMIT_MSG_FORMAT = "{issue}: {message}"
+# prepare-commit-msg sources whose messages are left alone
+SKIPPED_SOURCES = ("merge", "squash")
+
+
+def _config_file(start: str) -> str | None:
+    """Return the .gibrconfig GibrConfig would load from start, or None.
+
+    Like GibrConfig's search, without importing pathlib or the config cache.
+    """
+    override = os.environ.get("GIBR_CONFIG")
+    if override:
+        return os.path.abspath(os.path.expanduser(override))
+    d = os.path.abspath(start)
+    while os.path.dirname(d) != d:
+        path = os.path.join(d, ".gibrconfig")
+        if os.path.exists(path):
+            return path
+        d = os.path.dirname(d)
+    return None
+
+
+def commit_msg_format() -> str:
+    """Return commit_msg_format from the [DEFAULT] section of .gibrconfig."""
+    from configparser import BasicInterpolation, ConfigParser, Error
+
+    path = _config_file(os.getcwd())
+    if not path:
+        return DEFAULT_COMMIT_MSG_FORMAT
+    parser = ConfigParser(interpolation=BasicInterpolation())
+    try:
+        parser.read(path, encoding="utf-8")
+    except Error:
+        # Like a config gibr.config can't load
+        return DEFAULT_COMMIT_MSG_FORMAT
+    value = parser.defaults().get("commit_msg_format", DEFAULT_COMMIT_MSG_FORMAT)
+    return os.path.expandvars(value) if "$" in value else value
+
+
+def format_message(text: str, commit_msg_format: str, issue: str, title: str) -> str:
+    """Return text with its subject line rewritten by commit_msg_format.
+
+    Messages that are empty or already mention the issue are returned
+    unchanged; an empty message must stay empty so git still aborts it.
+    """
+    lines = text.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        if line.strip() and not line.startswith("#"):
+            break
+    else:
+        return text
+    subject = lines[i].rstrip("\n")
+    # Match the issue as a whole word, so 12 doesn't match 120 or 1.12
+    if re.search(rf"(?<![\w.-]){re.escape(issue)}(?!\w|\.\w)", subject, re.I):
+        return text
+    subject = commit_msg_format.format(issue=issue, title=title, message=subject)
+    lines[i] = subject + "\n"
+    return "".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Rewrite the message file given by git; never fail the commit."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or (len(argv) > 1 and argv[1] in SKIPPED_SOURCES):
+        return 0
+    # Config is only loaded here if the branch is not in the index
+    _, issue, title = branch_issue()
+    if not issue:
+        return 0
+    try:
+        with open(argv[0], encoding="utf-8") as f:
+            text = f.read()
+        new_text = format_message(text, commit_msg_format(), issue, title)
+        if new_text != text:
+            with open(argv[0], "w", encoding="utf-8") as f:
+                f.write(new_text)
+    except (OSError, LookupError, ValueError) as e:
+        sys.stderr.write(f"gibr: could not add issue to commit message: {e}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Shell completion of issue IDs from a local snapshot.
+
+`gibr issues` (and a background refresh) writes the open issues to
+`.git/gibr/completion.snap`, one `<id><TAB><title>` line per issue sorted
+by ID. Completing `gibr create <TAB>` memory-maps that file and binary
+searches it for the typed prefix. Like gibr.prompt, the console script
+answers completion requests here before click, the trackers or any
+network client are imported.
+"""
+
+import mmap
+import os
+import sys
+import time
+
+from gibr.paths import state_dir
+
+COMPLETION_FILENAME = "completion.snap"
+REFRESH_MARKER_FILENAME = "completion.refresh"
+# Environment variable click's completion scripts set for the gibr command
+COMPLETE_VAR = "_GIBR_COMPLETE"
+# Seconds before a snapshot is refreshed in the background
+COMPLETION_TTL = 3600
+# Seconds after which a refresh that never finished is retried
+REFRESH_TIMEOUT = 120
+# Most issues offered for one prefix
+MAX_COMPLETIONS = 200
+# create options whose value comes next, so it is not an issue ID
+CREATE_VALUE_OPTIONS = (
+    "--repos",
+    "--worktree",
+    "--sparse",
+    "--suffix",
+    "--from",
+    "--title",
+)
+
+
+def snapshot_line(issue_id, title: str) -> bytes:
+    """Return the snapshot line of an issue."""
+    return f"{issue_id}\t{' '.join(str(title).split())}\n".encode()
+
+
+def write_snapshot(issues, start=None) -> None:
+    """Replace the snapshot of the repository containing start with issues."""
+    from gibr.store import write_bytes
+
+    directory = state_dir(start)
+    if directory is None:
+        return
+    lines = sorted(snapshot_line(issue.id, issue.title) for issue in issues)
+    write_bytes(directory / COMPLETION_FILENAME, b"".join(lines))
+
+
+def _lower_bound(data: mmap.mmap, key: bytes) -> int:
+    """Return the offset of the first line whose ID is not below key."""
+    lo, hi = 0, len(data)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        start = (data.rfind(b"\n", lo, mid) + 1) or lo
+        end = data.find(b"\n", start)
+        end = len(data) if end < 0 else end
+        tab = data.find(b"\t", start, end)
+        if data[start : tab if tab >= 0 else end] < key:
+            lo = end + 1
+        else:
+            hi = start
+    return lo
+
+
+def lookup(prefix: str, start=None, limit=MAX_COMPLETIONS) -> list[tuple[str, str]]:
+    """Return up to limit (id, title) pairs whose ID starts with prefix."""
+    directory = state_dir(start)
+    if directory is None:
+        return []
+    try:
+        with open(directory / COMPLETION_FILENAME, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # ValueError: an empty file cannot be mapped
+        return []
+    found = []
+    key = prefix.encode()
+    with data:
+        pos = _lower_bound(data, key)
+        while pos < len(data) and len(found) < limit:
+            end = data.find(b"\n", pos)
+            end = len(data) if end < 0 else end
+            issue_id, _, title = data[pos:end].partition(b"\t")
+            if not issue_id.startswith(key):
+                break
+            found.append((issue_id.decode(), title.decode()))
+            pos = end + 1
+    return found
+
+
+def refresh_if_stale(start=None) -> None:
+    """Refresh the snapshot in a detached process once it is older than the TTL."""
+    directory = state_dir(start)
+    if directory is None:
+        return
+    try:
+        age = time.time() - (directory / COMPLETION_FILENAME).stat().st_mtime
+    except OSError:
+        age = None
+    if age is not None and age < COMPLETION_TTL:
+        return
+    marker = directory / REFRESH_MARKER_FILENAME
+    try:
+        if time.time() - marker.stat().st_mtime < REFRESH_TIMEOUT:
+            return
+        marker.unlink()
+    except OSError:
+        pass
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        os.close(os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except OSError:
+        # Another completion is starting the refresh
+        return
+    import subprocess
+
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(
+        [sys.executable, "-m", "gibr.completion"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        **kwargs,
+    )
+
+
+def refresh() -> None:
+    """Fetch the open issues and write the snapshot; run in the background.
+
+    The refresh marker is only removed on success, so a failing refresh
+    (e.g. while offline) is retried after REFRESH_TIMEOUT rather than on
+    every completion.
+    """
+    from gibr.config import GibrConfig
+    from gibr.factory import get_tracker
+
+    config = GibrConfig().load().config
+    write_snapshot(get_tracker(config).list_issues())
+    directory = state_dir()
+    if directory is not None:
+        (directory / REFRESH_MARKER_FILENAME).unlink(missing_ok=True)
+
+
+def _split(line: str) -> list[str]:
+    """Split a command line like a shell, keeping an unterminated last word."""
+    import shlex
+
+    lex = shlex.shlex(line, posix=True)
+    lex.whitespace_split = True
+    lex.commenters = ""
+    words = []
+    try:
+        words.extend(lex)
+    except ValueError:
+        words.append(lex.token)
+    return words
+
+
+def completion_args(shell: str, env=os.environ) -> tuple[list[str], str]:
+    """Return the complete arguments and the incomplete word, as click does."""
+    words = _split(env["COMP_WORDS"])
+    if shell == "fish":
+        incomplete = env["COMP_CWORD"]
+        incomplete = _split(incomplete)[0] if incomplete else ""
+        args = words[1:]
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+        return args, incomplete
+    cword = int(env["COMP_CWORD"])
+    return words[1:cword], words[cword] if cword < len(words) else ""
+
+
+def completes_issue(args: list[str], incomplete: str) -> bool:
+    """Return True if the incomplete word is an issue ID of `gibr create`."""
+    if incomplete.startswith("-"):
+        return False
+    words = [word for word in args if word != "git" and not word.startswith("--")]
+    if not words:
+        # `gibr 12<TAB>` runs create too
+        return incomplete[:1].isdigit()
+    if words[0] != "create":
+        return False
+    return args[-1] not in CREATE_VALUE_OPTIONS
+
+
+def format_completion(shell: str, issue_id: str, title: str) -> str:
+    """Return one completion the way click's completion scripts expect it."""
+    if shell == "bash":
+        return f"plain,{issue_id}"
+    if shell == "zsh":
+        if not title:
+            return f"plain\n{issue_id}\n_"
+        escaped = issue_id.replace(":", r"\:")
+        return f"plain\n{escaped}\n{title}"
+    return f"plain,{issue_id}\t{title}" if title else f"plain,{issue_id}"
+
+
+def fast_complete(env=os.environ) -> bool:
+    """Answer a completion request for issue IDs; False to leave it to click."""
+    instruction = env.get(COMPLETE_VAR, "")
+    shell, _, action = instruction.partition("_")
+    if action != "complete" or shell not in ("bash", "zsh", "fish"):
+        return False
+    args, incomplete = completion_args(shell, env)
+    if not completes_issue(args, incomplete):
+        return False
+    lines = [format_completion(shell, i, t) for i, t in lookup(incomplete)]
+    sys.stdout.write("\n".join(lines) + "\n")
+    try:
+        refresh_if_stale()
+    except OSError:
+        pass
+    return True
+
+
+if __name__ == "__main__":  # pragma: no cover - entry point of the refresh
+    try:
+        refresh()
+    except BaseException:
+        # Nobody sees the output of a background refresh
+        sys.exit(1)
@@ -1,20 +1,58 @@
-"""Configuration handling for gibr."""
+"""Configuration handling for gibr.
+
+Finding and parsing .gibrconfig is memoized in a per-user cache: the
+config file found for each working directory and a compiled snapshot of
+each config file. A remembered search costs two stats to check instead
+of one per parent directory, and a snapshot is checked against the
+file's stats, so edits are picked up on the next run.
+"""
 
 import logging
+import os
+import time
 from configparser import BasicInterpolation, ConfigParser
-from os import path
 from pathlib import Path
 
+from gibr.paths import user_cache_dir
 from gibr.registry import get_tracker_class
+from gibr.store import locked_json, read_json
+
+# Path of a config file to use instead of searching for .gibrconfig
+CONFIG_ENV_VAR = "GIBR_CONFIG"
+CONFIG_CACHE_FILENAME = "config.json"
+# Working directories and config files remembered in the cache
+CONFIG_CACHE_SIZE = 256
+# Seconds a remembered search is trusted without walking the parents again
+CONFIG_SEARCH_TTL = 60
+
+
+def expand_env(config: dict) -> dict:
+    """Return config with environment variables expanded in its values.
 
+    Done on every load rather than in the snapshot, so that changed
+    variables take effect and their values are never written to disk.
+    """
+    return {
+        section: {
+            key: os.path.expandvars(value) if "$" in value else value
+            for key, value in values.items()
+        }
+        for section, values in config.items()
+    }
 
-class EnvInterpolation(BasicInterpolation):
-    """Expand environment variables inside .gibrconfig."""
 
-    def before_get(self, parser, section, option, value, defaults):
-        """Overload before_get method."""
-        value = super().before_get(parser, section, option, value, defaults)
-        return path.expandvars(value)
+def _file_id(path: Path) -> list[int]:
+    """Return the stats that change whenever the file at path does."""
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_ino, st.st_size]
+
+
+def _remember(entries: dict, key: str, value) -> None:
+    """Store value under key, dropping the oldest entries beyond the limit."""
+    entries.pop(key, None)
+    entries[key] = value
+    while len(entries) > CONFIG_CACHE_SIZE:
+        del entries[next(iter(entries))]
 
 
 class GibrConfig:
@@ -26,20 +64,64 @@ class GibrConfig:
         """Construct GibrConfig object."""
         self.config_file = None
         self.config = {}
+        self.cache_path = user_cache_dir() / CONFIG_CACHE_FILENAME
+
+    def _update_cache(self, section: str, key: str, value) -> None:
+        """Store value in the per-user config cache, if it is writable."""
+        try:
+            with locked_json(self.cache_path, {}) as cache:
+                _remember(cache.setdefault(section, {}), key, value)
+        except OSError as e:
+            logging.debug(f"Could not update {self.cache_path}: {e}")
+
+    @staticmethod
+    def _cached_search(cwd: Path, entry: dict | None) -> Path | None:
+        """Return the result of an earlier search from cwd if it still holds.
+
+        Only cwd and the file found are checked: a .gibrconfig created in
+        cwd changes its modification time, and a removed one is missing.
+        One created in a directory in between is found once the search is
+        older than CONFIG_SEARCH_TTL and is redone.
+        """
+        if not entry or time.time() - entry.get("time", 0) > CONFIG_SEARCH_TTL:
+            return None
+        try:
+            if os.stat(cwd).st_mtime_ns != entry["mtime"]:
+                return None
+        except OSError:
+            return None
+        path = Path(entry["path"])
+        return path if path.is_file() else None
 
-    def _find_config_file(self):
+    def _find_config_file(self, cache: dict | None = None):
         """Search for config file.
 
-        Search the current directory and all parent directories until config file
-        is found then return the path to the file or None if not found
+        Use $GIBR_CONFIG if set. Otherwise search the current directory and
+        all parent directories until config file is found, reusing an earlier
+        search from the same directory while it is still valid, then return
+        the path to the file or None if not found
         """
+        override = os.environ.get(CONFIG_ENV_VAR)
+        if override:
+            return Path(override).expanduser().absolute()
         d = Path.cwd()
+        if cache is None:
+            cache = read_json(self.cache_path, {})
+        cached = self._cached_search(d, cache.get("dirs", {}).get(str(d)))
+        if cached:
+            logging.debug(f"Using cached config file: {cached}")
+            return cached
+
+        cwd = d
+        # Taken before looking, so a file created meanwhile invalidates
+        searched = {"time": time.time(), "mtime": cwd.stat().st_mtime_ns}
         root = Path(d.root)
         while d != root:
             logging.debug(f"Looking for .gibrconfig in {d}")
             attempt = d / self.CONFIG_FILENAME
             if attempt.exists():
                 logging.debug(f"Found config file: {attempt}")
+                self._update_cache("dirs", str(cwd), {"path": str(attempt), **searched})
                 return attempt
             if d == d.parent:
                 return None
@@ -48,6 +130,9 @@ class GibrConfig:
 
     def _get_tracker_details_str(self):
         """Get tracker details string for __str__."""
+        # The tracker section is checked against every registered tracker
+        import gibr.trackers  # noqa: F401
+
         tracker_type = self.config.get("issue-tracker", {}).get("name")
         if not tracker_type:
             return ""
@@ -72,16 +157,14 @@ class GibrConfig:
         Name               : {self.config.get("issue-tracker", {}).get("name")}
     {self._get_tracker_details_str()}"""
 
-    def load(self):
-        """Load .gibrconfig into a simple dictionary."""
-        config_file = self._find_config_file()
-        if not config_file:
-            raise FileNotFoundError(
-                f"{self.CONFIG_FILENAME} not found in this or any parent directory"
-            )
-        parser = ConfigParser(interpolation=EnvInterpolation())
+    def _compile(self, config_file: Path, file_id: list[int]) -> dict:
+        """Parse config_file into a snapshot and store it in the cache.
+
+        Environment variables are left unexpanded, so nothing derived from
+        their values belongs in the snapshot.
+        """
+        parser = ConfigParser(interpolation=BasicInterpolation())
         parser.read(config_file)
-        self.config_file = config_file
 
         config = {}
         for section in parser.sections():
@@ -90,6 +173,34 @@ class GibrConfig:
         if parser.defaults():
             config["DEFAULT"] = dict(parser.defaults())
 
-        self.config = config
-        logging.debug(str(self))
+        snapshot = {"file": file_id, "config": config}
+        self._update_cache("snapshots", str(config_file), snapshot)
+        return snapshot
+
+    def load(self):
+        """Load .gibrconfig into a simple dictionary.
+
+        The compiled snapshot of the file is used while the file is
+        unchanged.
+        """
+        cache = read_json(self.cache_path, {})
+        config_file = self._find_config_file(cache)
+        if not config_file:
+            raise FileNotFoundError(
+                f"{self.CONFIG_FILENAME} not found in this or any parent directory"
+            )
+        try:
+            # Taken before reading, so an edit meanwhile is seen next time
+            file_id = _file_id(config_file)
+        except OSError:
+            raise FileNotFoundError(f"{config_file} not found") from None
+
+        snapshot = cache.get("snapshots", {}).get(str(config_file))
+        if snapshot and snapshot["file"] == file_id:
+            logging.debug(f"Using compiled config for {config_file}")
+        else:
+            snapshot = self._compile(config_file, file_id)
+        self.config_file = config_file
+        self.config = expand_env(snapshot["config"])
+        logging.debug("%s", self)
         return self
@@ -1,6 +1,7 @@
 """Factory for issue trackers."""
 
 from gibr.registry import get_tracker_class
+from gibr.spans import span
 from gibr.trackers.base import IssueTracker
 
 
@@ -15,7 +16,8 @@ def get_tracker(config) -> IssueTracker:
 
     # Expect each tracker to implement a from_config() constructor.
     if hasattr(tracker_cls, "from_config"):
-        return tracker_cls.from_config(config.get(tracker_type, {}))
+        with span("tracker construction", **{"gibr.tracker": tracker_type}):
+            return tracker_cls.from_config(config.get(tracker_type, {}))
     else:
         raise TypeError(
             f"{tracker_cls.__name__} must implement from_config(config_dict)."
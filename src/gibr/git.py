@@ -1,70 +1,615 @@
 """Git-related operations."""
 
 import logging
+import mmap
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
 
 import click
-from git import GitCommandError, Repo
 
+from gibr.gitbackend import (
+    DEFAULT_GIT_BACKEND,
+    GitBackend,
+    GitBackendError,
+    get_git_backend,
+)
 from gibr.notify import error, info, success, warning
+from gibr.paths import common_dir, find_git_dir
+from gibr.pushqueue import queue_push
+from gibr.remotecache import REMOTE_CACHE_TTL, RemoteRefCache
+from gibr.spans import span
 
+# Upper bound on repositories handled concurrently by create_in_repos
+MAX_PARALLEL_REPOS = 8
+# Default time budget (seconds) for the dirty working tree check
+DIRTY_CHECK_TIMEOUT = 2.0
+# How a free name is chosen when the branch already exists
+SUFFIX_POLICIES = ("prompt", "number", "date", "hash")
 
-def create_and_push_branch(branch_name: str, is_push: str = True) -> None:
-    """Create a new branch and push it to origin."""
+
+class RefIndex:
+    """Answer ref existence and prefix queries without listing every ref.
+
+    Loose refs are found with a stat (or a scan of a single directory
+    for prefixes) and packed refs with a binary search over the
+    memory-mapped, sorted `packed-refs` file, so the cost does not grow
+    with the number of refs. Repositories using the reftable backend
+    fall back to `git for-each-ref`.
+    """
+
+    def __init__(self, git_dir: Path):
+        """Construct RefIndex object for a (common) git directory."""
+        self.git_dir = Path(git_dir)
+        self.reftable = (self.git_dir / "reftable").is_dir()
+        self._packed = None
+
+    @classmethod
+    def for_path(cls, path: str = "."):
+        """Return the RefIndex of the repository containing path."""
+        git_dir = find_git_dir(Path(path))
+        if git_dir is None:
+            raise GitBackendError(f"Not a git repository: {path}")
+        return cls(common_dir(git_dir))
+
+    def branch_exists(self, branch_name: str) -> bool:
+        """Return True if the local branch exists."""
+        return self.exists(f"refs/heads/{branch_name}")
+
+    def exists(self, ref: str) -> bool:
+        """Return True if the fully qualified ref exists."""
+        if self.reftable:
+            return ref in self._for_each_ref(ref)
+        if (self.git_dir / ref).is_file():
+            return True
+        key = ref.encode()
+        packed = self._packed_refs()
+        if packed is None:
+            return False
+        _, _, name = self._record_at(packed, self._lower_bound(packed, key))
+        return name == key
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        """Return all refs starting with prefix (e.g. "refs/heads/123-"), sorted."""
+        if self.reftable:
+            return self._for_each_ref(prefix)
+        refs = set(self._loose_with_prefix(prefix))
+        packed = self._packed_refs()
+        if packed is not None:
+            key = prefix.encode()
+            pos = self._lower_bound(packed, key)
+            while pos < len(packed):
+                _, end, name = self._record_at(packed, pos)
+                if not name.startswith(key):
+                    break
+                refs.add(name.decode())
+                pos = end + 1
+        return sorted(refs)
+
+    def _for_each_ref(self, prefix: str) -> list[str]:
+        """List refs starting with prefix through git itself."""
+        directory = prefix.rsplit("/", 1)[0] + "/" if "/" in prefix else prefix
+        output = subprocess.run(
+            ["git", "--git-dir", str(self.git_dir), "for-each-ref"]
+            + ["--format=%(refname)", directory],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return [ref for ref in output.splitlines() if ref.startswith(prefix)]
+
+    def _loose_with_prefix(self, prefix: str):
+        """Yield loose refs starting with prefix, scanning only matching dirs."""
+        directory, _, _ = prefix.rpartition("/")
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = list(os.scandir(self.git_dir / current))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for entry in entries:
+                ref = f"{current}/{entry.name}"
+                if entry.is_dir():
+                    if ref.startswith(prefix) or prefix.startswith(ref + "/"):
+                        stack.append(ref)
+                elif ref.startswith(prefix) and not entry.name.endswith(".lock"):
+                    yield ref
+
+    def _packed_refs(self):
+        """Return the memory-mapped packed-refs file, or None."""
+        if self._packed is None:
+            try:
+                with open(self.git_dir / "packed-refs", "rb") as f:
+                    self._packed = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (FileNotFoundError, ValueError):  # ValueError: empty file
+                return None
+            header = self._packed[: self._packed.find(b"\n")]
+            if header.startswith(b"#") and b" sorted" not in header:
+                # Very old git versions did not sort packed-refs
+                self._packed = _sort_packed_refs(self._packed)
+        return self._packed
+
+    @staticmethod
+    def _record_at(buf, pos: int) -> tuple[int, int, bytes]:
+        """Return (start, end, refname) of the record containing offset pos.
+
+        A record is a "<sha> <refname>" line, optionally followed by a
+        "^<sha>" line holding the peeled value of an annotated tag.
+        """
+        if pos >= len(buf):
+            return len(buf), len(buf), b""
+        start = buf.rfind(b"\n", 0, pos) + 1
+        end = buf.find(b"\n", start)
+        end = len(buf) if end == -1 else end
+        if buf[start : start + 1] == b"^":
+            start = buf.rfind(b"\n", 0, start - 1) + 1
+            line_end = buf.find(b"\n", start)
+        else:
+            line_end = end
+            if buf[end + 1 : end + 2] == b"^":
+                end = buf.find(b"\n", end + 1)
+                end = len(buf) if end == -1 else end
+        if buf[start : start + 1] == b"#":
+            # The header sorts before every ref
+            return start, end, b""
+        return start, end, buf[buf.find(b" ", start, line_end) + 1 : line_end]
+
+    def _lower_bound(self, buf, key: bytes) -> int:
+        """Return the offset of the first record whose refname is >= key."""
+        lo, hi = 0, len(buf)
+        while lo < hi:
+            start, end, name = self._record_at(buf, (lo + hi) // 2)
+            if name < key:
+                lo = end + 1
+            else:
+                hi = start
+        return lo
+
+
+def _sort_packed_refs(buf) -> bytes:
+    """Return packed-refs content with its records sorted by refname."""
+    records, current = [], None
+    for line in bytes(buf).splitlines(keepends=True):
+        if line.startswith(b"#"):
+            continue
+        if line.startswith(b"^") and current is not None:
+            current[1] += line
+            continue
+        current = [line.split(b" ", 1)[1].rstrip(b"\n"), line]
+        records.append(current)
+    return b"".join(line for _, line in sorted(records))
+
+
+def taken_branch_names(refs: RefIndex, remote_refs: RemoteRefCache, prefix: str):
+    """Return local and remote branch names starting with prefix."""
+    local = refs.with_prefix(f"refs/heads/{prefix}")
+    return {ref.removeprefix("refs/heads/") for ref in local} | set(
+        remote_refs.with_prefix(prefix)
+    )
+
+
+def branch_name_taken(
+    refs: RefIndex, remote_refs: RemoteRefCache, branch_name: str
+) -> bool:
+    """Return True if branch_name exists locally or on the remote."""
+    return refs.branch_exists(branch_name) or remote_refs.exists(branch_name)
+
+
+def free_branch_name(
+    refs: RefIndex,
+    remote_refs: RemoteRefCache,
+    branch_name: str,
+    policy: str,
+    head_sha: str = "",
+) -> str:
+    """Return the first name derived from branch_name not used locally or on origin.
+
+    policy "number" appends -2, -3, ...; "date" appends today's date and
+    "hash" the short commit the branch starts from, falling back to
+    numbering if that name is taken too.
+    """
+    taken = taken_branch_names(refs, remote_refs, branch_name)
+    if policy == "date":
+        branch_name = f"{branch_name}-{date.today():%Y%m%d}"
+    elif policy == "hash" and head_sha:
+        branch_name = f"{branch_name}-{head_sha[:7]}"
+    if branch_name not in taken:
+        return branch_name
+    n = 2
+    while f"{branch_name}-{n}" in taken:
+        n += 1
+    return f"{branch_name}-{n}"
+
+
+def warn_if_dirty(backend: GitBackend, timeout: float = DIRTY_CHECK_TIMEOUT) -> None:
+    """Warn about uncommitted changes to tracked files.
+
+    Uses a single `git status`, which benefits from core.fsmonitor and
+    the untracked cache. The check is skipped when timeout is 0 and
+    abandoned once it exceeds timeout seconds.
+    """
+    if timeout and backend.is_dirty(timeout):
+        warning("Working tree is dirty — uncommitted changes present.")
+
+
+def start_commit(repo, start_point: str | None = None) -> str:
+    """Return the commit start_point (default HEAD) resolves to in a GitPython repo."""
+    if start_point:
+        return repo.git.rev_parse("--verify", f"{start_point}^{{commit}}")
+    return repo.head.commit.hexsha
+
+
+def switch_to_new_branch(
+    backend: GitBackend,
+    branch_name: str,
+    current: str,
+    head: str,
+    start_point: str | None = None,
+) -> None:
+    """Create branch_name at start_point (default HEAD) and make it current.
+
+    When the new branch points at the commit already checked out (head),
+    neither the index nor the working tree change: writing the ref and
+    pointing HEAD at it is all a checkout would do, without scanning either.
+    """
+    if start_point and backend.rev_parse(start_point) != head:
+        # One git command both creates the ref and checks it out
+        with span("checkout", **{"gibr.creates_ref": True}):
+            backend.run("checkout", "--no-track", "-b", branch_name, start_point)
+        return
+    ref = f"refs/heads/{branch_name}"
+    # The empty old value makes update-ref refuse to overwrite a branch
+    with span("ref creation"):
+        backend.run(
+            "update-ref", "-m", f"branch: Created from {current}", ref, head, ""
+        )
+    with span("checkout"):
+        backend.run(
+            "symbolic-ref",
+            "-m",
+            f"checkout: moving from {current} to {branch_name}",
+            "HEAD",
+            ref,
+        )
+
+
+def _pick_branch_name(  # noqa: PLR0913, PLR0917
+    refs: RefIndex,
+    remote_refs: RemoteRefCache,
+    branch_name: str,
+    current_branch: str,
+    suffix_policy: str,
+    start: str,
+) -> str | None:
+    """Return the name to create, or None if there is nothing to do.
+
+    If branch_name exists locally or on origin, a free name is picked
+    according to suffix_policy; "prompt" asks the user, or falls back to
+    "number" when stdin is not a terminal.
+    """
+    if not branch_name_taken(refs, remote_refs, branch_name):
+        return branch_name
+    if current_branch == branch_name:
+        warning(f"Branch '{branch_name}' already exists and is checked out")
+        return None
+    where = "locally" if refs.branch_exists(branch_name) else "on origin"
+    warning(f"Branch '{branch_name}' already exists {where}.")
+    if suffix_policy == "prompt" and sys.stdin.isatty():
+        # Ask user what to do
+        if not click.confirm(
+            "Would you like to create a new branch with a suffix?", default=True
+        ):
+            info("Operation canceled by user.")
+            return None
+        suffix = click.prompt("Enter suffix", default="take2", show_default=True)
+        branch_name = f"{branch_name}-{suffix}"
+        if branch_name_taken(refs, remote_refs, branch_name):
+            error(f"Branch '{branch_name}' already exists too.")
+    else:
+        policy = "number" if suffix_policy == "prompt" else suffix_policy
+        branch_name = free_branch_name(refs, remote_refs, branch_name, policy, start)
+    info(f"Creating new branch '{branch_name}' instead.")
+    return branch_name
+
+
+def create_and_push_branch(  # noqa: PLR0913, PLR0917
+    branch_name: str,
+    is_push: str = True,
+    push_async: bool = False,
+    dirty_check_timeout: float = DIRTY_CHECK_TIMEOUT,
+    suffix_policy: str = "prompt",
+    remote_cache_ttl: float = REMOTE_CACHE_TTL,
+    start_point: str | None = None,
+    git_backend: str = DEFAULT_GIT_BACKEND,
+) -> str | None:
+    """Create a new branch at start_point (default HEAD) and push it to origin.
+
+    With push_async the push is queued and run by a background worker.
+    Existing branch names are handled according to suffix_policy, with
+    branches on origin looked up in a cache refreshed at most every
+    remote_cache_ttl seconds. git_backend names the GitBackend used to
+    run git. Returns the name of the branch created, if any.
+    """
+    backend = get_git_backend(git_backend)(".")
     try:
-        repo = Repo(".")
-        if repo.is_dirty(untracked_files=False):
-            warning("Working tree is dirty — uncommitted changes present.")
+        warn_if_dirty(backend, dirty_check_timeout)
 
         # Handle repo with no commits yet (no HEAD)
-        if not repo.head.is_valid():
+        head, current_branch = backend.head()
+        if head is None:
             error("Please make an initial commit before using gibr.")
-            return
+            return None
 
         # Handle detached HEAD (e.g. checkout of specific commit)
-        if repo.head.is_detached:
+        if current_branch is None:
             warning("HEAD is detached (not on a branch).")
-
-        # Determine current branch
-        current_branch = repo.active_branch.name
+            current_branch = head[:7]
         logging.debug(f"Current branch: {current_branch}")
 
-        # Check if branch already exists locally
-        if branch_name in repo.heads:
-            if current_branch == branch_name:
-                warning(f"Branch '{branch_name}' already exists and is checked out")
-                repo.close()
-                return
-            else:
-                warning(f"Branch '{branch_name}' already exists locally.")
-                # Ask user what to do
-                if click.confirm(
-                    "Would you like to create a new branch with a suffix?", default=True
-                ):
-                    suffix = click.prompt(
-                        "Enter suffix", default="take2", show_default=True
-                    )
-                    branch_name = f"{branch_name}-{suffix}"
-                    info(f"Creating new branch '{branch_name}' instead.")
-                else:
-                    info("Operation canceled by user.")
-                    repo.close()
-                    return
-        # Create new branch from current HEAD
-        new_branch = repo.create_head(branch_name)
-        success(f"Created branch '{branch_name}' from {current_branch}.")
-
-        # Checkout new branch
-        new_branch.checkout()
+        # Check if branch already exists locally or on origin
+        refs = RefIndex(backend.common_dir)
+        remote_refs = RemoteRefCache(refs, ttl=remote_cache_ttl)
+        start = backend.rev_parse(start_point) if start_point else head
+        with span("ref lookup"):
+            branch_name = _pick_branch_name(
+                refs, remote_refs, branch_name, current_branch, suffix_policy, start
+            )
+        if branch_name is None:
+            return None
+
+        # Create new branch from start point or current HEAD and check it out
+        switch_to_new_branch(backend, branch_name, current_branch, head, start_point)
+        success(f"Created branch '{branch_name}' from {start_point or current_branch}.")
         success(f"Checked out branch: {branch_name}")
 
-        if is_push:
-            origin = repo.remote(name="origin")
-            push_result = origin.push(
-                refspec=f"{branch_name}:{branch_name}", set_upstream=True
-            )
-            push_result.raise_if_error()
+        if is_push and push_async:
+            with span("push", **{"gibr.async": True}):
+                queue_push(backend.common_dir, "origin", [branch_name])
+            info(f"Pushing '{branch_name}' to origin in the background.")
+        elif is_push:
+            with span("push"):
+                backend.push("origin", branch_name)
+            remote_refs.add(branch_name)
             success(f"Pushed branch '{branch_name}' to origin.")
-        repo.close()
+        return branch_name
+
+    except GitBackendError as e:
+        error(f"Git command failed: {e}")
+    finally:
+        backend.close()
+
+
+def create_branches(  # noqa: PLR0913, PLR0917
+    branch_names: list[str],
+    is_push: bool = True,
+    push_async: bool = False,
+    suffix_policy: str = "prompt",
+    remote_cache_ttl: float = REMOTE_CACHE_TTL,
+    start_point: str | None = None,
+    git_backend: str = DEFAULT_GIT_BACKEND,
+) -> dict[str, str]:
+    """Create several branches and push them to origin together.
+
+    The branches start at start_point (default HEAD) and the current
+    checkout is left untouched; all new branches go out in a single push.
+    Names already taken locally or on origin get a free name according to
+    suffix_policy, with "prompt" behaving like "number". Returns the name
+    each created branch was requested as, mapped to the name it got.
+    """
+    backend = get_git_backend(git_backend)(".")
+    try:
+        head, _ = backend.head()
+        if head is None:
+            error("Please make an initial commit before using gibr.")
+            return {}
+
+        refs = RefIndex(backend.common_dir)
+        remote_refs = RemoteRefCache(refs, ttl=remote_cache_ttl)
+        start = backend.rev_parse(start_point) if start_point else head
+        created = {}
+        for requested in dict.fromkeys(branch_names):
+            branch_name = requested
+            if branch_name_taken(refs, remote_refs, branch_name):
+                # There is no prompting per branch, so "prompt" numbers them
+                policy = "number" if suffix_policy == "prompt" else suffix_policy
+                branch_name = free_branch_name(
+                    refs, remote_refs, branch_name, policy, start
+                )
+                info(f"Branch already exists, using '{branch_name}' instead.")
+            with span("ref creation"):
+                backend.run("branch", "--no-track", branch_name, start)
+            success(f"Created branch '{branch_name}'.")
+            created[requested] = branch_name
 
-    except GitCommandError as e:
+        if is_push and push_async and created:
+            with span("push", **{"gibr.async": True}):
+                queue_push(backend.common_dir, "origin", list(created.values()))
+            info(f"Pushing {len(created)} branch(es) to origin in the background.")
+        elif is_push and created:
+            with span("push"):
+                backend.push("origin", *created.values())
+            for name in created.values():
+                remote_refs.add(name)
+            success(f"Pushed {len(created)} branch(es) to origin.")
+        return created
+
+    except GitBackendError as e:
+        error(f"Git command failed: {e}")
+    finally:
+        backend.close()
+
+
+def switch_branch(branch_name: str, git_backend: str = DEFAULT_GIT_BACKEND) -> None:
+    """Check out an existing branch."""
+    backend = get_git_backend(git_backend)(".")
+    try:
+        backend.run("checkout", branch_name)
+    except GitBackendError as e:
         error(f"Git command failed: {e}")
+    finally:
+        backend.close()
+
+
+def _git_in(git_dir: Path, *args: str, stdin: str | None = None):
+    """Run git against git_dir, returning the completed process."""
+    return subprocess.run(
+        ["git", "--git-dir", str(git_dir), *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL if stdin is None else None,
+    )
+
+
+def checked_out_branches(git_dir: Path) -> set[str]:
+    """Return the branches checked out in any worktree of the repository."""
+    proc = _git_in(git_dir, "worktree", "list", "--porcelain")
+    return {
+        line.removeprefix("branch refs/heads/")
+        for line in proc.stdout.splitlines()
+        if line.startswith("branch refs/heads/")
+    }
+
+
+def delete_branches(git_dir: Path, branches: list[str]) -> None:
+    """Delete local branches in a single `git update-ref --stdin` transaction.
+
+    Either all refs are deleted or, raising GitBackendError, none is.
+    The `branch.<name>.*` config of deleted branches is removed too.
+    """
+    commands = "".join(f"delete refs/heads/{branch}\n" for branch in branches)
+    proc = _git_in(git_dir, "update-ref", "--stdin", stdin=commands)
+    if proc.returncode != 0:
+        raise GitBackendError(proc.stderr.strip())
+    deleted = set(branches)
+    names = _git_in(git_dir, "config", "--name-only", "--get-regexp", r"^branch\.")
+    sections = {name.rsplit(".", 1)[0] for name in names.stdout.splitlines()}
+    for section in sections:
+        if section.removeprefix("branch.") in deleted:
+            _git_in(git_dir, "config", "--remove-section", section)
+
+
+def fetch_base(
+    base: str,
+    fetch_filter: str | None = None,
+    remote_cache_ttl: float = REMOTE_CACHE_TTL,
+    fetch: bool = True,
+    git_backend: str = DEFAULT_GIT_BACKEND,
+) -> str:
+    """Fetch the branch base refers to and return the revision to branch from.
+
+    base is "<remote>/<branch>", or a bare remote name for its default
+    branch. Only that one branch is fetched, without tags and optionally
+    with a partial clone filter such as "blob:none". Any other base (a
+    local branch, tag or commit) is returned unchanged. Without fetch
+    (offline) the remote-tracking branch is used as last fetched.
+    """
+    backend = get_git_backend(git_backend)(".")
+    try:
+        remote, _, branch = base.partition("/")
+        if remote not in backend.run("remote").splitlines():
+            return base
+        if not branch:
+            remote_refs = RemoteRefCache(
+                RefIndex(backend.common_dir), remote, ttl=remote_cache_ttl
+            )
+            branch = remote_refs.default_branch()
+            if not branch:
+                error(
+                    f"Could not determine the default branch of {remote}, "
+                    f"use --from {remote}/<branch>."
+                )
+        if not fetch:
+            return f"{remote}/{branch}"
+        args = ["--no-tags", "--no-recurse-submodules"]
+        if fetch_filter:
+            args.append(f"--filter={fetch_filter}")
+        info(f"Fetching {remote}/{branch}.")
+        backend.run(
+            "fetch",
+            *args,
+            remote,
+            f"+refs/heads/{branch}:refs/remotes/{remote}/{branch}",
+        )
+        return f"{remote}/{branch}"
+    except GitBackendError as e:
+        error(f"Git command failed: {e}")
+    finally:
+        backend.close()
+
+
+def find_submodules(path: str, git_backend: str = DEFAULT_GIT_BACKEND) -> list[str]:
+    """Return the paths of all initialized submodules of path, recursively."""
+    backend = get_git_backend(git_backend)(path)
+    try:
+        output = backend.run("submodule", "foreach", "--recursive", "--quiet", "pwd")
+    finally:
+        backend.close()
+    return output.splitlines()
+
+
+def _create_branch_in_repo(
+    path: str, branch_name: str, is_push: bool, push_async: bool, git_backend: str
+) -> str:
+    """Create, check out and push branch_name in one repo; return a status."""
+    backend = get_git_backend(git_backend)(path)
+    try:
+        head, _ = backend.head()
+        if head is None:
+            raise ValueError("no commits yet")
+        if RefIndex(backend.common_dir).branch_exists(branch_name):
+            backend.run("checkout", branch_name)
+            status = "checked out existing branch"
+        else:
+            backend.run("checkout", "-b", branch_name)
+            status = "created and checked out"
+
+        if is_push and push_async:
+            queue_push(backend.common_dir, "origin", [branch_name])
+            status += ", push queued"
+        elif is_push:
+            backend.push("origin", branch_name)
+            status += ", pushed"
+        return status
+    finally:
+        backend.close()
+
+
+def create_in_repos(
+    branch_name: str,
+    paths: list[str],
+    is_push: bool = True,
+    push_async: bool = False,
+    git_backend: str = DEFAULT_GIT_BACKEND,
+) -> list[tuple[str, bool, str]]:
+    """Create branch_name in every repository at paths concurrently.
+
+    Unlike create_and_push_branch this never prompts: an existing branch
+    is simply checked out. Returns (path, ok, message) for each path,
+    in the order given.
+    """
+    workers = max(1, min(MAX_PARALLEL_REPOS, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _create_branch_in_repo,
+                path,
+                branch_name,
+                is_push,
+                push_async,
+                git_backend,
+            )
+            for path in paths
+        ]
+    results = []
+    for path, future in zip(paths, futures, strict=True):
+        try:
+            results.append((path, True, future.result()))
+        except (GitBackendError, ValueError) as e:
+            logging.debug(f"Failed to create branch in {path}: {e}")
+            results.append((path, False, str(e).strip().splitlines()[0]))
+    return results
@@ -0,0 +1,198 @@
+"""Backends running the git commands behind `gibr create` and `gibr switch`.
+
+The plumbing backend runs a handful of `git` commands directly and is
+cheap to start; the GitPython backend goes through `git.Repo`, which
+costs an extra import and repository setup.
+"""
+
+import logging
+import subprocess
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from gibr.pushqueue import push_branches
+
+DEFAULT_GIT_BACKEND = "plumbing"
+
+
+class GitBackendError(Exception):
+    """A git command failed."""
+
+
+class GitBackend(ABC):
+    """Run git commands in one repository."""
+
+    def __init__(self, path: str = "."):
+        """Construct GitBackend object for the repository at path."""
+        self.path = path
+
+    @abstractmethod
+    def run(self, *args: str, timeout: float | None = None) -> str:
+        """Run `git <args>` and return its stripped output.
+
+        Raises GitBackendError if git fails or runs longer than timeout.
+        """
+
+    @abstractmethod
+    def head(self) -> tuple[str | None, str | None]:
+        """Return the commit and branch name of HEAD.
+
+        The commit is None in a repository without commits and the
+        branch is None when HEAD is detached.
+        """
+
+    @property
+    @abstractmethod
+    def common_dir(self) -> Path:
+        """Git directory shared by all worktrees."""
+
+    @abstractmethod
+    def push(self, remote: str, *branch_names: str) -> None:
+        """Push branch_names to remote in one push and set them as upstream."""
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+    def is_dirty(self, timeout: float) -> bool | None:
+        """Return True if tracked files have changes, None if unknown."""
+        try:
+            status = self.run(
+                "status", "--porcelain", "--untracked-files=no", timeout=timeout
+            )
+        except GitBackendError as e:
+            logging.debug(f"Skipping dirty check: {e}")
+            return None
+        return bool(status)
+
+    def rev_parse(self, rev: str) -> str:
+        """Return the commit rev resolves to."""
+        return self.run("rev-parse", "--verify", f"{rev}^{{commit}}")
+
+
+class PlumbingBackend(GitBackend):
+    """Run git as a subprocess for every command."""
+
+    def __init__(self, path: str = "."):
+        """Construct PlumbingBackend object for the repository at path."""
+        super().__init__(path)
+        self._common_dir = None
+
+    def _run(self, args, timeout=None):
+        """Run git, returning the completed process."""
+        try:
+            return subprocess.run(
+                ["git", *args],
+                cwd=self.path,
+                capture_output=True,
+                text=True,
+                stdin=subprocess.DEVNULL,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired as e:
+            raise GitBackendError(f"git {args[0]} timed out after {timeout}s") from e
+        except OSError as e:
+            # e.g. path doesn't exist
+            raise GitBackendError(str(e)) from e
+
+    def run(self, *args: str, timeout: float | None = None) -> str:
+        """Run `git <args>` and return its stripped output."""
+        proc = self._run(args, timeout)
+        if proc.returncode != 0:
+            raise GitBackendError(
+                proc.stderr.strip() or f"git {args[0]} exited with {proc.returncode}"
+            )
+        return proc.stdout.strip()
+
+    def head(self) -> tuple[str | None, str | None]:
+        """Return the commit and branch name of HEAD with one rev-parse."""
+        proc = self._run(
+            ["rev-parse", "--git-common-dir", "HEAD", "--symbolic-full-name", "HEAD"]
+        )
+        lines = proc.stdout.splitlines()
+        if not lines:
+            raise GitBackendError(proc.stderr.strip())
+        self._common_dir = (Path(self.path) / lines[0]).resolve()
+        if proc.returncode != 0:
+            # Git could still locate the repository, so HEAD is unborn
+            return None, None
+        commit, ref = lines[1], lines[2]
+        branch = ref.removeprefix("refs/heads/") if ref != "HEAD" else None
+        return commit, branch
+
+    @property
+    def common_dir(self) -> Path:
+        """Git directory shared by all worktrees."""
+        if self._common_dir is None:
+            self._common_dir = (
+                Path(self.path) / self.run("rev-parse", "--git-common-dir")
+            ).resolve()
+        return self._common_dir
+
+    def push(self, remote: str, *branch_names: str) -> None:
+        """Push branch_names with `git push --porcelain`."""
+        outcome = push_branches(self.path, remote, list(branch_names))
+        for ok, message in outcome.values():
+            if not ok:
+                raise GitBackendError(message)
+
+
+class GitPythonBackend(GitBackend):
+    """Run git commands through a GitPython `Repo`."""
+
+    def __init__(self, path: str = "."):
+        """Construct GitPythonBackend object for the repository at path."""
+        from git import GitCommandError, GitError, Repo
+
+        super().__init__(path)
+        self.GitCommandError = GitCommandError
+        try:
+            self.repo = Repo(path)
+        except GitError as e:
+            raise GitBackendError(f"not a git repository: {path}") from e
+
+    def run(self, *args: str, timeout: float | None = None) -> str:
+        """Run `git <args>` and return its stripped output."""
+        command, *rest = args
+        try:
+            return getattr(self.repo.git, command.replace("-", "_"))(
+                *rest, kill_after_timeout=timeout
+            )
+        except self.GitCommandError as e:
+            raise GitBackendError(str(e)) from e
+
+    def head(self) -> tuple[str | None, str | None]:
+        """Return the commit and branch name of HEAD."""
+        if not self.repo.head.is_valid():
+            return None, None
+        branch = None if self.repo.head.is_detached else self.repo.active_branch.name
+        return self.repo.head.commit.hexsha, branch
+
+    @property
+    def common_dir(self) -> Path:
+        """Git directory shared by all worktrees."""
+        return Path(self.repo.common_dir)
+
+    def push(self, remote: str, *branch_names: str) -> None:
+        """Push branch_names through GitPython."""
+        try:
+            self.repo.remote(name=remote).push(
+                refspec=[f"{name}:{name}" for name in branch_names],
+                set_upstream=True,
+            ).raise_if_error()
+        except self.GitCommandError as e:
+            raise GitBackendError(str(e)) from e
+
+    def close(self) -> None:
+        """Stop GitPython's helper processes."""
+        self.repo.close()
+
+
+GIT_BACKENDS = {"plumbing": PlumbingBackend, "gitpython": GitPythonBackend}
+
+
+def get_git_backend(name: str) -> type[GitBackend]:
+    """Return the backend class by name (e.g. 'plumbing')."""
+    backend_cls = GIT_BACKENDS.get(name)
+    if not backend_cls:
+        raise ValueError(f"Unsupported git backend: {name}")
+    return backend_cls
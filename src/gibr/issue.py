@@ -1,8 +1,9 @@
 """Data class for issue representation."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
-from slugify import slugify
+from gibr.slug import slugify
 
 
 @dataclass
@@ -13,8 +14,11 @@ class Issue:
     title: str
     assignee: str
     type: str = "issue"
+    # Workflow state as the tracker names it, and whether it counts as done
+    state: str | None = None
+    closed: bool = False
 
-    @property
+    @cached_property
     def sanitized_title(self) -> str:
-        """Sanitized title."""
+        """Sanitized title, computed once per issue."""
         return slugify(self.title)
@@ -0,0 +1,96 @@
+"""Cache of issues fetched from the tracker under .git/gibr/.
+
+Issues are keyed by tracker and issue ID and trusted for a TTL, so
+commands that look up many issues at once only ask the tracker for the
+ones not fetched recently. In offline mode cached issues are used
+whatever their age; the ones used that way are marked and fetched again
+on the next online run.
+"""
+
+import logging
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from gibr.branchindex import issue_key
+from gibr.issue import Issue
+from gibr.paths import state_dir
+from gibr.store import locked_json, read_json
+
+ISSUE_CACHE_FILENAME = "issues.json"
+# Seconds a cached issue is trusted
+ISSUE_CACHE_TTL = 300
+
+
+class IssueCache:
+    """Issues of one tracker fetched for one repository."""
+
+    def __init__(self, directory: Path, tracker_name: str, ttl=ISSUE_CACHE_TTL):
+        """Construct IssueCache object for a gibr state directory."""
+        self.path = Path(directory) / ISSUE_CACHE_FILENAME
+        self.tracker_name = tracker_name
+        self.ttl = ttl
+
+    @classmethod
+    def for_repo(cls, tracker_name: str, ttl=ISSUE_CACHE_TTL, start=None):
+        """Return the cache of the repository containing start, or None."""
+        directory = state_dir(start)
+        return cls(directory, tracker_name, ttl) if directory else None
+
+    def get(self, issue_ids: list[str]) -> dict[str, Issue]:
+        """Return the cached issues fetched within the TTL, keyed by id."""
+        data = read_json(self.path, {})
+        now = time.time()
+        found = {}
+        for issue_id in issue_ids:
+            entry = data.get(issue_key(self.tracker_name, issue_id))
+            if entry and now - entry["fetched_at"] <= self.ttl:
+                found[issue_id] = Issue(**entry["issue"])
+        return found
+
+    def put(self, issues: dict[str, Issue], offline: bool = False) -> None:
+        """Store issues keyed by the id they were requested with.
+
+        Issues used offline are marked for reconcile and never fresh.
+        """
+        now = 0 if offline else time.time()
+        with locked_json(self.path, {}) as data:
+            for issue_id, issue in issues.items():
+                entry = {"fetched_at": now, "issue": asdict(issue)}
+                if offline:
+                    entry["offline"] = True
+                data[issue_key(self.tracker_name, issue_id)] = entry
+
+    def reconcile(self, tracker) -> list[tuple[Issue, Issue | None]]:
+        """Fetch the issues used offline again and store them.
+
+        Returns (issue as used offline, issue now or None if it does not
+        exist) pairs.
+        """
+        prefix = f"{self.tracker_name}:"
+        used = {
+            key: Issue(**entry["issue"])
+            for key, entry in read_json(self.path, {}).items()
+            if key.startswith(prefix) and entry.get("offline")
+        }
+        if not used:
+            return []
+        fetched = tracker.find_issues([str(issue.id) for issue in used.values()])
+        with locked_json(self.path, {}) as data:
+            for key in used:
+                data.pop(key, None)
+        self.put(fetched)
+        return [(issue, fetched.get(str(issue.id))) for issue in used.values()]
+
+    def find_issues(self, tracker, issue_ids: list[str]) -> dict[str, Issue]:
+        """Return the existing issues, asking the tracker only for stale ones."""
+        found = self.get(issue_ids) if self.ttl else {}
+        stale = [
+            issue_id for issue_id in dict.fromkeys(issue_ids) if issue_id not in found
+        ]
+        logging.debug(f"{len(found)} issue(s) cached, fetching {len(stale)}")
+        if stale:
+            fetched = tracker.find_issues(stale)
+            self.put(fetched)
+            found.update(fetched)
+        return found
@@ -0,0 +1,100 @@
+"""Detect when the issue tracker can't be reached, for offline mode.
+
+Trackers talk to their APIs through different client libraries, so
+connectivity is judged from the outside: a call fails over to offline
+mode when it raises a connection error anywhere in its exception chain,
+or when it has not connected to anything within a deadline (a VPN that
+drops packets can otherwise hang for minutes). A tracker that connects
+but is slow to answer is waited for.
+"""
+
+import contextvars
+import socket
+import threading
+from contextlib import contextmanager
+
+import requests
+import urllib3.util.connection
+
+# Seconds to wait for a connection to the tracker before working offline
+OFFLINE_TIMEOUT = 5
+CONNECTION_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    ConnectionError,
+    TimeoutError,
+    socket.gaierror,
+)
+
+
+class OfflineError(Exception):
+    """The issue tracker could not be reached."""
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """Return True if exc, or an exception it was raised from, is a network error."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, CONNECTION_ERRORS):
+            return True
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+@contextmanager
+def _watch_connections(connected: threading.Event):
+    """Set connected once any HTTP connection is opened, while in the block.
+
+    All tracker clients go through requests and so urllib3, which opens
+    its connections with urllib3.util.connection.create_connection.
+    """
+    create_connection = urllib3.util.connection.create_connection
+
+    def watched(*args, **kwargs):
+        sock = create_connection(*args, **kwargs)
+        connected.set()
+        return sock
+
+    urllib3.util.connection.create_connection = watched
+    try:
+        yield
+    finally:
+        urllib3.util.connection.create_connection = create_connection
+
+
+def call_with_deadline(func, timeout: float = OFFLINE_TIMEOUT):
+    """Return func(), raising OfflineError if it can't connect in time.
+
+    The deadline only covers reaching the tracker: once func has opened a
+    connection it is waited for however long it takes. A timeout of 0
+    waits as long as func takes. Other exceptions are raised as they are.
+    """
+    outcome = {}
+
+    def run():
+        try:
+            outcome["value"] = func()
+        except BaseException as e:  # re-raised in the calling thread
+            outcome["error"] = e
+
+    if timeout:
+        connected = threading.Event()
+        # In the caller's context, so spans started by func nest correctly
+        context = contextvars.copy_context()
+        worker = threading.Thread(target=context.run, args=(run,), daemon=True)
+        with _watch_connections(connected):
+            worker.start()
+            worker.join(timeout)
+        if worker.is_alive():
+            if not connected.is_set():
+                raise OfflineError(f"no connection within {timeout:g}s")
+            worker.join()
+    else:
+        run()
+    if "error" in outcome:
+        e = outcome["error"]
+        if is_connection_error(e):
+            raise OfflineError(str(e)) from e
+        raise e
+    return outcome["value"]
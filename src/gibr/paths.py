@@ -0,0 +1,51 @@
+"""Locate git and gibr state directories without importing GitPython."""
+
+import os
+from pathlib import Path
+
+STATE_DIRNAME = "gibr"
+
+
+def find_git_dir(start: Path | None = None) -> Path | None:
+    """Return the git directory for start (default: cwd), or None.
+
+    Honours $GIT_DIR and follows `.git` files as used by worktrees and
+    submodules.
+    """
+    if os.environ.get("GIT_DIR"):
+        return Path(os.environ["GIT_DIR"]).resolve()
+    d = Path(start or Path.cwd()).resolve()
+    for candidate in (d, *d.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                return (candidate / content[len("gitdir:") :].strip()).resolve()
+    return None
+
+
+def common_dir(git_dir: Path) -> Path:
+    """Return the directory shared by all worktrees of git_dir."""
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        return (git_dir / commondir_file.read_text().strip()).resolve()
+    return git_dir
+
+
+def state_dir(start: Path | None = None) -> Path | None:
+    """Return the directory holding gibr's per-repository state, or None."""
+    git_dir = find_git_dir(start)
+    if git_dir is None:
+        return None
+    return common_dir(git_dir) / STATE_DIRNAME
+
+
+def user_cache_dir() -> Path:
+    """Return the directory holding gibr's per-user caches.
+
+    Honours $XDG_CACHE_HOME and defaults to ~/.cache/gibr.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / STATE_DIRNAME
@@ -0,0 +1,169 @@
+"""Fast path behind `gibr status --prompt`, meant to run on every prompt.
+
+The console script dispatches here before click or any gibr command is
+imported (shell completion goes on to gibr.completion), so this module
+only uses the standard library: the branch is read from HEAD and the
+issue and title from the branch index. Config is only parsed when the
+branch was not created by gibr and its issue has to be recovered from
+`branch_name_format`.
+"""
+
+import json
+import os
+import sys
+
+# Longest title shown in the prompt before it is cut with an ellipsis
+PROMPT_TITLE_WIDTH = 40
+# What each placeholder of branch_name_format may match in a branch name
+PLACEHOLDER_PATTERNS = {
+    "issue": r"(?P<issue>[A-Za-z][A-Za-z0-9_]*-\d+|\d+)",
+    "issuetype": r".+?",
+    "title": r".+?",
+    "assignee": r".+?",
+}
+
+
+def _git_dirs(start: str) -> tuple[str, str] | None:
+    """Return the git directory and common directory for start, or None.
+
+    Like gibr.paths, without importing pathlib.
+    """
+    git_dir = os.environ.get("GIT_DIR")
+    d = os.path.abspath(start)
+    while not git_dir:
+        dot_git = os.path.join(d, ".git")
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+        elif os.path.isfile(dot_git):
+            with open(dot_git, encoding="utf-8") as f:
+                content = f.read().strip()
+            if content.startswith("gitdir:"):
+                git_dir = os.path.join(d, content[len("gitdir:") :].strip())
+        parent = os.path.dirname(d)
+        if parent == d and not git_dir:
+            return None
+        d = parent
+    try:
+        with open(os.path.join(git_dir, "commondir"), encoding="utf-8") as f:
+            common_dir = os.path.join(git_dir, f.read().strip())
+    except OSError:
+        common_dir = git_dir
+    return git_dir, common_dir
+
+
+def current_branch(git_dir: str) -> str | None:
+    """Return the branch HEAD points to, or None if detached."""
+    try:
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/") :]
+    return None
+
+
+def _read_index(common_dir: str) -> dict:
+    """Return the branch index written by gibr.branchindex."""
+    try:
+        with open(
+            os.path.join(common_dir, "gibr", "branches.json"), encoding="utf-8"
+        ) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def branch_pattern(branch_name_format: str):
+    """Return a regex matching branch names made from branch_name_format.
+
+    Filters such as `{title|truncate:40}` are ignored. Anything after the
+    formatted name, such as a collision suffix, is allowed.
+    """
+    import re
+    from string import Formatter
+
+    pattern = ""
+    for literal, field, _, _ in Formatter().parse(branch_name_format):
+        pattern += re.escape(literal)
+        if field is not None:
+            name = field.partition("|")[0]
+            pattern += PLACEHOLDER_PATTERNS.get(name, r".+?")
+    return re.compile(pattern + r"(?:-.+)?")
+
+
+def _issue_from_index(index: dict, branch: str) -> tuple[str, str] | None:
+    """Return the issue ID and title recorded for branch, or None."""
+    for key, entries in index.items():
+        for entry in entries:
+            if entry["branch"] == branch:
+                return entry.get("issue") or key.partition(":")[2], entry["title"]
+    return None
+
+
+def load_config() -> dict:
+    """Return the parsed .gibrconfig, or {} if there is none."""
+    from gibr.config import GibrConfig
+
+    try:
+        return GibrConfig().load().config
+    except (OSError, ValueError):
+        return {}
+
+
+def _issue_from_pattern(index: dict, branch: str, config: dict) -> tuple[str, str]:
+    """Return the issue ID and cached title recovered from the branch name."""
+    branch_name_format = config.get("DEFAULT", {}).get("branch_name_format", "")
+    pattern = branch_pattern(branch_name_format)
+    match = pattern.fullmatch(branch)
+    if "issue" not in pattern.groupindex or not match:
+        return "", ""
+    tracker = config.get("issue-tracker", {}).get("name", "")
+    # Same key as gibr.branchindex.issue_key, which is too slow to import here
+    entries = index.get(f"{tracker}:{match['issue'].lower()}", [])
+    return match["issue"], entries[-1]["title"] if entries else ""
+
+
+def branch_issue(config: dict | None = None) -> tuple[str | None, str, str]:
+    """Return the branch checked out in cwd with its issue ID and title.
+
+    The branch is None outside a repository or with a detached HEAD; the
+    issue and title are "" when unknown. config is only loaded if the
+    branch is not in the branch index.
+    """
+    dirs = _git_dirs(os.getcwd())
+    branch = current_branch(dirs[0]) if dirs else None
+    if branch is None:
+        return None, "", ""
+    index = _read_index(dirs[1])
+    found = _issue_from_index(index, branch)
+    if found is None:
+        found = _issue_from_pattern(
+            index, branch, load_config() if config is None else config
+        )
+    return branch, *found
+
+
+def prompt_text() -> str:
+    """Return "<issue> <title>" for the checked-out branch, or ""."""
+    _, issue, title = branch_issue()
+    if len(title) > PROMPT_TITLE_WIDTH:
+        title = title[: PROMPT_TITLE_WIDTH - 1] + "…"
+    return f"{issue} {title}".strip()
+
+
+def main() -> None:
+    """Run `gibr status --prompt` and issue completion directly, else click."""
+    if os.environ.get("_GIBR_COMPLETE"):
+        from gibr.completion import fast_complete
+
+        if fast_complete():
+            return
+    if sys.argv[1:] == ["status", "--prompt"]:
+        text = prompt_text()
+        if text:
+            sys.stdout.write(text + "\n")
+        return
+    from gibr.cli import cli
+
+    cli()
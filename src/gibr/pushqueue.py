@@ -0,0 +1,225 @@
+"""Durable queue of branch pushes, drained by a detached background worker.
+
+Jobs are recorded under `.git/gibr/` before the worker is started, so a
+push that fails (or a worker that dies) is never lost: it stays queued
+until `gibr push --pending` or the next background run succeeds. Results
+are kept in the same file until the next gibr invocation reports them.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from gibr.paths import STATE_DIRNAME, state_dir
+from gibr.store import file_lock, locked_json, read_json
+
+QUEUE_FILENAME = "push-queue.json"
+WORKER_LOCK_FILENAME = "push-worker.lock"
+# A worker holding its lock longer than this is assumed to have died
+WORKER_LOCK_TIMEOUT = 300
+
+
+def _empty_state():
+    """Return the content of a fresh queue file."""
+    return {"jobs": [], "results": []}
+
+
+def _git(cwd, *args):
+    """Run git in cwd, returning the completed process."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+    )
+
+
+def push_branches(cwd: Path, remote: str, branches: list[str]) -> dict:
+    """Push branches to remote in a single `git push`.
+
+    Returns a mapping of branch name to an (ok, message) tuple.
+    """
+    refs = [f"refs/heads/{branch}" for branch in branches]
+    existing = set(
+        _git(cwd, "for-each-ref", "--format=%(refname)", *refs).stdout.split()
+    )
+    outcome = {
+        branch: (False, "branch no longer exists locally")
+        for branch, ref in zip(branches, refs, strict=True)
+        if ref not in existing
+    }
+    to_push = [branch for branch in branches if branch not in outcome]
+    if not to_push:
+        return outcome
+
+    proc = _git(
+        cwd,
+        "push",
+        "--porcelain",
+        "--set-upstream",
+        remote,
+        *[f"refs/heads/{branch}:refs/heads/{branch}" for branch in to_push],
+    )
+    outcome.update(_push_outcome(proc, to_push))
+    return outcome
+
+
+def delete_remote_branches(cwd: Path, remote: str, branches: list[str]) -> dict:
+    """Delete branches on remote with a single multi-refspec `git push`.
+
+    Returns a mapping of branch name to an (ok, message) tuple.
+    """
+    proc = _git(
+        cwd,
+        "push",
+        "--porcelain",
+        remote,
+        *[f":refs/heads/{branch}" for branch in branches],
+    )
+    return _push_outcome(proc, branches)
+
+
+def _push_outcome(proc, branches: list[str]) -> dict:
+    """Return the (ok, message) of each branch from `git push --porcelain`."""
+    outcome = {}
+    # Porcelain lines look like: "<flag>\t<src>:<dst>\t<summary>"
+    for line in proc.stdout.splitlines():
+        parts = line.split("\t")
+        if len(parts) != 3:  # noqa: PLR2004
+            continue
+        branch = parts[1].split(":", 1)[1].removeprefix("refs/heads/")
+        outcome[branch] = (parts[0] != "!", parts[2])
+    stderr = proc.stderr.strip().splitlines()
+    reason = stderr[0] if stderr else f"git push exited with {proc.returncode}"
+    for branch in branches:
+        outcome.setdefault(branch, (False, reason))
+    return outcome
+
+
+class PushQueue:
+    """Pending pushes for one repository, stored under .git/gibr/."""
+
+    def __init__(self, directory: Path):
+        """Construct PushQueue object for a gibr state directory."""
+        self.directory = Path(directory)
+        self.path = self.directory / QUEUE_FILENAME
+
+    @classmethod
+    def for_repo(cls, start: Path | None = None):
+        """Return the queue of the repository containing start, or None."""
+        directory = state_dir(start)
+        return cls(directory) if directory else None
+
+    @property
+    def git_dir(self) -> Path:
+        """Git directory the queued pushes are run from."""
+        return self.directory.parent
+
+    def add(self, remote: str, branches: list[str]) -> None:
+        """Queue branches for pushing to remote."""
+        with locked_json(self.path, _empty_state()) as state:
+            queued = {(job["remote"], job["branch"]) for job in state["jobs"]}
+            for branch in branches:
+                if (remote, branch) not in queued:
+                    state["jobs"].append(
+                        {
+                            "remote": remote,
+                            "branch": branch,
+                            "attempts": 0,
+                            "error": None,
+                            "queued_at": time.time(),
+                        }
+                    )
+
+    def pending(self) -> list[dict]:
+        """Return the queued push jobs."""
+        return read_json(self.path, _empty_state())["jobs"]
+
+    def take_results(self) -> list[dict]:
+        """Return and forget the results recorded by background runs."""
+        if not read_json(self.path, _empty_state())["results"]:
+            return []
+        with locked_json(self.path, _empty_state()) as state:
+            results, state["results"] = state["results"], []
+        return results
+
+    def run(self, record: bool = True) -> list[dict]:
+        """Push every queued branch once, one `git push` per remote.
+
+        Jobs queued while a push is in flight are picked up before
+        returning. Successful jobs leave the queue; failed ones stay for
+        a later retry. With record, results are kept for reporting.
+        """
+        results = []
+        attempted = set()
+        while True:
+            batch = {}
+            for job in self.pending():
+                key = (job["remote"], job["branch"])
+                if key not in attempted:
+                    batch.setdefault(job["remote"], []).append(job["branch"])
+            if not batch:
+                return results
+
+            for remote, branches in batch.items():
+                logging.debug(f"Pushing {branches} to {remote}")
+                outcome = push_branches(self.git_dir, remote, branches)
+                attempted.update((remote, branch) for branch in branches)
+                with locked_json(self.path, _empty_state()) as state:
+                    for job in list(state["jobs"]):
+                        if job["remote"] != remote or job["branch"] not in outcome:
+                            continue
+                        ok, message = outcome[job["branch"]]
+                        if ok:
+                            state["jobs"].remove(job)
+                        else:
+                            job["attempts"] += 1
+                            job["error"] = message
+                        result = {
+                            "remote": remote,
+                            "branch": job["branch"],
+                            "ok": ok,
+                            "message": message,
+                        }
+                        results.append(result)
+                        if record:
+                            state["results"].append(result)
+
+    def run_worker(self) -> None:
+        """Drain the queue, first waiting for any worker already running."""
+        with file_lock(self.directory / WORKER_LOCK_FILENAME, WORKER_LOCK_TIMEOUT):
+            self.run()
+
+    def spawn_worker(self) -> None:
+        """Start a detached process that drains the queue."""
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = (
+                subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        else:
+            kwargs["start_new_session"] = True
+        subprocess.Popen(
+            [sys.executable, "-m", "gibr.pushqueue", str(self.directory)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+
+
+def queue_push(git_dir: Path, remote: str, branches: list[str]) -> PushQueue:
+    """Record branches for pushing and hand them to a background worker."""
+    queue = PushQueue(Path(git_dir) / STATE_DIRNAME)
+    queue.add(remote, branches)
+    queue.spawn_worker()
+    return queue
+
+
+if __name__ == "__main__":  # pragma: no cover - entry point of the worker
+    PushQueue(Path(sys.argv[1])).run_worker()
@@ -0,0 +1,158 @@
+"""Cache of a remote's branch names and default branch under .git/gibr/.
+
+The cache is refreshed with a single `git ls-remote` at most once per
+TTL. Branches seen in remote-tracking refs after a `git fetch` are
+merged in without any network access; with a TTL of 0 those refs are
+the only source. Names are kept sorted, so existence and prefix queries are
+binary searches.
+"""
+
+import bisect
+import logging
+import subprocess
+import time
+from pathlib import Path
+
+from gibr.paths import STATE_DIRNAME
+from gibr.store import locked_json, read_json
+
+REMOTE_CACHE_FILENAME = "remote-refs.json"
+# Seconds a cached ls-remote result is trusted
+REMOTE_CACHE_TTL = 300
+
+
+class RemoteRefCache:
+    """Branch names and default branch of one remote."""
+
+    def __init__(self, refs, remote: str = "origin", ttl: float = REMOTE_CACHE_TTL):
+        """Construct RemoteRefCache object from a gibr.git.RefIndex."""
+        self.refs = refs
+        self.remote = remote
+        self.ttl = ttl
+        self.path = Path(refs.git_dir) / STATE_DIRNAME / REMOTE_CACHE_FILENAME
+        self._entry = None
+
+    def branches(self) -> list[str]:
+        """Return the sorted branch names on the remote."""
+        return self._load()["branches"]
+
+    def default_branch(self) -> str | None:
+        """Return the branch origin/HEAD points to, if known."""
+        return self._load()["head"]
+
+    def exists(self, branch_name: str) -> bool:
+        """Return True if branch_name exists on the remote."""
+        branches = self.branches()
+        i = bisect.bisect_left(branches, branch_name)
+        return i < len(branches) and branches[i] == branch_name
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        """Return the remote branch names starting with prefix."""
+        branches = self.branches()
+        start = bisect.bisect_left(branches, prefix)
+        end = start
+        while end < len(branches) and branches[end].startswith(prefix):
+            end += 1
+        return branches[start:end]
+
+    def add(self, branch_name: str) -> None:
+        """Record a branch that was just pushed to the remote."""
+        if self._entry is None:
+            return  # Not loaded, the next refresh will pick it up
+        with locked_json(self.path, {}) as data:
+            entry = data.get(self.remote)
+            if entry and branch_name not in entry["branches"]:
+                bisect.insort(entry["branches"], branch_name)
+                self._entry = entry
+
+    def discard(self, branch_names: list[str]) -> None:
+        """Forget branches that were just deleted on the remote."""
+        deleted = set(branch_names)
+        with locked_json(self.path, {}) as data:
+            entry = data.get(self.remote)
+            if entry:
+                entry["branches"] = [b for b in entry["branches"] if b not in deleted]
+                self._entry = entry
+
+    def refresh(self) -> dict:
+        """Re-read the remote with ls-remote, or from tracking refs if offline."""
+        entry = self._from_ls_remote() or self._from_tracking_refs(time.time())
+        self._store(entry)
+        return entry
+
+    def _load(self) -> dict:
+        """Return the cache entry for the remote, refreshing it if stale."""
+        if self._entry is not None:
+            return self._entry
+        entry = read_json(self.path, {}).get(self.remote)
+        last_fetch = self._last_fetch()
+        if not self.ttl:
+            # Never go to the network; tracking refs are the only source
+            entry = self._from_tracking_refs(last_fetch)
+        elif entry is None or time.time() - entry["fetched_at"] > self.ttl:
+            entry = self.refresh()
+        elif last_fetch > max(entry["fetched_at"], entry.get("fetch_seen", 0)):
+            # Fetches may cover a single branch, so merge rather than replace
+            logging.debug(f"Merging {self.remote} tracking refs after fetch")
+            tracking = self._from_tracking_refs(entry["fetched_at"])
+            entry = {
+                "fetched_at": entry["fetched_at"],
+                "fetch_seen": last_fetch,
+                "head": tracking["head"] or entry["head"],
+                "branches": sorted(set(entry["branches"]) | set(tracking["branches"])),
+            }
+            self._store(entry)
+        self._entry = entry
+        return entry
+
+    def _last_fetch(self) -> float:
+        """Return the time of the last fetch, or 0."""
+        try:
+            return (Path(self.refs.git_dir) / "FETCH_HEAD").stat().st_mtime
+        except OSError:
+            return 0
+
+    def _store(self, entry: dict) -> None:
+        """Write entry to the cache file."""
+        with locked_json(self.path, {}) as data:
+            data[self.remote] = entry
+        self._entry = entry
+
+    def _from_ls_remote(self) -> dict | None:
+        """Return an entry built from `git ls-remote`, or None on failure."""
+        logging.debug(f"Listing branches of {self.remote}")
+        proc = subprocess.run(
+            ["git", "--git-dir", str(self.refs.git_dir), "ls-remote", "--symref"]
+            + [self.remote, "HEAD", "refs/heads/*"],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+        )
+        if proc.returncode != 0:
+            logging.debug(f"ls-remote failed: {proc.stderr.strip()}")
+            return None
+        head, branches = None, []
+        for line in proc.stdout.splitlines():
+            value, _, name = line.partition("\t")
+            if value.startswith("ref: ") and name == "HEAD":
+                head = value[len("ref: ") :].removeprefix("refs/heads/")
+            elif name.startswith("refs/heads/"):
+                branches.append(name.removeprefix("refs/heads/"))
+        return {"fetched_at": time.time(), "head": head, "branches": sorted(branches)}
+
+    def _from_tracking_refs(self, fetched_at: float) -> dict:
+        """Return an entry built from refs/remotes/<remote>/."""
+        prefix = f"refs/remotes/{self.remote}/"
+        branches = [
+            ref.removeprefix(prefix)
+            for ref in self.refs.with_prefix(prefix)
+            if ref != f"{prefix}HEAD"
+        ]
+        head = None
+        try:
+            content = (Path(self.refs.git_dir) / prefix / "HEAD").read_text()
+            if content.startswith("ref: "):
+                head = content[len("ref: ") :].strip().removeprefix(prefix)
+        except OSError:
+            pass
+        return {"fetched_at": fetched_at, "head": head, "branches": branches}
@@ -0,0 +1,63 @@
+"""Fast slugs, identical to python-slugify's default output.
+
+Issue titles are slugified for every branch name and listing row, and
+`slugify.slugify` runs a dozen regex and normalization passes plus a
+full transliteration on each call. Titles are usually plain ASCII, so
+those take a short path of two regex passes. Other titles repeat the
+python-slugify pipeline with transliteration cached per character, and
+titles that may contain HTML entities go to python-slugify itself.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Steps of python-slugify's pipeline that apply once the text is ASCII
+NUMBER_COMMA = re.compile(r"(?<=\d),(?=\d)")
+NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
+def _transliterate(char: str) -> str:
+    """Return the ASCII spelling of char, as python-slugify finds it."""
+    try:
+        from unidecode import unidecode
+    except ModuleNotFoundError:
+        from text_unidecode import unidecode
+    return unidecode(char)
+
+
+def _clean(text: str) -> str:
+    """Return the slug of ASCII text whose quotes were already handled."""
+    text = text.lower().replace("'", "")
+    if "," in text:
+        text = NUMBER_COMMA.sub("", text)
+    return NON_ALNUM.sub("-", text).strip("-")
+
+
+def _full_slugify(text) -> str:
+    """Return python-slugify's slug of text."""
+    from slugify import slugify as full_slugify
+
+    return full_slugify(text)
+
+
+def slugify(text: str) -> str:
+    """Return the slug of text, like `slugify.slugify(text)`."""
+    if text.__class__ is not str or "&" in text:
+        return _full_slugify(text)
+    # python-slugify turns quotes into dashes before transliterating,
+    # and drops the quotes transliteration produces
+    ascii_text = text.replace("'", "-")
+    if not ascii_text.isascii():
+        ascii_text = "".join(
+            [
+                char if char < "\x80" else _transliterate(char)
+                for char in unicodedata.normalize("NFKD", ascii_text)
+            ]
+        )
+        # Entities are decoded after transliteration, so an & it or NFKD
+        # produced (e.g. from a fullwidth ＆) may start one
+        if "&" in ascii_text:
+            return _full_slugify(text)
+    return _clean(ascii_text)
@@ -0,0 +1,243 @@
+"""Spans around the phases of a gibr command, exported as OTLP/JSON.
+
+While a SpanRecorder is active, `span(name)` times a phase as a child of
+the current span and the tracker's HTTP requests become child spans of
+the phase that made them. The trace is written in the OpenTelemetry
+protocol's JSON encoding, so a collector's `otlpjsonfile` receiver (or
+anything reading OTLP) can pick it up; no collector is needed to run.
+With no recorder, `span` returns a shared do-nothing context manager.
+"""
+
+import json
+import os
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+# File (one trace appended per line) or directory (one file per trace)
+OTLP_ENV_VAR = "GIBR_OTLP_FILE"
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_ERROR = 2
+
+_recorder = None
+_current_span = ContextVar("gibr_current_span", default=None)
+
+
+class _NoSpan:
+    """Context manager standing in for a span when nothing is recorded."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def set(self, **attributes) -> None:
+        """Ignore attributes."""
+
+
+NO_SPAN = _NoSpan()
+
+
+class Span:
+    """A timed phase with attributes, recorded when it ends."""
+
+    def __init__(self, recorder, name: str, attributes: dict, kind=SPAN_KIND_INTERNAL):
+        """Construct Span object; it starts when entered."""
+        self.recorder = recorder
+        self.name = name
+        self.attributes = attributes
+        self.kind = kind
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = recorder.current_span_id()
+        self.start_ns = self.end_ns = 0
+        self.error = None
+        self._token = None
+
+    def __enter__(self):
+        """Start the span and make it the current one."""
+        self.start()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """End the span, recording the exception it ended with."""
+        _current_span.reset(self._token)
+        self.end(exc)
+
+    def set(self, **attributes) -> None:
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+
+    def start(self) -> None:
+        """Start timing."""
+        self.start_ns = time.time_ns()
+
+    def end(self, exc: BaseException | None = None) -> None:
+        """Stop timing and hand the span to the recorder."""
+        self.end_ns = time.time_ns()
+        if exc is not None:
+            self.error = type(exc).__name__
+        self.recorder.add(self.to_otlp())
+
+    def to_otlp(self) -> dict:
+        """Return the span as an OTLP/JSON span."""
+        otlp = {
+            "traceId": self.recorder.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": otlp_attributes(self.attributes),
+        }
+        if self.parent_span_id:
+            otlp["parentSpanId"] = self.parent_span_id
+        if self.error:
+            otlp["status"] = {"code": STATUS_ERROR, "message": self.error}
+        return otlp
+
+
+def otlp_attributes(attributes: dict) -> list[dict]:
+    """Return attributes as OTLP key/value pairs, leaving out None values."""
+    pairs = []
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            # 64-bit integers are strings in OTLP/JSON
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        pairs.append({"key": key, "value": typed})
+    return pairs
+
+
+def _http_span(record: dict) -> dict:
+    """Return the attributes of the span for a traced HTTP request."""
+    return {
+        "http.request.method": record["method"],
+        "url.template": record["url"],
+        "http.response.status_code": record["status"],
+        "http.request.body.size": record["bytes_out"],
+        "http.response.body.size": record["bytes_in"],
+        "http.request.resend_count": record["retries"] or None,
+        "error.type": record["error"],
+        "gibr.http.dns_ms": record["dns_ms"],
+        "gibr.http.connect_ms": record["connect_ms"],
+        "gibr.http.tls_ms": record["tls_ms"],
+        "gibr.http.ttfb_ms": record["ttfb_ms"],
+    }
+
+
+def _gibr_version() -> str:
+    """Return the installed gibr version, or "unknown"."""
+    # Imported here to keep importlib.metadata off the untraced startup path
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("gibr")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SpanRecorder:
+    """Record the spans of one gibr run and export them as OTLP/JSON."""
+
+    def __init__(self, path, name: str, **attributes):
+        """Construct SpanRecorder object exporting to path, with a root span."""
+        self.path = Path(path)
+        self.trace_id = os.urandom(16).hex()
+        self.spans = []
+        self.root = Span(self, name, attributes)
+        self.http = None
+
+    def current_span_id(self) -> str | None:
+        """Return the ID of the span requests and new spans belong to."""
+        current = _current_span.get()
+        if current is not None:
+            return current.span_id
+        # Threads started without the context (e.g. the picker's loader)
+        root = getattr(self, "root", None)
+        return root.span_id if root else None
+
+    def add(self, otlp_span: dict) -> None:
+        """Keep a finished span for export."""
+        self.spans.append(otlp_span)
+
+    def start(self) -> None:
+        """Make this the active recorder and start the root span."""
+        global _recorder
+        from gibr.tracing import HttpTracer
+
+        self.root.start()
+        self.http = HttpTracer(parent=self.current_span_id)
+        self.http.install()
+        _recorder = self
+
+    def finish(self, exc: BaseException | None = None) -> Path:
+        """End the root span, stop recording and export; return the file."""
+        global _recorder
+        _recorder = None
+        self.http.uninstall()
+        for record in self.http.records:
+            self.spans.append(
+                {
+                    "traceId": self.trace_id,
+                    "spanId": os.urandom(8).hex(),
+                    "parentSpanId": record["parent_span_id"],
+                    "name": record["method"],
+                    "kind": SPAN_KIND_CLIENT,
+                    "startTimeUnixNano": str(record["start_ns"]),
+                    "endTimeUnixNano": str(record["end_ns"]),
+                    "attributes": otlp_attributes(_http_span(record)),
+                }
+                | ({"status": {"code": STATUS_ERROR}} if record["error"] else {})
+            )
+        self.root.end(exc)
+        return self.export()
+
+    def to_otlp(self) -> dict:
+        """Return the trace as an OTLP/JSON ExportTraceServiceRequest."""
+        resource = {"service.name": "gibr", "service.version": _gibr_version()}
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": otlp_attributes(resource)},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "gibr", "version": _gibr_version()},
+                            "spans": sorted(
+                                self.spans, key=lambda s: int(s["startTimeUnixNano"])
+                            ),
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self) -> Path:
+        """Write the trace; return the file written to.
+
+        A directory gets a new file per trace; a file gets the trace
+        appended as one line, the layout OTLP JSON file readers expect.
+        """
+        path = self.path
+        if path.is_dir():
+            path = path / f"gibr-{self.root.start_ns}-{self.trace_id[:8]}.json"
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self.to_otlp(), separators=(",", ":")) + "\n")
+        return path
+
+
+def span(name: str, **attributes):
+    """Return a context manager recording name as a span, if recording."""
+    if _recorder is None:
+        return NO_SPAN
+    return Span(_recorder, name, attributes)
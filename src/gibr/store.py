@@ -0,0 +1,71 @@
+"""Small helpers for gibr's JSON state files."""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Seconds to wait for a state file lock before treating it as abandoned
+LOCK_TIMEOUT = 5
+
+
+def read_json(path: Path, default=None):
+    """Return the parsed content of path, or default if missing or corrupt."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Atomically replace path with data."""
+    # Imported here: readers such as the commit hook never write
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_json(path: Path, data) -> None:
+    """Atomically replace path with data serialized as JSON."""
+    write_bytes(path, json.dumps(data, separators=(",", ":")).encode())
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = LOCK_TIMEOUT):
+    """Hold an exclusive lock file; steal it if it outlives timeout."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                # Left behind by a process that died while holding it
+                path.unlink(missing_ok=True)
+                deadline = time.monotonic() + timeout
+            time.sleep(0.01)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        path.unlink(missing_ok=True)
+
+
+@contextmanager
+def locked_json(path: Path, default):
+    """Yield the content of path for modification and write it back on exit."""
+    with file_lock(path.with_name(path.name + ".lock")):
+        data = read_json(path, default)
+        yield data
+        write_json(path, data)
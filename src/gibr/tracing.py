@@ -0,0 +1,253 @@
+"""Trace the HTTP requests trackers make, for `gibr --trace`.
+
+Every tracker client (PyGithub, python-gitlab, jira, azure-devops and
+the GraphQL helper) sends its requests through a requests Session, so
+wrapping `Session.send` sees them all without touching the trackers.
+Connection setup is timed by also wrapping urllib3's connection and the
+name lookup beneath it, which only happen when a connection is opened;
+a reused keep-alive connection shows as zero DNS, connect and TLS time.
+"""
+
+import json
+import re
+import socket
+import threading
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+import click
+import requests
+import urllib3.connection
+import urllib3.util.connection
+from tabulate import tabulate
+
+# Path segments that identify one object rather than a kind of request:
+# numbers, issue keys, UUIDs and hashes
+ID_SEGMENT = re.compile(
+    r"\d+|[A-Za-z][A-Za-z0-9]*-\d+|[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}"
+    r"|[0-9a-f]{32,64}"
+)
+TIMINGS = ("dns_ms", "connect_ms", "tls_ms", "ttfb_ms", "total_ms")
+
+_current = threading.local()
+
+
+def url_template(url: str) -> str:
+    """Return url with IDs in the path replaced by {id} and query values dropped."""
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if parts.port:
+        host += f":{parts.port}"
+    path = "/".join(
+        "{id}" if ID_SEGMENT.fullmatch(segment) else segment
+        for segment in parts.path.split("/")
+    )
+    keys = dict.fromkeys(key for key, _ in parse_qsl(parts.query, True))
+    query = "&".join(keys)
+    return f"{parts.scheme}://{host}{path}" + (f"?{query}" if query else "")
+
+
+def _body_size(body) -> int:
+    """Return the size in bytes of a request body."""
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode())
+    if isinstance(body, bytes | bytearray):
+        return len(body)
+    # Streamed uploads (files, generators) are not measured
+    return 0
+
+
+def _received(response, stream: bool) -> int:
+    """Return the bytes read from the wire for response, body only."""
+    raw = getattr(response, "raw", None)
+    try:
+        read = raw.tell()
+        if isinstance(read, int) and (read or not stream):
+            return read
+    except (AttributeError, OSError):
+        pass
+    if not stream:
+        return len(response.content or b"")
+    return int(response.headers.get("Content-Length") or 0)
+
+
+def _retries(response) -> int:
+    """Return how often urllib3 retried the request behind response."""
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    history = getattr(retries, "history", None)
+    return len(history) if isinstance(history, tuple) else 0
+
+
+class HttpTracer:
+    """Record every HTTP request sent through requests while installed."""
+
+    def __init__(self, parent=None):
+        """Construct HttpTracer object with no records.
+
+        parent, if given, returns the ID of the span a request is made in;
+        it is recorded as the request's parent_span_id.
+        """
+        self.parent = parent
+        self.records = []
+        self.lock = threading.Lock()
+        self._originals = []
+
+    def __enter__(self):
+        """Install the tracer."""
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Uninstall the tracer."""
+        self.uninstall()
+
+    def _patch(self, owner, name, make_wrapper) -> None:
+        """Replace owner.name with make_wrapper(original), remembering it."""
+        original = getattr(owner, name)
+        self._originals.append((owner, name, original))
+        setattr(owner, name, make_wrapper(original))
+
+    def install(self) -> None:
+        """Start recording requests."""
+        self._patch(requests.Session, "send", self._wrap_send)
+        self._patch(requests.adapters.HTTPAdapter, "send", self._wrap_adapter_send)
+        self._patch(urllib3.util.connection, "create_connection", self._wrap_timed)
+        self._patch(urllib3.connection.HTTPSConnection, "connect", self._wrap_timed)
+        self._patch(socket, "getaddrinfo", self._wrap_timed)
+
+    def uninstall(self) -> None:
+        """Stop recording requests, restoring what was wrapped."""
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    def _wrap_send(self, send):
+        """Return Session.send recording one request per call."""
+        tracer = self
+
+        def traced_send(session, request, **kwargs):
+            record = {
+                "method": request.method,
+                "url": url_template(request.url),
+                "status": None,
+                "bytes_out": _body_size(request.body),
+                "bytes_in": 0,
+                "dns_ms": 0.0,
+                "connect_ms": 0.0,
+                "tls_ms": 0.0,
+                "ttfb_ms": 0.0,
+                "total_ms": 0.0,
+                "retries": 0,
+                "error": None,
+                "start_ns": time.time_ns(),
+            }
+            if tracer.parent:
+                record["parent_span_id"] = tracer.parent()
+            # Redirects call send again from inside send
+            outer = getattr(_current, "record", None)
+            _current.record = record
+            start = time.perf_counter()
+            try:
+                response = send(session, request, **kwargs)
+                record["status"] = response.status_code
+                record["bytes_in"] = _received(response, kwargs.get("stream", False))
+                record["retries"] = _retries(response)
+                return response
+            except Exception as e:
+                record["error"] = type(e).__name__
+                raise
+            finally:
+                record["total_ms"] = (time.perf_counter() - start) * 1000
+                record["end_ns"] = record["start_ns"] + int(record["total_ms"] * 1e6)
+                _current.record = outer
+                with tracer.lock:
+                    tracer.records.append(record)
+
+        return traced_send
+
+    def _wrap_adapter_send(self, send):
+        """Return HTTPAdapter.send measuring the time to the response headers."""
+
+        def traced_adapter_send(adapter, request, *args, **kwargs):
+            record = getattr(_current, "record", None)
+            if record is None:
+                return send(adapter, request, *args, **kwargs)
+            setup = record["dns_ms"] + record["connect_ms"] + record["tls_ms"]
+            start = time.perf_counter()
+            try:
+                return send(adapter, request, *args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                spent = record["dns_ms"] + record["connect_ms"] + record["tls_ms"]
+                record["ttfb_ms"] += elapsed - (spent - setup)
+
+        return traced_adapter_send
+
+    def _wrap_timed(self, func):
+        """Return func adding its time to the DNS, connect or TLS timing.
+
+        getaddrinfo is DNS; create_connection is DNS plus the TCP
+        connect; HTTPSConnection.connect adds the TLS handshake.
+        """
+        key = {
+            "getaddrinfo": "dns_ms",
+            "create_connection": "connect_ms",
+            "connect": "tls_ms",
+        }[func.__name__]
+
+        def timed(*args, **kwargs):
+            record = getattr(_current, "record", None)
+            if record is None:
+                return func(*args, **kwargs)
+            before = sum(record[k] for k in ("dns_ms", "connect_ms", "tls_ms"))
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                inner = sum(record[k] for k in ("dns_ms", "connect_ms", "tls_ms"))
+                record[key] += elapsed - (inner - before)
+
+        return timed
+
+    def summary(self) -> list[list]:
+        """Return a row per method, URL template and status, with totals."""
+        groups = {}
+        for record in self.records:
+            key = (record["method"], record["url"], record["status"] or record["error"])
+            row = groups.setdefault(key, [*key, 0, 0, 0, 0] + [0.0] * len(TIMINGS))
+            row[3] += 1
+            row[4] += record["retries"]
+            row[5] += record["bytes_out"]
+            row[6] += record["bytes_in"]
+            for i, timing in enumerate(TIMINGS, 7):
+                row[i] += record[timing]
+        return list(groups.values())
+
+    def write_ndjson(self, path) -> None:
+        """Write one JSON object per request to path."""
+        with open(path, "w", encoding="utf-8") as f:
+            for record in self.records:
+                f.write(json.dumps(record) + "\n")
+
+
+def report_trace(tracer: HttpTracer, path=None) -> None:
+    """Stop tracing and show the requests as a table, or write them to path."""
+    tracer.uninstall()
+    if path:
+        tracer.write_ndjson(path)
+        click.echo(f"Traced {len(tracer.records)} request(s) to {path}.", err=True)
+        return
+    if not tracer.records:
+        click.echo("No tracker requests were made.", err=True)
+        return
+    rows = tracer.summary()
+    totals = [sum(row[i] for row in rows) for i in range(3, 7 + len(TIMINGS))]
+    rows.append(["", "Total", "", *totals])
+    headers = ["Method", "URL", "Status", "Requests", "Retries", "Sent", "Received"]
+    headers += ["DNS ms", "Connect ms", "TLS ms", "TTFB ms", "Total ms"]
+    click.echo(
+        tabulate(rows, headers=headers, tablefmt="github", floatfmt=".1f"), err=True
+    )
@@ -18,6 +18,9 @@ from gibr.trackers.base import IssueTracker
 class AzureTracker(IssueTracker):
     """Azure issue tracker using azure-devops."""
 
+    # Maximum number of ids accepted by the work items batch API
+    BATCH_SIZE = 200
+
     def __init__(
         self, url: str, token: str, project: str, team: str, closed_states: list[str]
     ):
@@ -128,13 +131,49 @@ class AzureTracker(IssueTracker):
         except Exception as e:
             logging.debug(f"Failed to get issue : {e}")
             error("Failed to get issue, run again with --verbose flag for more details")
+        return self._to_issue(issue)
+
+    def _to_issue(self, issue) -> Issue:
+        """Convert an Azure work item into an Issue."""
         return Issue(
             id=issue.id,
             title=issue.fields["System.Title"],
             type=issue.fields["System.WorkItemType"],
             assignee=self._get_assignee(issue),
+            state=issue.fields.get("System.State"),
+            closed=issue.fields.get("System.State") in self.closed_states,
         )
 
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        """Fetch several work items through the batch API."""
+        found = self.find_issues(issue_ids)
+        missing = [issue_id for issue_id in issue_ids if issue_id not in found]
+        if missing:
+            error(f"Issues not found: {', '.join(missing)}")
+        return [found[issue_id] for issue_id in issue_ids]
+
+    def find_issues(self, issue_ids: list[str]) -> dict[str, Issue]:
+        """Fetch the existing work items among issue_ids through the batch API."""
+        ids = list(dict.fromkeys(int(issue_id) for issue_id in issue_ids))
+        found = {}
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            try:
+                work_items = self.wit_client.get_work_items(
+                    ids[start : start + self.BATCH_SIZE], error_policy="Omit"
+                )
+            except Exception as e:
+                logging.debug(f"Failed to get issues: {e}")
+                error(
+                    "Failed to get issues, run again with --verbose flag for more "
+                    "details"
+                )
+            found.update({item.id: item for item in work_items if item})
+        return {
+            issue_id: self._to_issue(found[int(issue_id)])
+            for issue_id in issue_ids
+            if int(issue_id) in found
+        }
+
     def list_issues(self) -> list[dict]:
         """List all open issues in the project."""
         state_exclusion = self._build_state_exclusion()
@@ -171,12 +210,4 @@ class AzureTracker(IssueTracker):
                 "Failed to get issues, run again with --verbose flag for more details"
             )
 
-        return [
-            Issue(
-                id=issue.id,
-                title=issue.fields["System.Title"],
-                type=issue.fields["System.WorkItemType"],
-                assignee=self._get_assignee(issue),
-            )
-            for issue in issues
-        ]
+        return [self._to_issue(issue) for issue in issues]
@@ -28,6 +28,40 @@ class IssueTracker(ABC):
         """Return list of open issues."""
         pass
 
+    def iter_issues(self):
+        """Yield open issues as they are fetched.
+
+        Trackers that page through results should override this so that
+        the first page can be shown before the last one arrives.
+        """
+        yield from self.list_issues()
+
+    def get_issues(self, issue_ids: list[str]) -> list:
+        """Return issues for several ids, in the order requested.
+
+        Trackers with a bulk lookup API should override this so that
+        a batch costs a handful of requests instead of one per issue.
+        """
+        return [self.get_issue(issue_id) for issue_id in issue_ids]
+
+    def find_issues(self, issue_ids: list[str]) -> dict:
+        """Return the issues that exist among issue_ids, keyed by requested id.
+
+        Unlike get_issues, unknown ids are left out instead of reported.
+        Trackers with a bulk lookup API should override this.
+        """
+        return dict(zip(issue_ids, self.get_issues(issue_ids)))
+
+    @classmethod
+    def resolve_issue_id(cls, issue_id: str, config: dict) -> str:
+        """Return the ID the tracker reports for issue_id, given its config section.
+
+        Trackers that accept short forms (e.g. a number without its project
+        key) should override this, so that issue IDs typed by the user match
+        the ones recorded from issues.
+        """
+        return issue_id
+
     @classmethod
     def configure_interactively(cls) -> dict:
         """Prompt user for tracker-specific configuration (override in subclasses)."""
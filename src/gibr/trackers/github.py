@@ -16,12 +16,19 @@ from .base import IssueTracker
 class GithubTracker(IssueTracker):
     """GitHub issue tracker using PyGithub."""
 
+    # Issues fetched per aliased GraphQL query
+    BATCH_SIZE = 100
+
     def __init__(self, repo: str, token: str):
         """Construct GithubTracker object."""
         try:
             from github import Auth, Github
-            from github.GithubException import UnknownObjectException
+            from github.GithubException import (
+                GithubException,
+                UnknownObjectException,
+            )
 
+            self.GithubException = GithubException
             self.UnknownObjectException = UnknownObjectException
         except ImportError:
             self.import_error("PyGithub", "github")
@@ -62,23 +69,84 @@ class GithubTracker(IssueTracker):
         """Get issue assignee."""
         return issue.assignee.login if issue.assignee else None
 
+    def _to_issue(self, issue) -> Issue:
+        """Convert a PyGithub issue into an Issue."""
+        return Issue(
+            id=issue.number,
+            title=issue.title,
+            assignee=self._get_assignee(issue),
+            state=issue.state,
+            closed=issue.state == "closed",
+        )
+
     def get_issue(self, issue_id: str) -> dict:
         """Fetch issue details by issue number."""
         try:
             issue = self.repo.get_issue(number=int(issue_id))
         except self.UnknownObjectException:
             error(f"Issue #{issue_id} not found in repository.")
-        return Issue(
-            id=issue.number, title=issue.title, assignee=self._get_assignee(issue)
-        )
+        return self._to_issue(issue)
+
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        """Fetch several issues in one GraphQL query using field aliases."""
+        found = self.find_issues(issue_ids)
+        for issue_id in issue_ids:
+            if issue_id not in found:
+                error(f"Issue #{issue_id} not found in repository.")
+        return [found[issue_id] for issue_id in issue_ids]
+
+    def find_issues(self, issue_ids: list[str]) -> dict[str, Issue]:
+        """Fetch the existing issues among issue_ids, one query per batch."""
+        numbers = list(dict.fromkeys(int(issue_id) for issue_id in issue_ids))
+        owner, name = self.repo.full_name.split("/", 1)
+        requester = self.client.requester
+        found = {}
+        for start in range(0, len(numbers), self.BATCH_SIZE):
+            fields = "\n".join(
+                f"i{n}: issue(number: {n}) {{ number title state "
+                "assignees(first: 1) { nodes { login } } }"
+                for n in numbers[start : start + self.BATCH_SIZE]
+            )
+            query = (
+                "query ($owner: String!, $name: String!) {"
+                f" repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            )
+            # Unknown numbers come back as null aliases with an error each;
+            # graphql_query() would raise on those, so read the response as is
+            try:
+                _, data = requester.requestJsonAndCheck(
+                    "POST",
+                    requester.graphql_url,
+                    input={
+                        "query": query,
+                        "variables": {"owner": owner, "name": name},
+                    },
+                )
+            except self.GithubException as e:
+                error(f"Failed to fetch issues {', '.join(issue_ids)}: {e}")
+            repository = (data.get("data") or {}).get("repository") or {}
+            for issue in repository.values():
+                if issue:
+                    assignees = issue["assignees"]["nodes"]
+                    found[issue["number"]] = Issue(
+                        id=issue["number"],
+                        title=issue["title"],
+                        assignee=assignees[0]["login"] if assignees else None,
+                        state=issue["state"].lower(),
+                        closed=issue["state"] == "CLOSED",
+                    )
+        return {
+            issue_id: found[int(issue_id)]
+            for issue_id in issue_ids
+            if int(issue_id) in found
+        }
 
     def list_issues(self) -> list[dict]:
         """List open issues from the GitHub repository."""
-        issues = self.repo.get_issues(state="open")
-        return [
-            Issue(
-                id=issue.number, title=issue.title, assignee=self._get_assignee(issue)
-            )
-            for issue in issues
-            if getattr(issue, "pull_request", None) is None
-        ]
+        return list(self.iter_issues())
+
+    def iter_issues(self):
+        """Yield open issues page by page, skipping pull requests."""
+        for issue in self.repo.get_issues(state="open"):
+            if getattr(issue, "pull_request", None) is None:
+                yield self._to_issue(issue)
@@ -15,6 +15,9 @@ from gibr.trackers.base import IssueTracker
 class GitlabTracker(IssueTracker):
     """GitLab issue tracker using python-gitlab."""
 
+    # Issues requested per iids-filtered list call, which is also one page
+    BATCH_SIZE = 100
+
     def __init__(self, url: str, token: str, project: str):
         """Initialize GitlabTracker with connection to specified project."""
         try:
@@ -83,20 +86,61 @@ class GitlabTracker(IssueTracker):
         # No assignee found
         return None
 
+    def _to_issue(self, issue) -> Issue:
+        """Convert a python-gitlab issue into an Issue."""
+        return Issue(
+            id=issue.iid,
+            title=issue.title,
+            assignee=self._get_assignee(issue),
+            state=issue.state,
+            closed=issue.state == "closed",
+        )
+
     def get_issue(self, issue_id: str) -> dict:
         """Fetch issue details by issue id."""
         try:
             issue = self.project.issues.get(issue_id)
         except self.GitlabGetError:
             error(f"Issue #{issue_id} not found in GitLab project {self.project_name}.")
-        return Issue(
-            id=issue.iid, title=issue.title, assignee=self._get_assignee(issue)
-        )
+        return self._to_issue(issue)
+
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        """Fetch several issues in one request filtered by iid."""
+        found = self.find_issues(issue_ids)
+        missing = [issue_id for issue_id in issue_ids if issue_id not in found]
+        if missing:
+            error(
+                f"Issues not found in GitLab project {self.project_name}: "
+                f"{', '.join(missing)}"
+            )
+        return [found[issue_id] for issue_id in issue_ids]
+
+    def find_issues(self, issue_ids: list[str]) -> dict[str, Issue]:
+        """Fetch the existing issues among issue_ids, one request per batch."""
+        iids = list(dict.fromkeys(int(issue_id) for issue_id in issue_ids))
+        found = {}
+        for start in range(0, len(iids), self.BATCH_SIZE):
+            batch = iids[start : start + self.BATCH_SIZE]
+            found.update(
+                {
+                    issue.iid: issue
+                    for issue in self.project.issues.list(
+                        iids=batch, per_page=len(batch), all=True
+                    )
+                }
+            )
+        return {
+            issue_id: self._to_issue(found[int(issue_id)])
+            for issue_id in issue_ids
+            if int(issue_id) in found
+        }
 
     def list_issues(self) -> list[dict]:
         """List all open issues in the project."""
         issues = self.project.issues.list(state="opened", all=True)
-        return [
-            Issue(id=issue.iid, title=issue.title, assignee=self._get_assignee(issue))
-            for issue in issues
-        ]
+        return [self._to_issue(issue) for issue in issues]
+
+    def iter_issues(self):
+        """Yield open issues page by page."""
+        for issue in self.project.issues.list(state="opened", iterator=True):
+            yield self._to_issue(issue)
@@ -5,11 +5,11 @@ import re
 from textwrap import dedent
 
 import click
-from slugify import slugify
 
 from gibr.issue import Issue
 from gibr.notify import error
 from gibr.registry import register_tracker
+from gibr.slug import slugify
 
 from .base import IssueTracker
 
@@ -18,6 +18,11 @@ from .base import IssueTracker
 class JiraTracker(IssueTracker):
     """Jira issue tracker."""
 
+    # Upper bound on keys per `key in (...)` query
+    BATCH_SIZE = 100
+    # Fields _to_issue reads, so searches don't fetch whole issues
+    FIELDS = "summary,issuetype,assignee,status"
+
     def __init__(self, url: str, user: str, token: str, project_key: str = None):
         """Construct JiraTracker object."""
         try:
@@ -124,8 +129,16 @@ class JiraTracker(IssueTracker):
 
         return None
 
-    def get_issue(self, issue_id: str) -> dict:
-        """Fetch issue details by issue number (using project key)."""
+    @classmethod
+    def resolve_issue_id(cls, issue_id: str, config: dict) -> str:
+        """Return the issue key for issue_id, prefixing numbers with project_key."""
+        project_key = config.get("project_key")
+        if issue_id.isdigit() and project_key:
+            return f"{project_key}-{issue_id}"
+        return issue_id
+
+    def _issue_key(self, issue_id: str) -> str:
+        """Return the full issue key, prefixing numeric ids with the project key."""
         if issue_id.isdigit() and not self.project_key:
             error(
                 dedent(f"""
@@ -135,11 +148,22 @@ class JiraTracker(IssueTracker):
                 project_key = PROJ
             """)
             )
-        issue_key = (
-            f"{self.project_key}-{issue_id}"
-            if issue_id.isdigit() and self.project_key
-            else issue_id
+        return self.resolve_issue_id(issue_id, {"project_key": self.project_key})
+
+    def _to_issue(self, issue) -> Issue:
+        """Convert a Jira issue resource into an Issue."""
+        return Issue(
+            id=issue.key,
+            title=issue.fields.summary,
+            type=issue.fields.issuetype.name,
+            assignee=self._get_assignee(issue),
+            state=issue.fields.status.name,
+            closed=issue.fields.status.statusCategory.key == "done",
         )
+
+    def get_issue(self, issue_id: str) -> dict:
+        """Fetch issue details by issue number (using project key)."""
+        issue_key = self._issue_key(issue_id)
         try:
             issue = self.client.issue(issue_key)
         except self.JIRAError:
@@ -150,12 +174,63 @@ class JiraTracker(IssueTracker):
             else:
                 error(f"Issue {issue_key} not found in Jira instance.")
 
-        return Issue(
-            id=issue.key,
-            title=issue.fields.summary,
-            type=issue.fields.issuetype.name,
-            assignee=self._get_assignee(issue),
-        )
+        return self._to_issue(issue)
+
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        """Fetch several issues with `key in (...)` JQL queries."""
+        found = self.find_issues(issue_ids)
+        missing = [self._issue_key(i) for i in issue_ids if i not in found]
+        if missing:
+            error(f"Issues not found in Jira: {', '.join(missing)}")
+        return [found[issue_id] for issue_id in issue_ids]
+
+    def find_issues(self, issue_ids: list[str]) -> dict[str, Issue]:
+        """Fetch the existing issues among issue_ids with `key in (...)` queries.
+
+        Keys are matched case-insensitively, so ids taken from lowercased
+        branch names are found too. Numeric ids without a project key, and
+        ids that are not Jira keys at all, are left out.
+        """
+        keys = {}
+        for issue_id in issue_ids:
+            key = self.resolve_issue_id(issue_id, {"project_key": self.project_key})
+            if self.is_jira_issue(key.upper()):
+                keys[issue_id] = key.upper()
+        unique_keys = list(dict.fromkeys(keys.values()))
+        found = {}
+        for start in range(0, len(unique_keys), self.BATCH_SIZE):
+            batch = unique_keys[start : start + self.BATCH_SIZE]
+            jql = f"key in ({', '.join(batch)})"
+            logging.debug(f"Jira bulk lookup: {jql}")
+            try:
+                # Unknown keys are skipped instead of failing the whole query
+                issues = self.client.search_issues(
+                    jql,
+                    maxResults=len(batch),
+                    validate_query=False,
+                    fields=self.FIELDS,
+                )
+            except self.JIRAError as e:
+                error(f"Failed to fetch Jira issues: {e.text}")
+            found.update({issue.key.upper(): issue for issue in issues})
+            if any(issue.key.upper() not in batch for issue in issues):
+                # Moved issues come back under their new key; look each up
+                found.update(self._find_moved(k for k in batch if k not in found))
+        return {
+            issue_id: self._to_issue(found[key])
+            for issue_id, key in keys.items()
+            if key in found
+        }
+
+    def _find_moved(self, keys) -> dict:
+        """Fetch issues one by one by their old keys, skipping unknown ones."""
+        moved = {}
+        for key in keys:
+            try:
+                moved[key] = self.client.issue(key, fields=self.FIELDS)
+            except self.JIRAError:
+                logging.debug(f"Jira issue {key} not found")
+        return moved
 
     def list_issues(self) -> list[dict]:
         """List open issues in the Jira project."""
@@ -163,12 +238,4 @@ class JiraTracker(IssueTracker):
             f'project = "{self.project_key}" AND ' if self.project_key else ""
         ) + "statusCategory != Done ORDER BY created DESC"
         issues = self.client.search_issues(jql)
-        return [
-            Issue(
-                id=issue.key,
-                title=issue.fields.summary,
-                type=issue.fields.issuetype.name,
-                assignee=self._get_assignee(issue),
-            )
-            for issue in issues
-        ]
+        return [self._to_issue(issue) for issue in issues]
@@ -17,6 +17,8 @@ class LinearTracker(IssueTracker):
     """Linear issue tracker."""
 
     API_URL = "https://api.linear.app/graphql"
+    # Largest page Linear returns, so one alias covers this many numbers
+    BATCH_SIZE = 250
 
     def __init__(self, token: str, team: str | None = None):
         """Construct LinearTracker object."""
@@ -90,8 +92,14 @@ class LinearTracker(IssueTracker):
             else None
         )
 
-    def get_issue(self, issue_id: str) -> dict:
-        """Fetch issue details by issue key (TEAM-123) or number."""
+    @classmethod
+    def resolve_issue_id(cls, issue_id: str, config: dict) -> str:
+        """Return the issue key for issue_id, prefixing numbers with the team."""
+        team = config.get("team")
+        return f"{team}-{issue_id}" if issue_id.isdigit() and team else issue_id
+
+    def _split_issue_id(self, issue_id: str) -> tuple[str, int]:
+        """Return (team key, number) for an issue key (TEAM-123) or number."""
         if issue_id.isdigit():
             if not self.team:
                 error(
@@ -106,7 +114,11 @@ class LinearTracker(IssueTracker):
             number = issue_id
         else:
             team_key, number = issue_id.split("-")
-        number = int(number)
+        return team_key, int(number)
+
+    def get_issue(self, issue_id: str) -> dict:
+        """Fetch issue details by issue key (TEAM-123) or number."""
+        team_key, number = self._split_issue_id(issue_id)
         query = """
             query ($teamKey: String!, $number: Float!) {
                 issues(
@@ -122,6 +134,10 @@ class LinearTracker(IssueTracker):
                         assignee {
                             displayName
                         }
+                        state {
+                            name
+                            type
+                        }
                     }
                 }
             }
@@ -131,13 +147,79 @@ class LinearTracker(IssueTracker):
         if not issues:
             error(f"Issue {team_key}-{number} not found in Linear.")
 
-        issue = issues[0]
+        return self._to_issue(issues[0])
+
+    def _to_issue(self, issue) -> Issue:
+        """Convert a Linear issue node into an Issue."""
+        state = issue.get("state") or {}
         return Issue(
             id=issue["identifier"],
             title=issue["title"],
             assignee=self._get_assignee(issue),
+            state=state.get("name"),
+            closed=state.get("type") in ("completed", "canceled"),
         )
 
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        """Fetch several issues in one GraphQL query using field aliases."""
+        found = self.find_issues(issue_ids)
+        for issue_id in issue_ids:
+            if issue_id not in found:
+                team_key, number = self._split_issue_id(issue_id)
+                error(f"Issue {team_key}-{number} not found in Linear.")
+        return [found[issue_id] for issue_id in issue_ids]
+
+    def find_issues(self, issue_ids: list[str]) -> dict[str, Issue]:
+        """Fetch the existing issues among issue_ids in one GraphQL query.
+
+        Numbers are grouped per team, with one aliased `number: { in: ... }`
+        filter per team and batch, so unknown issues are simply absent.
+        Identifiers are matched case-insensitively, and ids that are not
+        issue keys (or numbers without a team) are left out.
+        """
+        keys = {}
+        numbers = {}
+        for issue_id in issue_ids:
+            key = self.resolve_issue_id(issue_id, {"team": self.team}).upper()
+            match = re.fullmatch(r"([A-Z][A-Z0-9]*)-(\d+)", key)
+            if not match:
+                # e.g. a number without a team, or an ID from a branch name
+                continue
+            keys[issue_id] = key
+            numbers.setdefault(match[1], {})[int(match[2])] = None
+        batches = [
+            (team_key, list(team_numbers)[start : start + self.BATCH_SIZE])
+            for team_key, team_numbers in numbers.items()
+            for start in range(0, len(team_numbers), self.BATCH_SIZE)
+        ]
+        if not batches:
+            return {}
+        params = ", ".join(
+            f"$t{i}: String!, $n{i}: [Float!]" for i in range(len(batches))
+        )
+        fields = "\n".join(
+            f"b{i}: issues(first: {self.BATCH_SIZE}, filter: "
+            f"{{ team: {{ key: {{ eq: $t{i} }} }}, number: {{ in: $n{i} }} }}) "
+            "{ nodes { identifier title assignee { displayName } "
+            "state { name type } } }"
+            for i in range(len(batches))
+        )
+        variables = {}
+        for i, (team_key, batch) in enumerate(batches):
+            variables[f"t{i}"] = team_key
+            variables[f"n{i}"] = batch
+        data = self._graphql_request(f"query ({params}) {{ {fields} }}", variables)
+        found = {
+            issue["identifier"].upper(): issue
+            for i in range(len(batches))
+            for issue in (data.get(f"b{i}") or {}).get("nodes", [])
+        }
+        return {
+            issue_id: self._to_issue(found[key])
+            for issue_id, key in keys.items()
+            if key in found
+        }
+
     def list_issues(self) -> list[dict]:
         """List open issues from the Linear team (if configured)."""
         team_filter = 'team: { key: { eq: "%s" } },' % self.team if self.team else ""  # noqa: UP031
@@ -154,6 +236,10 @@ class LinearTracker(IssueTracker):
                         assignee {
                             displayName
                         }
+                        state {
+                            name
+                            type
+                        }
                     }
                 }
             }
@@ -162,11 +248,4 @@ class LinearTracker(IssueTracker):
         )
         data = self._graphql_request(query)
         issues = data.get("issues", {}).get("nodes", [])
-        return [
-            Issue(
-                id=issue["identifier"],
-                title=issue["title"],
-                assignee=self._get_assignee(issue),
-            )
-            for issue in issues
-        ]
+        return [self._to_issue(issue) for issue in issues]
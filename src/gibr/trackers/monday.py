@@ -3,11 +3,11 @@
 import re
 
 import click
-from slugify import slugify
 
 from gibr.issue import Issue
 from gibr.notify import error
 from gibr.registry import register_tracker
+from gibr.slug import slugify
 
 from .base import IssueTracker
 
@@ -17,6 +17,10 @@ class MondayTracker(IssueTracker):
     """monday.dev issue tracker."""
 
     API_URL = "https://api.monday.com/v2"
+    # Maximum number of items returned by a single `items` query
+    BATCH_SIZE = 100
+    # Status labels treated as done
+    DONE_STATUSES = ("done", "complete", "completed")
 
     def __init__(self, token: str, board_id: str):
         """Construct MondayTracker object."""
@@ -65,6 +69,24 @@ class MondayTracker(IssueTracker):
                 return slugify(col.get("text")) or None
         return None
 
+    def _get_status(self, item):
+        """Extract the status label from a monday.dev item."""
+        for col in item.get("column_values", []):
+            if col.get("type") == "status":
+                return col.get("text") or None
+        return None
+
+    def _to_issue(self, item) -> Issue:
+        """Convert a monday.dev item into an Issue."""
+        status = self._get_status(item)
+        return Issue(
+            id=item["id"],
+            title=item["name"],
+            assignee=self._get_assignee(item),
+            state=status,
+            closed=bool(status) and status.lower() in self.DONE_STATUSES,
+        )
+
     def get_issue(self, issue_id: str):
         """Fetch issue details by item ID."""
         if not issue_id.isdigit():
@@ -96,13 +118,54 @@ class MondayTracker(IssueTracker):
         if not items:
             error(f"Issue {issue_id} not found on Monday board {self.board_id}.")
 
-        item = items[0]
+        return self._to_issue(items[0])
 
-        return Issue(
-            id=item["id"],
-            title=item["name"],
-            assignee=self._get_assignee(item),
-        )
+    def get_issues(self, issue_ids: list[str]) -> list[Issue]:
+        """Fetch several items with `items(ids: [...])` queries."""
+        for issue_id in issue_ids:
+            if not issue_id.isdigit():
+                error(f"Monday.dev requires numeric item IDs. Received: {issue_id}")
+        found = self.find_issues(issue_ids)
+        missing = [issue_id for issue_id in issue_ids if issue_id not in found]
+        if missing:
+            error(
+                f"Issues not found on Monday board {self.board_id}: "
+                f"{', '.join(missing)}"
+            )
+        return [found[issue_id] for issue_id in issue_ids]
+
+    def find_issues(self, issue_ids: list[str]) -> dict[str, Issue]:
+        """Fetch the existing items among issue_ids with `items(ids: [...])`.
+
+        Item IDs are numeric, so other ids are left out.
+        """
+        query = """
+            query ($item_ids: [ID!]) {
+            items(ids: $item_ids, limit: 100) {
+                id
+                name
+                column_values {
+                id
+                type
+                text
+                value
+                }
+            }
+            }
+        """
+        unique_ids = [i for i in dict.fromkeys(issue_ids) if i.isdigit()]
+        found = {}
+        for start in range(0, len(unique_ids), self.BATCH_SIZE):
+            batch = unique_ids[start : start + self.BATCH_SIZE]
+            data = self._graphql_request(
+                query, {"item_ids": [int(issue_id) for issue_id in batch]}
+            )
+            found.update({str(item["id"]): item for item in data.get("items", [])})
+        return {
+            issue_id: self._to_issue(found[issue_id])
+            for issue_id in issue_ids
+            if issue_id in found
+        }
 
     def list_issues(self):
         """List open issues on a monday.dev board."""
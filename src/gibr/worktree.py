@@ -0,0 +1,167 @@
+"""Create and manage branch worktrees so the current checkout stays untouched."""
+
+import logging
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from gibr.git import RefIndex, start_commit
+from gibr.notify import error, info, success
+from gibr.pushqueue import queue_push
+
+if TYPE_CHECKING:
+    from git import Repo
+
+POOL_DIRNAME = ".pool"
+
+
+def worktree_root(repo: "Repo", worktree_dir: str | None = None) -> Path:
+    """Return the directory new worktrees are created in.
+
+    Defaults to a `<repo>.worktrees` directory next to the main checkout.
+    """
+    main_checkout = Path(repo.common_dir).resolve().parent
+    if worktree_dir:
+        return (main_checkout / Path(worktree_dir).expanduser()).resolve()
+    return main_checkout.parent / f"{main_checkout.name}.worktrees"
+
+
+def list_worktrees(repo: "Repo") -> list[dict]:
+    """Return worktrees as dicts with path, head, branch and prunable.
+
+    branch is None for detached worktrees; prunable holds git's reason
+    when the worktree directory has gone missing.
+    """
+    worktrees = []
+    for block in repo.git.worktree("list", "--porcelain").split("\n\n"):
+        entry = {"branch": None, "prunable": None}
+        for line in block.splitlines():
+            key, _, value = line.partition(" ")
+            if key == "worktree":
+                entry["path"] = value
+            elif key == "HEAD":
+                entry["head"] = value
+            elif key == "branch":
+                entry["branch"] = value.removeprefix("refs/heads/")
+            elif key == "prunable":
+                entry["prunable"] = value
+        if "path" in entry:
+            worktrees.append(entry)
+    return worktrees
+
+
+def prune_worktrees(repo: "Repo") -> list[dict]:
+    """Forget worktrees whose directories were deleted; return them."""
+    stale = [w for w in list_worktrees(repo) if w["prunable"]]
+    repo.git.worktree("prune")
+    return stale
+
+
+def _pool_dir(repo: "Repo", worktree_dir: str | None) -> Path:
+    """Return the directory holding pre-created worktrees."""
+    return worktree_root(repo, worktree_dir) / POOL_DIRNAME
+
+
+def _in_pool(worktree: dict, pool: Path) -> bool:
+    """Return True if worktree lives in the pool directory."""
+    return Path(worktree["path"]).resolve().parent == pool.resolve()
+
+
+def fill_pool(repo: "Repo", size: int, worktree_dir: str | None = None) -> int:
+    """Pre-create detached worktrees until the pool holds size of them.
+
+    Returns the number of worktrees added.
+    """
+    pool = _pool_dir(repo, worktree_dir)
+    existing = [w for w in list_worktrees(repo) if _in_pool(w, pool)]
+    added = 0
+    for _ in range(size - len(existing)):
+        repo.git.worktree("add", "--detach", str(pool / uuid.uuid4().hex[:8]))
+        added += 1
+    return added
+
+
+def _take_from_pool(repo: "Repo", worktree_dir: str | None) -> Path | None:
+    """Return a clean pooled worktree, or None if the pool is empty."""
+    from git import Repo
+
+    pool = _pool_dir(repo, worktree_dir)
+    for worktree in list_worktrees(repo):
+        if _in_pool(worktree, pool) and worktree["branch"] is None:
+            path = Path(worktree["path"])
+            if not Repo(path).is_dirty(untracked_files=True):
+                return path
+    return None
+
+
+def create_worktree(  # noqa: PLR0913
+    branch_name: str,
+    *,
+    path: str | None = None,
+    worktree_dir: str | None = None,
+    sparse_paths: tuple[str, ...] = (),
+    is_push: bool = True,
+    push_async: bool = False,
+    start_point: str | None = None,
+) -> Path:
+    """Create branch_name at start_point (default HEAD) in its own worktree.
+
+    The path defaults to the branch name below the worktree root. A
+    worktree from the pool is reused when available, so that only files
+    differing from HEAD have to be written.
+    """
+    from git import GitCommandError, Repo
+
+    try:
+        repo = Repo(".")
+        if not repo.head.is_valid():
+            error("Please make an initial commit before using gibr.")
+
+        target = Path(path) if path else worktree_root(repo, worktree_dir) / branch_name
+        if target.exists():
+            error(f"Worktree path already exists: {target}")
+        exists = RefIndex.for_path(".").branch_exists(branch_name)
+        start = start_commit(repo, start_point)
+
+        pooled = None if sparse_paths else _take_from_pool(repo, worktree_dir)
+        if pooled:
+            logging.debug(f"Reusing pooled worktree {pooled}")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            repo.git.worktree("move", str(pooled), str(target))
+            worktree = Repo(target)
+            if exists:
+                worktree.git.checkout(branch_name)
+            else:
+                worktree.git.checkout("-b", branch_name, start)
+        else:
+            args = ["add"]
+            if sparse_paths:
+                args.append("--no-checkout")
+            args += (
+                [str(target), branch_name]
+                if exists
+                else ["-b", branch_name, str(target), start]
+            )
+            repo.git.worktree(*args)
+            worktree = Repo(target)
+            if sparse_paths:
+                worktree.git.sparse_checkout("set", "--cone", *sparse_paths)
+                worktree.git.checkout()
+        success(f"Created worktree for '{branch_name}' at {target}")
+
+        if is_push and push_async:
+            queue_push(repo.common_dir, "origin", [branch_name])
+            info(f"Pushing '{branch_name}' to origin in the background.")
+        elif is_push:
+            push_result = worktree.remote(name="origin").push(
+                refspec=f"{branch_name}:{branch_name}", set_upstream=True
+            )
+            push_result.raise_if_error()
+            success(f"Pushed branch '{branch_name}' to origin.")
+        worktree.close()
+        repo.close()
+        info(f"Switch to it with: cd {target}")
+        return target
+
+    except GitCommandError as e:
+        error(f"Git command failed: {e}")
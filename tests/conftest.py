@@ -0,0 +1,95 @@
+"""Shared pytest fixtures."""
+
+import http.server
+import subprocess
+import threading
+import time
+
+import pytest
+
+# Seconds the test HTTP server takes to answer /slow
+SLOW_SECONDS = 0.3
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "gibr",
+    "GIT_AUTHOR_EMAIL": "gibr@example.com",
+    "GIT_COMMITTER_NAME": "gibr",
+    "GIT_COMMITTER_EMAIL": "gibr@example.com",
+}
+
+
+def git(cwd, *args):
+    """Run a git command in cwd and return its stripped stdout."""
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """Run every test outside the checkout and the user's cache directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("GIBR_CONFIG", raising=False)
+    monkeypatch.delenv("GIBR_OTLP_FILE", raising=False)
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Create a repo with one commit and a bare origin, and chdir into it."""
+    for key, value in GIT_ENV.items():
+        monkeypatch.setenv(key, value)
+    origin = tmp_path / "origin.git"
+    repo = tmp_path / "repo"
+    git(tmp_path, "init", "--bare", "-b", "main", str(origin))
+    git(tmp_path, "init", "-b", "main", str(repo))
+    (repo / "README.md").write_text("hello\n")
+    git(repo, "add", "README.md")
+    git(repo, "commit", "-m", "initial")
+    git(repo, "remote", "add", "origin", str(origin))
+    git(repo, "push", "-u", "origin", "main")
+    monkeypatch.chdir(repo)
+    return repo
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Answer GET with a small body, POST with 201 and /flaky with 503 once.
+
+    /slow answers after SLOW_SECONDS.
+    """
+
+    flaky = 0
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # noqa: N802
+        """Answer a GET request."""
+        if self.path == "/slow":
+            time.sleep(SLOW_SECONDS)
+        if self.path == "/flaky" and Handler.flaky == 0:
+            Handler.flaky += 1
+            self._reply(503, b"")
+        else:
+            self._reply(200, b"hello")
+
+    def do_POST(self):  # noqa: N802
+        """Answer a POST request."""
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(201, b"ok")
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Serve Handler on a free local port; yield its base URL."""
+    httpd = http.server.ThreadingHTTPServer(("localhost", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    Handler.flaky = 0
+    yield f"http://localhost:{httpd.server_address[1]}"
+    httpd.shutdown()
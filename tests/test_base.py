@@ -103,3 +103,17 @@ def test_graphql_request_handles_graphql_errors(mock_post, mock_error):
 
     mock_error.assert_called_once()
     assert "Some GraphQL failure" in str(mock_error.call_args[0][0])
+
+
+def test_get_issues_defaults_to_get_issue_per_id():
+    """The default get_issues should call get_issue for each id in order."""
+    tracker = DummyTracker()
+    with patch.object(tracker, "get_issue", side_effect=lambda i: f"issue-{i}"):
+        assert tracker.get_issues(["1", "2"]) == ["issue-1", "issue-2"]
+
+
+def test_iter_issues_defaults_to_list_issues():
+    """iter_issues should yield what list_issues returns."""
+    tracker = DummyTracker()
+    with patch.object(DummyTracker, "list_issues", return_value=["a", "b"]):
+        assert list(tracker.iter_issues()) == ["a", "b"]
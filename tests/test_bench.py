@@ -0,0 +1,167 @@
+"""Tests for the bench command."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from gibr.cli.bench import bench, percentile
+from gibr.issue import Issue
+
+
+class FakeTracker:
+    """Tracker making one request per call to a local server."""
+
+    numeric_issues = True
+    display_name = "Fake"
+
+    def __init__(self, url, issues=("7",)):
+        """Construct FakeTracker object, fetching the repository like GitHub."""
+        self.url = url
+        self.issues = [Issue(id=i, title="Fix login", assignee=None) for i in issues]
+        self.session = requests.Session()
+        self.session.get(f"{url}/repos/o/r")
+
+    def get_issue(self, issue_id):
+        """Fetch one issue."""
+        self.session.get(f"{self.url}/issues/{issue_id}")
+        return Issue(id=issue_id, title="Fix login", assignee=None)
+
+    def iter_issues(self):
+        """Fetch the open issues."""
+        self.session.get(f"{self.url}/issues")
+        yield from self.issues
+
+    def list_issues(self):
+        """Fetch the open issues as a list."""
+        return list(self.iter_issues())
+
+
+def _obj(factory):
+    """Return the context object bench gets from the cli group."""
+    config = MagicMock()
+    config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}-{title}"},
+        "issue-tracker": {"name": "github"},
+    }
+    return {"config": config, "tracker_factory": factory}
+
+
+@pytest.mark.parametrize("pct,expected", [(50, 3), (95, 5), (99, 5), (0, 1)])
+def test_percentile_uses_nearest_rank(pct, expected):
+    """Percentiles should be values from the sample."""
+    assert percentile([5, 1, 4, 2, 3], pct) == expected
+
+
+def test_bench_times_every_operation_cold_and_warm(http_server, git_repo):
+    """Bench should report each operation with its requests per run."""
+    runner = CliRunner()
+
+    result = runner.invoke(
+        bench, ["-n", "2"], obj=_obj(lambda: FakeTracker(http_server))
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "using issue 7" in result.output
+    rows = {
+        tuple(cells[1:3]): cells
+        for cells in (
+            [cell.strip() for cell in line.split("|")]
+            for line in result.output.splitlines()
+            if line.startswith("| ") and "Operation" not in line
+        )
+    }
+    assert set(rows) == {
+        ("construct", "cold"),
+        *(
+            (op, mode)
+            for op in ("get_issue", "list_issues", "iter_issues", "create")
+            for mode in ("cold", "warm")
+        ),
+    }
+    # Requests per run: constructing fetches the repository, get_issue one issue
+    assert rows[("construct", "cold")][6] == "1.0"
+    assert rows[("get_issue", "warm")][6] == "1.0"
+    assert rows[("create", "warm")][6] == "1.0"
+    assert float(rows[("get_issue", "warm")][8]) > 0
+    # create --dry-run made no branch and cached nothing
+    assert not (git_repo / ".git" / "refs" / "heads" / "7-fix-login").exists()
+    assert not (git_repo / ".git" / "gibr" / "issues.json").exists()
+
+
+@patch("gibr.cli.create.call_with_deadline")
+def test_bench_times_create_without_offline_deadline(
+    mock_deadline, http_server, git_repo
+):
+    """Create should run inline so a slow tracker is timed, not cut off."""
+    mock_deadline.side_effect = lambda func, timeout: func()
+
+    result = CliRunner().invoke(
+        bench,
+        ["-n", "1", "--only", "create"],
+        obj=_obj(lambda: FakeTracker(http_server)),
+    )
+
+    assert result.exit_code == 0, result.output
+    assert {call.args[1] for call in mock_deadline.call_args_list} == {0}
+
+
+def test_bench_constructs_once_per_cold_construct_run(http_server):
+    """Construct runs should not build a second tracker as their setup."""
+    factory = MagicMock(side_effect=lambda: FakeTracker(http_server))
+
+    result = CliRunner().invoke(
+        bench, ["-n", "3", "--only", "construct", "--issue", "7"], obj=_obj(factory)
+    )
+
+    assert result.exit_code == 0, result.output
+    # One tracker for bench itself, then one per run
+    assert factory.call_count == 4  # noqa: PLR2004
+
+
+def test_bench_saves_and_compares_against_baseline(http_server, tmp_path):
+    """Results saved with --save should be comparable with --baseline."""
+    obj = _obj(lambda: FakeTracker(http_server))
+    saved = tmp_path / "baseline.json"
+    runner = CliRunner()
+
+    result = runner.invoke(
+        bench, ["-n", "1", "--only", "get_issue", "--save", str(saved)], obj=obj
+    )
+    assert result.exit_code == 0, result.output
+    results = json.loads(saved.read_text())["results"]
+    assert set(results) == {"get_issue/cold", "get_issue/warm"}
+    assert results["get_issue/warm"]["requests"] == 1
+
+    result = runner.invoke(
+        bench,
+        ["-n", "1", "--only", "get_issue", "--baseline", str(saved)],
+        obj=obj,
+    )
+    assert result.exit_code == 0, result.output
+    assert "p50 vs baseline" in result.output
+    assert "%" in result.output.splitlines()[-1]
+
+
+def test_bench_needs_an_issue(http_server):
+    """Without open issues bench should ask for one."""
+    result = CliRunner().invoke(
+        bench, obj=_obj(lambda: FakeTracker(http_server, issues=()))
+    )
+    assert result.exit_code == 1
+    assert "No open issues to fetch; pass --issue." in result.output
+
+
+def test_bench_rejects_unreadable_baseline(http_server, tmp_path):
+    """A baseline that is not saved results should be an error."""
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text("[]")
+    result = CliRunner().invoke(
+        bench,
+        ["--baseline", str(baseline)],
+        obj=_obj(lambda: FakeTracker(http_server)),
+    )
+    assert result.exit_code == 1
+    assert "Can't read baseline" in result.output
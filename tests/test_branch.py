@@ -0,0 +1,108 @@
+"""Tests for gibr.branch."""
+
+import subprocess
+
+import pytest
+
+from gibr.branch import BranchName, check_ref_format
+from gibr.issue import Issue
+
+
+def _issue(**kwargs):
+    """Return an issue with defaults for the fields not given."""
+    return Issue(
+        **{"id": 12, "title": "Fix the login page", "assignee": "Jane", **kwargs}
+    )
+
+
+def test_generate_plain_placeholders():
+    """Plain placeholders should render like str.format."""
+    branch = BranchName("{issuetype}/{issue}-{title}")
+    assert branch.generate(_issue(type="bug")) == "bug/12-fix-the-login-page"
+    assert branch.fields == {"issuetype", "issue", "title"}
+
+
+def test_generate_with_filters():
+    """Filters should be applied left to right."""
+    branch = BranchName(
+        "{issuetype|map:bug=fix,feature=feat}/{assignee|lower}/{issue}"
+        "-{title|truncate:8|upper}"
+    )
+    assert branch.generate(_issue(type="bug")) == "fix/jane/12-FIX-THE"
+    assert branch.generate(_issue(type="task")) == "task/jane/12-FIX-THE"
+
+
+def test_generate_with_format_spec():
+    """str.format specs on plain placeholders should keep working."""
+    assert BranchName("{issue:05}-{title:.7}").generate(_issue()) == "00012-fix-the"
+    with pytest.raises(ValueError, match="does not apply to title"):
+        BranchName("{title:05d}").generate(_issue())
+
+
+@pytest.mark.parametrize(
+    ("format_string", "message"),
+    [
+        ("{id}-{title}", "Unknown placeholder in format: id"),
+        ("{id:.3}", "Unknown placeholder in format: id"),
+        ("{title|reverse}", "Unknown filter in format: reverse"),
+        ("{title|truncate:many}", "truncate needs a length"),
+        ("{title|lower:1}", "lower takes no argument"),
+        ("{issuetype|map:bug}", "map needs old=new pairs"),
+        ("{title!r}", "Unsupported placeholder"),
+        ("{issue", "Invalid format"),
+    ],
+)
+def test_invalid_format_is_rejected_when_compiled(format_string, message):
+    """Mistakes in the format should be reported before any issue is seen."""
+    with pytest.raises(ValueError, match=message):
+        BranchName(format_string)
+
+
+def test_generate_rejects_invalid_ref():
+    """Names git would reject should raise ValueError."""
+    with pytest.raises(ValueError, match="contains '..'"):
+        BranchName("{issue}..{title}").generate(_issue())
+    with pytest.raises(ValueError, match="longer than 255 bytes"):
+        BranchName("{issue}-{title}").generate(_issue(title="word " * 60))
+    assert BranchName("{issue}-{title|truncate:200}").generate(_issue(title="w " * 200))
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "12-fix",
+        "feature/PROJ-12_fix",
+        "v1.2/fix",
+        "fix.locked",
+        "",
+        "-fix",
+        "@",
+        "HEAD",
+        "a@{b",
+        "fix..it",
+        "fix/.hidden",
+        ".fix",
+        "fix.lock",
+        "fix.lock/more",
+        "fix.",
+        "fix/",
+        "/fix",
+        "a//b",
+        "with space",
+        "tab\there",
+        "a~b",
+        "a^b",
+        "a:b",
+        "a?b",
+        "a*b",
+        "a[b",
+        "a\\b",
+        "ünïcödé/ok",
+    ],
+)
+def test_check_ref_format_agrees_with_git(name):
+    """check_ref_format should accept exactly what git accepts."""
+    git = subprocess.run(
+        ["git", "check-ref-format", "--branch", name], capture_output=True
+    )
+    assert (check_ref_format(name) is None) == (git.returncode == 0)
@@ -0,0 +1,92 @@
+"""Tests for the branches command."""
+
+from unittest.mock import MagicMock
+
+from click.testing import CliRunner
+
+from gibr.branchindex import BranchIndex, branch_issue_ids
+from gibr.cli.branches import branches
+from gibr.issue import Issue
+from tests.conftest import git
+
+
+def _config(branch_name_format="{issue}-{title}"):
+    """Return a config object as loaded by the cli group."""
+    config = MagicMock()
+    config.config = {
+        "DEFAULT": {"branch_name_format": branch_name_format},
+        "issue-tracker": {"name": "github"},
+    }
+    return config
+
+
+def _tracker(*issues):
+    """Return a GitHub-like tracker whose find_issues knows issues."""
+    known = {str(issue.id): issue for issue in issues}
+    tracker = MagicMock(numeric_issues=True)
+    tracker.find_issues.side_effect = lambda ids: {
+        i: known[i] for i in ids if i in known
+    }
+    return tracker
+
+
+def test_branch_issue_ids(git_repo):
+    """Recorded branches come from the index, others from the format."""
+    index = BranchIndex.for_repo()
+    index.record("jira", Issue(id="PROJ-1", title="A", assignee=None), "my-work")
+    names = ["main", "my-work", "feature/PROJ-2-b", "feature/x"]
+
+    assert branch_issue_ids(names, index, "feature/{issue}-{title}") == {
+        "my-work": "PROJ-1",
+        "feature/PROJ-2-b": "PROJ-2",
+    }
+    assert branch_issue_ids(names, None, "{title}") == {}
+
+
+def test_branches_lists_issue_states_in_bulk(git_repo):
+    """All branch issues should be looked up with one bulk call."""
+    for name in ("12-fix-login", "13-add-logout", "14-gone", "wip", "PROJ-1-x"):
+        git(git_repo, "branch", name)
+    tracker = _tracker(
+        Issue(id=12, title="Fix", assignee="me", state="open"),
+        Issue(id=13, title="Add", assignee=None, state="closed", closed=True),
+    )
+
+    result = CliRunner().invoke(
+        branches, [], obj={"config": _config(), "tracker": tracker}
+    )
+
+    assert result.exit_code == 0
+    rows = {
+        cells[0]: cells[1:]
+        for line in result.output.splitlines()
+        if (cells := [cell.strip() for cell in line.strip("|").split("|")])
+    }
+    assert rows["12-fix-login"] == ["12", "open", "me"]
+    assert rows["13-add-logout"] == ["13", "closed", ""]
+    assert rows["14-gone"] == ["14", "not found", ""]
+    assert rows["wip"] == ["", "", ""]
+    assert rows["PROJ-1-x"] == ["", "", ""]
+    tracker.find_issues.assert_called_once_with(["12", "13", "14"])
+
+    # A second run is served from the issue cache
+    CliRunner().invoke(branches, [], obj={"config": _config(), "tracker": tracker})
+    tracker.find_issues.assert_called_with(["14"])
+
+
+def test_branches_without_issue_branches(git_repo):
+    """A repository without issue branches should say so."""
+    result = CliRunner().invoke(
+        branches, [], obj={"config": _config("{title}"), "tracker": _tracker()}
+    )
+    assert "No branches belong to an issue." in result.output
+    assert "| main" in result.output
+
+
+def test_branches_outside_repository():
+    """The command should fail outside a repository."""
+    result = CliRunner().invoke(
+        branches, [], obj={"config": _config(), "tracker": _tracker()}
+    )
+    assert result.exit_code != 0
+    assert "Not inside a git repository." in result.output
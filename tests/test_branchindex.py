@@ -0,0 +1,117 @@
+"""Tests for gibr.branchindex and the switch command."""
+
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from gibr.branchindex import BranchIndex, issue_key
+from gibr.cli.switch import switch
+from gibr.git import RefIndex
+from gibr.issue import Issue
+from tests.conftest import git
+
+
+def _config():
+    """Return a config object as loaded by the cli group."""
+    config = MagicMock()
+    config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}-{title}", "push": "false"},
+        "issue-tracker": {"name": "jira"},
+    }
+    return config
+
+
+def test_issue_key_is_normalized():
+    """Issue keys should ignore case and a leading #."""
+    assert issue_key("jira", "PROJ-12") == issue_key("jira", "proj-12")
+    assert issue_key("github", "#12") == issue_key("github", 12) == "github:12"
+
+
+def test_record_and_find(git_repo):
+    """The newest recorded branch that still exists should be found."""
+    index = BranchIndex.for_repo()
+    refs = RefIndex(index.git_dir)
+    issue = Issue(id="PROJ-12", title="Fix login", assignee=None)
+    for name in ("proj-12-fix-login", "proj-12-fix-login-2"):
+        git(git_repo, "branch", name)
+        index.record("jira", issue, name)
+
+    assert index.find("jira", "proj-12", refs)["branch"] == "proj-12-fix-login-2"
+    git(git_repo, "branch", "-D", "proj-12-fix-login-2")
+    assert index.find("jira", "PROJ-12", refs)["branch"] == "proj-12-fix-login"
+    assert index.find("jira", "PROJ-13", refs) is None
+    assert index.find("github", "PROJ-12", refs) is None
+
+
+def test_find_follows_renamed_branch(git_repo):
+    """A branch renamed with `git branch -m` should still be found."""
+    index = BranchIndex.for_repo()
+    git(git_repo, "branch", "12-old")
+    index.record("github", Issue(id=12, title="Old", assignee=None), "12-old")
+    git(git_repo, "branch", "-m", "12-old", "12-new")
+
+    entry = index.find("github", "12", RefIndex(index.git_dir))
+    assert entry["branch"] == "12-new"
+    assert entry["title"] == "Old"
+    assert index.entries("github", 12)[-1]["branch"] == "12-new"
+
+    git(git_repo, "branch", "-D", "12-new")
+    assert index.find("github", "12", RefIndex(index.git_dir)) is None
+
+
+def test_switch_checks_out_recorded_branch(git_repo):
+    """`gibr switch` should check out the branch recorded for the issue."""
+    git(git_repo, "branch", "proj-12-fix-login")
+    BranchIndex.for_repo().record(
+        "jira",
+        Issue(id="PROJ-12", title="Fix login", assignee=None),
+        "proj-12-fix-login",
+    )
+
+    result = CliRunner().invoke(switch, ["PROJ-12"], obj={"config": _config()})
+
+    assert result.exit_code == 0
+    assert "Switched to branch 'proj-12-fix-login' (Fix login)." in result.output
+    assert git(git_repo, "branch", "--show-current") == "proj-12-fix-login"
+
+
+def test_switch_resolves_number_with_project_key(git_repo):
+    """`gibr switch 12` should find PROJ-12 like `gibr create 12` would."""
+    git(git_repo, "branch", "proj-12-fix-login")
+    BranchIndex.for_repo().record(
+        "jira",
+        Issue(id="PROJ-12", title="Fix login", assignee=None),
+        "proj-12-fix-login",
+    )
+    config = _config()
+    config.config["jira"] = {"project_key": "PROJ"}
+
+    result = CliRunner().invoke(switch, ["12"], obj={"config": config})
+
+    assert result.exit_code == 0, result.output
+    assert git(git_repo, "branch", "--show-current") == "proj-12-fix-login"
+
+
+@patch("gibr.cli.switch.get_tracker")
+def test_switch_offers_to_create_missing_branch(mock_get_tracker, git_repo):
+    """Without a recorded branch, switch should create one and record it."""
+    tracker = mock_get_tracker.return_value
+    tracker.numeric_issues = False
+    tracker.get_issue.return_value = Issue(id="PROJ-7", title="New", assignee=None)
+
+    result = CliRunner().invoke(
+        switch, ["PROJ-7"], obj={"config": _config()}, input="y\n"
+    )
+
+    assert result.exit_code == 0
+    assert "No branch found for issue PROJ-7." in result.output
+    assert git(git_repo, "branch", "--show-current") == "PROJ-7-new"
+    entry = BranchIndex.for_repo().find("jira", "proj-7", RefIndex(git_repo / ".git"))
+    assert entry["branch"] == "PROJ-7-new"
+
+
+def test_switch_outside_repo():
+    """`gibr switch` should fail outside a git repository."""
+    result = CliRunner().invoke(switch, ["12"], obj={"config": _config()})
+    assert result.exit_code != 0
+    assert "Not inside a git repository." in result.output
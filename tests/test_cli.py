@@ -6,12 +6,14 @@ from unittest.mock import MagicMock, patch
 from click.testing import CliRunner
 
 from gibr.cli import cli
+from gibr.issue import Issue
+from tests.conftest import git
 
 
 @patch("gibr.cli.get_tracker", return_value=MagicMock())
 @patch("gibr.cli.alias.success", return_value=None)
 @patch("gibr.cli.alias.party", return_value=None)
-@patch("gibr.cli.alias.GitConfigParser", return_value=MagicMock())
+@patch("git.GitConfigParser", return_value=MagicMock())
 @patch("gibr.cli.GibrConfig", return_value=MagicMock())
 def test_alias_command_creates_git_aliases(
     _mock_gibr_config,
@@ -40,57 +42,103 @@ def test_alias_command_creates_git_aliases(
 
 
 @patch("gibr.git.success", return_value=None)
-@patch("gibr.git.Repo", return_value=MagicMock())
 @patch("gibr.cli.get_tracker", return_value=MagicMock())
 @patch("gibr.cli.GibrConfig", return_value=MagicMock())
 def test_create_command_creates_branch_and_pushes_to_origin(
     mock_config,
     mock_get_tracker,
-    mock_repo,
     mock_success,
+    git_repo,
 ):
     """Integration test for 'gibr create <issue_number>' command."""
     runner = CliRunner()
 
-    repo_instance = mock_repo.return_value
-    repo_instance.is_dirty.return_value = False
-
     # Mock tracker + issue
     tracker_instance = mock_get_tracker.return_value
-    issue = MagicMock(
-        id=17, title="Fix login bug", type="issue", sanitized_title="fix-login-bug"
-    )
+    issue = Issue(id=17, title="Fix login bug", assignee=None)
     tracker_instance.get_issue.return_value = issue
 
     # Mock config
     cfg_instance = mock_config.return_value
     cfg_instance.load.return_value = cfg_instance
-    cfg_instance.config = {"DEFAULT": {"branch_name_format": "{issue}-{title}"}}
+    cfg_instance.config = {
+        "DEFAULT": {"branch_name_format": "{issue}-{title}"},
+        "issue-tracker": {"name": "github"},
+    }
 
     result = runner.invoke(cli, ["create", "17"])
     assert result.exit_code == 0
 
     mock_success.assert_any_call("Checked out branch: 17-fix-login-bug")
     mock_success.assert_any_call("Pushed branch '17-fix-login-bug' to origin.")
+    assert "refs/heads/17-fix-login-bug" in git(git_repo, "ls-remote", "origin")
 
 
 @patch("gibr.cli.get_tracker")
 @patch("gibr.cli.GibrConfig")
 @patch("gibr.git.warning")
-@patch("gibr.git.Repo")
-def test_create_command_dirty_repo(mock_repo, mock_warning, *_):
+def test_create_command_dirty_repo(
+    mock_warning, mock_config, mock_get_tracker, git_repo
+):
     """Integration test for 'gibr create <issue_number>' when repo is dirty."""
     runner = CliRunner()
+    cfg_instance = mock_config.return_value
+    cfg_instance.load.return_value = cfg_instance
+    cfg_instance.config = {
+        "DEFAULT": {"branch_name_format": "branch-{issue}", "push": "false"},
+        "issue-tracker": {"name": "github"},
+    }
 
-    mock_repo = MagicMock()
-    mock_repo.is_dirty.return_value = True
-    mock_repo.return_value = mock_repo
+    mock_get_tracker.return_value.get_issue.return_value = Issue(
+        id=42, title="Dirty", assignee=None
+    )
+    (git_repo / "README.md").write_text("changed\n")
     result = runner.invoke(cli, ["create", "42"])
 
     assert result.exit_code == 0
     mock_warning.assert_any_call("Working tree is dirty — uncommitted changes present.")
 
 
+@patch("gibr.cli.get_tracker")
+@patch("gibr.cli.GibrConfig")
+def test_git_alias_keeps_command_options_in_place(
+    mock_config, mock_get_tracker, git_repo
+):
+    """Under the git alias only the group's own options move to the front."""
+    cfg_instance = mock_config.return_value
+    cfg_instance.load.return_value = cfg_instance
+    cfg_instance.config = {
+        "DEFAULT": {"branch_name_format": "{issue}-{title}", "push": "false"},
+        "issue-tracker": {"name": "github"},
+    }
+    mock_get_tracker.return_value.get_issue.return_value = Issue(
+        id=12, title="Fix login", assignee=None
+    )
+    trace = git_repo / "trace.ndjson"
+
+    result = CliRunner().invoke(
+        cli,
+        ["git", "create", "12", "--from", "origin/main", "--trace-file", str(trace)],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Fetching origin/main." in result.output
+    assert git(git_repo, "branch", "--show-current") == "12-fix-login"
+    assert trace.exists()
+
+
+@patch("gibr.cli.get_tracker")
+@patch("gibr.cli.GibrConfig")
+def test_worktrees_command_skips_tracker(mock_config, mock_get_tracker, git_repo):
+    """'gibr worktrees' only needs config and git, not the tracker."""
+    mock_config.return_value.load.return_value.config = {"DEFAULT": {}}
+
+    result = CliRunner().invoke(cli, ["worktrees"])
+
+    assert result.exit_code == 0, result.output
+    mock_get_tracker.assert_not_called()
+
+
 def test_cli_shows_help():
     """Basic test to ensure CLI runs and shows top-level help."""
     runner = CliRunner()
@@ -0,0 +1,159 @@
+"""Tests for gibr.commitmsg and the hook commands."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from gibr.branchindex import BranchIndex
+from gibr.cli.hook import hook
+from gibr.commitmsg import commit_msg_format, format_message, main
+from gibr.issue import Issue
+from tests.conftest import git
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+def test_format_message():
+    """Only the subject line should be rewritten, and only once."""
+    fmt = "{issue}: {message}"
+    assert format_message("Fix it\n\nBody\n", fmt, "PROJ-1", "") == (
+        "PROJ-1: Fix it\n\nBody\n"
+    )
+    assert format_message("# comment\nFix it", fmt, "PROJ-1", "") == (
+        "# comment\nPROJ-1: Fix it\n"
+    )
+    assert format_message("proj-1 Fix it\n", fmt, "PROJ-1", "") == "proj-1 Fix it\n"
+    assert format_message("\n# only comments\n", fmt, "PROJ-1", "") == (
+        "\n# only comments\n"
+    )
+    assert format_message("Fix", "{message} ({issue} {title})", "1", "Bug") == (
+        "Fix (1 Bug)\n"
+    )
+
+
+def test_format_message_matches_whole_issue():
+    """Issue 12 in the subject should not be found inside other numbers."""
+    fmt = "{issue}: {message}"
+    assert format_message("Fix 120 tests", fmt, "12", "") == "12: Fix 120 tests\n"
+    assert format_message("Bump to 1.12", fmt, "12", "") == "12: Bump to 1.12\n"
+    assert format_message("Fix #12 again", fmt, "12", "") == "Fix #12 again"
+    assert format_message("Fix (12)", fmt, "12", "") == "Fix (12)"
+    assert format_message("Fix 12.", fmt, "12", "") == "Fix 12."
+
+
+def test_main_skips_merges_and_unknown_issues(git_repo, tmp_path):
+    """Merge messages and branches without an issue should be left alone."""
+    message = tmp_path / "MSG"
+    message.write_text("Fix it\n")
+    assert main([str(message)]) == 0
+    assert main([]) == 0
+
+    git(git_repo, "checkout", "-q", "-b", "12-fix")
+    BranchIndex.for_repo().record("github", Issue(12, "Fix", None), "12-fix")
+    assert main([str(message), "merge"]) == 0
+    assert message.read_text() == "Fix it\n"
+    assert main([str(message), "message"]) == 0
+    assert message.read_text() == "12: Fix it\n"
+
+
+def test_main_reads_only_format_for_indexed_branches(git_repo, tmp_path):
+    """Branches in the index should not need gibr.config to be imported."""
+    (git_repo / ".gibrconfig").write_text(
+        "[DEFAULT]\ncommit_msg_format = [{issue}] {message}\n"
+    )
+    git(git_repo, "checkout", "-q", "-b", "12-fix")
+    BranchIndex.for_repo().record("github", Issue(12, "Fix", None), "12-fix")
+    message = tmp_path / "MSG"
+    message.write_text("Fix it\n")
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from gibr.commitmsg import main; main(sys.argv[1:]); "
+            "print('gibr.config' in sys.modules)",
+            str(message),
+        ],
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout == "False\n"
+    assert message.read_text() == "[12] Fix it\n"
+
+
+def test_commit_msg_format_ignores_broken_config(git_repo):
+    """A config configparser can't read should give the default format."""
+    (git_repo / ".gibrconfig").write_text("no section\n")
+    assert commit_msg_format() == "{issue}: {message}"
+    (git_repo / ".gibrconfig").unlink()
+    assert commit_msg_format() == "{issue}: {message}"
+
+
+def test_main_reports_bad_format_without_failing(git_repo, tmp_path, capsys):
+    """A broken commit_msg_format should not stop the commit."""
+    (git_repo / ".gibrconfig").write_text(
+        "[DEFAULT]\nbranch_name_format = {issue}-{title}\n"
+        "commit_msg_format = {nope} {message}\n"
+    )
+    git(git_repo, "checkout", "-q", "-b", "12-fix")
+    message = tmp_path / "MSG"
+    message.write_text("Fix it\n")
+
+    assert main([str(message)]) == 0
+    assert message.read_text() == "Fix it\n"
+    assert "could not add issue" in capsys.readouterr().err
+
+
+def test_installed_hook_prefixes_commits(git_repo, monkeypatch):
+    """Commits on an issue branch should get the key from the hook."""
+    monkeypatch.setenv("PYTHONPATH", str(SRC))
+    (git_repo / ".gibrconfig").write_text(
+        "[DEFAULT]\nbranch_name_format = {issue}-{title}\n"
+        "commit_msg_format = [{issue}] {message}\n"
+        "[issue-tracker]\nname = jira\n"
+    )
+    result = CliRunner().invoke(hook, ["install"])
+    assert result.exit_code == 0
+    assert "Installed commit-msg hook" in result.output
+
+    git(git_repo, "checkout", "-q", "-b", "PROJ-7-fix-login")
+    git(git_repo, "commit", "-q", "--allow-empty", "-m", "Fix login")
+    git(git_repo, "commit", "-q", "--allow-empty", "-m", "[PROJ-7] Again")
+    assert git(git_repo, "log", "--format=%s", "-2").splitlines() == [
+        "[PROJ-7] Again",
+        "[PROJ-7] Fix login",
+    ]
+
+    result = CliRunner().invoke(hook, ["uninstall"])
+    assert "Removed commit-msg hook." in result.output
+    assert not (git_repo / ".git" / "hooks" / "commit-msg").exists()
+    assert (
+        "No gibr hook is installed." in CliRunner().invoke(hook, ["uninstall"]).output
+    )
+
+
+def test_install_keeps_foreign_hooks(git_repo):
+    """Hooks not written by gibr should only be replaced with --force."""
+    path = git_repo / ".git" / "hooks" / "prepare-commit-msg"
+    path.write_text("#!/bin/sh\nexit 0\n")
+
+    result = CliRunner().invoke(hook, ["install", "--type", "prepare-commit-msg"])
+    assert result.exit_code != 0
+    assert "Use --force to replace it." in result.output
+
+    args = ["install", "--type", "prepare-commit-msg", "--force"]
+    assert CliRunner().invoke(hook, args).exit_code == 0
+    assert "gibr.commitmsg" in path.read_text()
+
+
+def test_install_outside_repository():
+    """Installing outside a repository should fail cleanly."""
+    result = CliRunner().invoke(hook, ["install"])
+    assert result.exit_code != 0
+    assert "Not inside a git repository." in result.output
@@ -0,0 +1,187 @@
+"""Tests for gibr.completion."""
+
+import os
+import subprocess
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import click
+from click.shell_completion import shell_complete
+
+from gibr.cli import cli
+from gibr.cli.create import create
+from gibr.completion import (
+    COMPLETION_FILENAME,
+    COMPLETION_TTL,
+    CREATE_VALUE_OPTIONS,
+    REFRESH_MARKER_FILENAME,
+    completes_issue,
+    fast_complete,
+    lookup,
+    refresh,
+    refresh_if_stale,
+    write_snapshot,
+)
+from gibr.issue import Issue
+from gibr.paths import state_dir
+from tests.test_prompt import SRC
+
+ISSUES = [
+    Issue(id=12, title="Fix\tlogin\n page", assignee=None),
+    Issue(id=120, title="Add logout", assignee=None),
+    Issue(id=2, title="Docs", assignee=None),
+    Issue(id="PROJ:7", title="", assignee=None),
+]
+
+
+def _env(shell, words, cword):
+    """Return the environment click's completion script sets."""
+    return {
+        "_GIBR_COMPLETE": f"{shell}_complete",
+        "COMP_WORDS": words,
+        "COMP_CWORD": str(cword),
+    }
+
+
+def test_lookup_finds_ids_by_prefix(git_repo):
+    """IDs starting with the prefix should be returned with their titles."""
+    write_snapshot(ISSUES)
+    assert lookup("12") == [("12", "Fix login page"), ("120", "Add logout")]
+    assert lookup("2") == [("2", "Docs")]
+    assert lookup("3") == []
+    assert len(lookup("")) == len(ISSUES)
+    assert len(lookup("", limit=2)) == 2  # noqa: PLR2004
+
+
+def test_lookup_without_snapshot(git_repo, tmp_path, monkeypatch):
+    """Missing or empty snapshots and directories outside git give nothing."""
+    assert lookup("1") == []
+    write_snapshot([])
+    assert lookup("1") == []
+    monkeypatch.chdir(tmp_path)
+    write_snapshot(ISSUES)
+    assert lookup("1") == []
+
+
+def test_lookup_large_snapshot(git_repo):
+    """Binary search should find every prefix in a large snapshot."""
+    write_snapshot(
+        [Issue(id=i, title=f"Issue {i}", assignee=None) for i in range(5000)]
+    )
+    assert lookup("4999") == [("4999", "Issue 4999")]
+    expected = ["123", "1230", *map(str, range(1231, 1240))]
+    assert [i for i, _ in lookup("123")] == expected
+
+
+def test_completes_issue():
+    """Only arguments of create (or a bare number) are issue IDs."""
+    assert completes_issue(["create"], "1")
+    assert completes_issue(["create", "12"], "")
+    assert completes_issue(["git", "create", "--verbose"], "")
+    assert completes_issue(["--verbose"], "1")
+    assert not completes_issue([], "")
+    assert not completes_issue(["create"], "--fr")
+    assert not completes_issue(["create", "--from"], "")
+    assert not completes_issue(["create", "124", "--offline", "--title"], "")
+    assert completes_issue(["create", "--title", "Fix", "--offline"], "")
+    assert not completes_issue(["issues"], "")
+
+
+def test_create_value_options_match_create():
+    """Every create option taking a value should be listed."""
+    takes_value = {
+        opt
+        for param in create.params
+        if isinstance(param, click.Option) and not param.is_flag
+        for opt in param.opts
+    }
+    assert takes_value == set(CREATE_VALUE_OPTIONS)
+
+
+def test_fast_complete_formats_for_each_shell(git_repo, capsys):
+    """Completions should be printed in click's format for the shell."""
+    write_snapshot(ISSUES)
+    with patch("gibr.completion.refresh_if_stale"):
+        assert fast_complete(_env("bash", "gibr create 12", 2))
+        assert capsys.readouterr().out == "plain,12\nplain,120\n"
+
+        assert fast_complete(_env("zsh", "gibr create PRO", 2))
+        assert capsys.readouterr().out == "plain\nPROJ:7\n_\n"
+        assert fast_complete(_env("zsh", "gibr create 2", 2))
+        assert capsys.readouterr().out == "plain\n2\nDocs\n"
+
+        env = _env("fish", "gibr git create 2", 0)
+        env["COMP_CWORD"] = "2"
+        assert fast_complete(env)
+        assert capsys.readouterr().out == "plain,2\tDocs\n"
+
+        assert not fast_complete(_env("bash", "gibr iss", 1))
+        assert not fast_complete(_env("powershell", "gibr create ", 2))
+        assert not fast_complete({})
+    assert capsys.readouterr().out == ""
+
+
+def test_refresh_if_stale_spawns_one_refresh(git_repo):
+    """A stale snapshot should be refreshed by one background process."""
+    with patch("subprocess.Popen") as mock_popen:
+        refresh_if_stale()
+        refresh_if_stale()
+    mock_popen.assert_called_once()
+    assert mock_popen.call_args.args[0][1:] == ["-m", "gibr.completion"]
+    assert (state_dir() / REFRESH_MARKER_FILENAME).exists()
+
+    write_snapshot(ISSUES)
+    (state_dir() / REFRESH_MARKER_FILENAME).unlink()
+    with patch("subprocess.Popen") as mock_popen:
+        refresh_if_stale()
+        mock_popen.assert_not_called()
+
+        old = time.time() - COMPLETION_TTL - 1
+        os.utime(state_dir() / COMPLETION_FILENAME, (old, old))
+        refresh_if_stale()
+        mock_popen.assert_called_once()
+
+
+@patch("gibr.factory.get_tracker")
+@patch("gibr.config.GibrConfig")
+def test_refresh_writes_snapshot(mock_config, mock_get_tracker, git_repo):
+    """The background refresh should list issues and clear its marker."""
+    marker = state_dir() / REFRESH_MARKER_FILENAME
+    marker.parent.mkdir(parents=True, exist_ok=True)
+    marker.touch()
+    mock_get_tracker.return_value = MagicMock(list_issues=lambda: ISSUES)
+    refresh()
+    assert lookup("2") == [("2", "Docs")]
+    assert not marker.exists()
+
+
+def test_click_completion_uses_snapshot(git_repo, capsys, monkeypatch):
+    """Completion through click should offer the same issues."""
+    write_snapshot(ISSUES)
+    for key, value in _env("zsh", "gibr create 12", 2).items():
+        monkeypatch.setenv(key, value)
+    shell_complete(cli, {}, "gibr", "_GIBR_COMPLETE", "zsh_complete")
+    assert capsys.readouterr().out == (
+        "plain\n12\nFix login page\nplain\n120\nAdd logout\n"
+    )
+
+
+def test_completion_fast_path_imports(git_repo):
+    """Completing issue IDs must not import click, GitPython or trackers."""
+    write_snapshot(ISSUES)
+    code = (
+        "import sys\n"
+        "from gibr.prompt import main\n"
+        "main()\n"
+        "heavy = {'click', 'git', 'requests', 'gibr.trackers', 'gibr.cli'}\n"
+        "print(sorted(heavy & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC), "PATH": "", **_env("bash", "gibr 12", 1)},
+        check=True,
+    )
+    assert result.stdout.splitlines() == ["plain,12", "plain,120", "[]"]
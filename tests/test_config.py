@@ -1,11 +1,18 @@
 """Tests for gibr.config."""
 
+import json
+import time
 from textwrap import dedent
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gibr.config import EnvInterpolation, GibrConfig
+from gibr.config import (
+    CONFIG_CACHE_SIZE,
+    CONFIG_SEARCH_TTL,
+    GibrConfig,
+    expand_env,
+)
 
 
 @pytest.fixture
@@ -27,13 +34,11 @@ def temp_config_file(tmp_path):
     return cfg_path
 
 
-def test_env_interpolation_expands_env_vars():
-    """EnvInterpolation should expand environment variables."""
+def test_expand_env_expands_env_vars():
+    """expand_env should expand environment variables."""
     with patch.dict("os.environ", {"TOKEN_VAR": "supersecret"}):
-        interp = EnvInterpolation()
-        parser = MagicMock()
-        value = interp.before_get(parser, "s", "o", "Value=$TOKEN_VAR", {})
-        assert value == "Value=supersecret"
+        config = expand_env({"s": {"o": "Value=$TOKEN_VAR", "p": "plain"}})
+        assert config == {"s": {"o": "Value=supersecret", "p": "plain"}}
 
 
 def test_find_config_file_finds_in_current_dir(temp_config_file):
@@ -147,3 +152,94 @@ def test_str_includes_expected_sections():
         assert "Branch Name Format" in output
         assert "fake" in output
         assert "Fake details" in output
+
+
+def test_find_config_file_uses_env_override(tmp_path, monkeypatch):
+    """$GIBR_CONFIG should be used without searching."""
+    monkeypatch.setenv("GIBR_CONFIG", str(tmp_path / "elsewhere.ini"))
+    with patch("pathlib.Path.cwd") as mock_cwd:
+        assert GibrConfig()._find_config_file() == tmp_path / "elsewhere.ini"
+    mock_cwd.assert_not_called()
+
+
+def test_load_missing_env_override_raises_file_not_found(tmp_path, monkeypatch):
+    """A $GIBR_CONFIG pointing nowhere should raise FileNotFoundError."""
+    monkeypatch.setenv("GIBR_CONFIG", str(tmp_path / "missing.ini"))
+    with pytest.raises(FileNotFoundError, match="missing.ini not found"):
+        GibrConfig().load()
+
+
+def test_find_config_file_reuses_search_until_cwd_or_file_changes(temp_config_file):
+    """A remembered search should be reused until cwd or the file changes."""
+    child_dir = temp_config_file.parent / "a" / "b"
+    child_dir.mkdir(parents=True)
+    with patch("pathlib.Path.cwd", return_value=child_dir):
+        # The first search creates the cache directory inside tmp_path
+        GibrConfig()._find_config_file()
+        assert GibrConfig()._find_config_file() == temp_config_file
+        with patch("pathlib.Path.exists") as mock_exists:
+            assert GibrConfig()._find_config_file() == temp_config_file
+        mock_exists.assert_not_called()
+
+        closer = child_dir / ".gibrconfig"
+        closer.write_text("[DEFAULT]\n")
+        assert GibrConfig()._find_config_file() == closer
+        closer.unlink()
+        assert GibrConfig()._find_config_file() == temp_config_file
+
+
+def test_find_config_file_redoes_old_searches(temp_config_file):
+    """A config added between cwd and the found file shows up after the TTL."""
+    child_dir = temp_config_file.parent / "a" / "b"
+    child_dir.mkdir(parents=True)
+    with patch("pathlib.Path.cwd", return_value=child_dir):
+        GibrConfig()._find_config_file()
+        closer = child_dir.parent / ".gibrconfig"
+        closer.write_text("[DEFAULT]\n")
+        assert GibrConfig()._find_config_file() == temp_config_file
+        later = time.time() + CONFIG_SEARCH_TTL + 1
+        with patch("gibr.config.time.time", return_value=later):
+            assert GibrConfig()._find_config_file() == closer
+
+
+def test_find_config_file_cache_is_bounded(tmp_path, temp_config_file):
+    """Only the most recent working directories should be remembered."""
+    g = GibrConfig()
+    for i in range(CONFIG_CACHE_SIZE + 1):
+        g._update_cache("dirs", str(tmp_path / str(i)), {"path": "", "dirs": []})
+    dirs = json.loads(g.cache_path.read_text())["dirs"]
+    assert len(dirs) == CONFIG_CACHE_SIZE
+    assert str(tmp_path / "0") not in dirs
+
+
+def test_load_reuses_snapshot_until_file_changes(temp_config_file, monkeypatch):
+    """The compiled snapshot should be used until the file changes."""
+    monkeypatch.setenv("FAKE_TOKEN", "one")
+    temp_config_file.write_text(
+        temp_config_file.read_text() + "token = ${FAKE_TOKEN}\n"
+    )
+    with patch("pathlib.Path.cwd", return_value=temp_config_file.parent):
+        assert GibrConfig().load().config["fake"]["token"] == "one"
+        snapshot = GibrConfig().cache_path.read_text()
+        assert "${FAKE_TOKEN}" in snapshot
+        assert "Unknown tracker" not in snapshot
+
+        monkeypatch.setenv("FAKE_TOKEN", "two")
+        with patch("gibr.config.ConfigParser") as mock_parser:
+            g = GibrConfig().load()
+        mock_parser.assert_not_called()
+        assert g.config["fake"]["token"] == "two"
+        assert "Unknown tracker: fake" in str(g)
+
+        temp_config_file.write_text("[DEFAULT]\nbranch_name_format = {issue}\n")
+        g = GibrConfig().load()
+        assert g.config == {"DEFAULT": {"branch_name_format": "{issue}"}}
+
+
+def test_load_works_without_writable_cache(temp_config_file, monkeypatch):
+    """An unwritable cache directory should not stop config loading."""
+    blocker = temp_config_file.parent / "blocker"
+    blocker.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+    with patch("pathlib.Path.cwd", return_value=temp_config_file.parent):
+        assert GibrConfig().load().config["fake"]["foo"] == "bar"
@@ -1,13 +1,20 @@
 """Tests for the create command."""
 
+import time
 from unittest.mock import MagicMock, patch
 
+import click
+import requests
 from click.testing import CliRunner
 
 from gibr.cli.create import create
+from gibr.completion import write_snapshot
+from gibr.issue import Issue
+from gibr.issuecache import IssueCache
+from gibr.pushqueue import PushQueue
 
 
-@patch("gibr.cli.create.error", side_effect=None)
+@patch("gibr.cli.create.error", side_effect=click.Abort)
 def test_create_non_jira_tracker_with_non_digit_issue(mock_error):
     """Should call error if non-digit issue number is used with non-Jira tracker."""
     mock_config = MagicMock()
@@ -27,6 +34,45 @@ def test_create_non_jira_tracker_with_non_digit_issue(mock_error):
     )
 
 
+@patch("gibr.cli.create.error", side_effect=click.Abort)
+def test_create_rejects_bad_format_before_fetching(mock_error):
+    """An invalid branch_name_format should be reported without a tracker call."""
+    mock_config = MagicMock()
+    mock_config.config = {"DEFAULT": {"branch_name_format": "{id}-{title}"}}
+    mock_tracker = MagicMock(numeric_issues=True)
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        runner.invoke(
+            create, ["12"], obj={"config": mock_config, "tracker": mock_tracker}
+        )
+
+    mock_error.assert_called_once_with(
+        "Invalid branch_name_format: Unknown placeholder in format: id"
+    )
+    mock_tracker.get_issue.assert_not_called()
+
+
+@patch("gibr.cli.create.error", side_effect=click.Abort)
+def test_create_rejects_invalid_branch_name(mock_error):
+    """A generated name git would reject should be reported."""
+    mock_config = MagicMock()
+    mock_config.config = {"DEFAULT": {"branch_name_format": "{issue}..{title}"}}
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issue.return_value = MagicMock(id=12, sanitized_title="fix")
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        runner.invoke(
+            create, ["12"], obj={"config": mock_config, "tracker": mock_tracker}
+        )
+
+    mock_error.assert_called_once_with(
+        "Branch name '12..fix' contains '..'. "
+        "Use filters in branch_name_format to shorten or map it."
+    )
+
+
 @patch("gibr.cli.create.error", side_effect=None)
 def test_create_with_missing_assignee_and_assignee_in_format(mock_error):
     """Should call error if issue has no assignee but format includes {assignee}."""
@@ -35,7 +81,9 @@ def test_create_with_missing_assignee_and_assignee_in_format(mock_error):
         "DEFAULT": {"branch_name_format": "{issue}-{assignee}-{title}"}
     }
 
-    mock_issue = MagicMock(id=123, title="Fix login bug", assignee=None)
+    mock_issue = MagicMock(
+        id=123, title="Fix login bug", sanitized_title="fix-login-bug", assignee=None
+    )
     mock_tracker = MagicMock()
     mock_tracker.numeric_issues = True
     mock_tracker.get_issue.return_value = mock_issue
@@ -61,7 +109,9 @@ def test_create_with_missing_assignee_but_no_assignee_in_format(mock_echo, mock_
     mock_config = MagicMock()
     mock_config.config = {"DEFAULT": {"branch_name_format": "{issue}-{title}"}}
 
-    mock_issue = MagicMock(id=456, title="Add dark mode", assignee=None)
+    mock_issue = MagicMock(
+        id=456, title="Add dark mode", sanitized_title="add-dark-mode", assignee=None
+    )
     mock_tracker = MagicMock()
     mock_tracker.numeric_issues = True
     mock_tracker.get_issue.return_value = mock_issue
@@ -77,3 +127,398 @@ def test_create_with_missing_assignee_but_no_assignee_in_format(mock_echo, mock_
     assert result.exit_code == 0
     mock_branch.assert_called_once()
     mock_echo.assert_any_call("Generating branch name for issue #456: Add dark mode")
+
+
+@patch("gibr.cli.create.create_branches")
+@patch("gibr.cli.create.create_and_push_branch")
+def test_create_multiple_issues_uses_bulk_lookup(mock_single, mock_batch):
+    """Several issue numbers should go through get_issues and create_branches."""
+    mock_config = MagicMock()
+    mock_config.config = {"DEFAULT": {"branch_name_format": "{issue}-{title}"}}
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issues.return_value = [
+        MagicMock(id=12, sanitized_title="one", assignee=None),
+        MagicMock(id=13, sanitized_title="two", assignee=None),
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(
+        create, ["12", "13"], obj={"config": mock_config, "tracker": mock_tracker}
+    )
+
+    assert result.exit_code == 0
+    mock_tracker.get_issues.assert_called_once_with(["12", "13"])
+    mock_tracker.get_issue.assert_not_called()
+    mock_single.assert_not_called()
+    mock_batch.assert_called_once_with(
+        ["12-one", "13-two"],
+        True,
+        push_async=False,
+        suffix_policy="prompt",
+        remote_cache_ttl=300,
+        start_point=None,
+        git_backend="plumbing",
+    )
+
+
+@patch("gibr.cli.create.create_branches")
+def test_create_reads_issue_numbers_from_stdin(mock_batch):
+    """'-' should read whitespace-separated issue numbers from stdin."""
+    mock_config = MagicMock()
+    mock_config.config = {"DEFAULT": {"branch_name_format": "{issue}", "push": "no"}}
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issues.return_value = [
+        MagicMock(id=1, assignee=None),
+        MagicMock(id=2, assignee=None),
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(
+        create,
+        ["-"],
+        input="1\n2\n",
+        obj={"config": mock_config, "tracker": mock_tracker},
+    )
+
+    assert result.exit_code == 0
+    mock_tracker.get_issues.assert_called_once_with(["1", "2"])
+    mock_batch.assert_called_once_with(
+        ["1", "2"],
+        False,
+        push_async=False,
+        suffix_policy="prompt",
+        remote_cache_ttl=300,
+        start_point=None,
+        git_backend="plumbing",
+    )
+
+
+@patch("gibr.cli.create.find_submodules", return_value=["/work/a/sub"])
+@patch("gibr.cli.create.create_in_repos")
+def test_create_in_multiple_repos(mock_create_in_repos, mock_find_submodules):
+    """--repos should fetch once and create the branch in every repo."""
+    mock_config = MagicMock()
+    mock_config.config = {"DEFAULT": {"branch_name_format": "{issue}"}}
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issue.return_value = MagicMock(id=7, assignee=None)
+    mock_create_in_repos.return_value = [
+        ("/work/a", True, "created and checked out, pushed"),
+        ("/work/b", False, "no commits yet"),
+        ("/work/a/sub", True, "created and checked out, pushed"),
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(
+        create,
+        ["7", "--repos", "/work/a, /work/b", "--recurse-submodules"],
+        obj={"config": mock_config, "tracker": mock_tracker},
+    )
+
+    assert result.exit_code == 0
+    mock_tracker.get_issue.assert_called_once_with("7")
+    mock_create_in_repos.assert_called_once_with(
+        "7",
+        ["/work/a", "/work/b", "/work/a/sub"],
+        True,
+        push_async=False,
+        git_backend="plumbing",
+    )
+    assert "no commits yet" in result.output
+    assert "Branch could not be created in 1 of 3 repos." in result.output
+
+
+@patch("gibr.cli.create.error", side_effect=click.Abort)
+def test_create_multiple_issues_with_repos_is_rejected(mock_error):
+    """--repos should only be accepted together with a single issue."""
+    mock_tracker = MagicMock(numeric_issues=True)
+    runner = CliRunner()
+    runner.invoke(
+        create,
+        ["1", "2", "--repos", "a,b"],
+        obj={"config": MagicMock(), "tracker": mock_tracker},
+    )
+    mock_error.assert_called_once_with(
+        "--repos and --recurse-submodules work with a single issue."
+    )
+    mock_tracker.get_issues.assert_not_called()
+
+
+@patch("gibr.cli.create.create_worktree")
+def test_create_with_worktree(mock_create_worktree):
+    """--worktree should hand the branch to create_worktree."""
+    mock_config = MagicMock()
+    mock_config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}", "worktree_dir": "../trees"}
+    }
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issue.return_value = MagicMock(id=7, assignee=None)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        create,
+        ["7", "--worktree", "--sparse", "src"],
+        obj={"config": mock_config, "tracker": mock_tracker},
+    )
+
+    assert result.exit_code == 0
+    mock_create_worktree.assert_called_once_with(
+        "7",
+        path=None,
+        worktree_dir="../trees",
+        sparse_paths=("src",),
+        is_push=True,
+        push_async=False,
+        start_point=None,
+    )
+
+
+@patch("gibr.cli.create.error", side_effect=click.Abort)
+def test_create_sparse_without_worktree_is_rejected(mock_error):
+    """--sparse only makes sense together with --worktree."""
+    runner = CliRunner()
+    runner.invoke(
+        create,
+        ["7", "--sparse", "src"],
+        obj={"config": MagicMock(), "tracker": MagicMock(numeric_issues=True)},
+    )
+    mock_error.assert_called_once_with("--sparse requires --worktree.")
+
+
+@patch("gibr.cli.create.create_and_push_branch")
+def test_create_suffix_option_overrides_config(mock_branch):
+    """--suffix should take precedence over the branch_suffix setting."""
+    mock_config = MagicMock()
+    mock_config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}", "branch_suffix": "date"}
+    }
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issue.return_value = MagicMock(id=7, assignee=None)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        create,
+        ["7", "--suffix", "number"],
+        obj={"config": mock_config, "tracker": mock_tracker},
+    )
+
+    assert result.exit_code == 0
+    assert mock_branch.call_args.kwargs["suffix_policy"] == "number"
+
+
+@patch("gibr.cli.create.warning")
+@patch("gibr.cli.create.create_and_push_branch")
+def test_create_unknown_branch_suffix_falls_back_to_prompt(mock_branch, mock_warning):
+    """An unknown branch_suffix setting should warn and keep prompting."""
+    mock_config = MagicMock()
+    mock_config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}", "branch_suffix": "random"}
+    }
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issue.return_value = MagicMock(id=7, assignee=None)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        create, ["7"], obj={"config": mock_config, "tracker": mock_tracker}
+    )
+
+    assert result.exit_code == 0
+    mock_warning.assert_called_once()
+    assert mock_branch.call_args.kwargs["suffix_policy"] == "prompt"
+
+
+@patch("gibr.cli.create.fetch_base", return_value="origin/main")
+@patch("gibr.cli.create.create_and_push_branch")
+def test_create_from_base_fetches_it_first(mock_branch, mock_fetch_base):
+    """--from should fetch the base and branch from it."""
+    mock_config = MagicMock()
+    mock_config.config = {
+        "DEFAULT": {
+            "branch_name_format": "{issue}",
+            "base_branch": "origin/develop",
+            "fetch_filter": "blob:none",
+        }
+    }
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issue.return_value = MagicMock(id=7, assignee=None)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        create,
+        ["7", "--from", "origin/main"],
+        obj={"config": mock_config, "tracker": mock_tracker},
+    )
+
+    assert result.exit_code == 0
+    mock_fetch_base.assert_called_once_with(
+        "origin/main", "blob:none", 300, fetch=True, git_backend="plumbing"
+    )
+    assert mock_branch.call_args.kwargs["start_point"] == "origin/main"
+
+
+@patch("gibr.cli.create.error", side_effect=click.Abort)
+def test_create_from_with_repos_is_rejected(mock_error):
+    """--from can't be combined with --repos."""
+    runner = CliRunner()
+    runner.invoke(
+        create,
+        ["7", "--repos", "../a", "--from", "origin/main"],
+        obj={"config": MagicMock(), "tracker": MagicMock(numeric_issues=True)},
+    )
+    mock_error.assert_called_once_with("--from works in the current repository only.")
+
+
+@patch("gibr.cli.create.error", side_effect=click.Abort)
+def test_create_rejects_unknown_git_backend(mock_error):
+    """An unknown git_backend setting should be reported."""
+    mock_config = MagicMock()
+    mock_config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}", "git_backend": "svn"}
+    }
+    mock_tracker = MagicMock(numeric_issues=True)
+    mock_tracker.get_issue.return_value = MagicMock(id=7, assignee=None)
+
+    runner = CliRunner()
+    runner.invoke(create, ["7"], obj={"config": mock_config, "tracker": mock_tracker})
+    mock_error.assert_called_once_with("Unsupported git backend: svn")
+
+
+def _created(branch_name, *args, **kwargs):
+    """Stand in for create_and_push_branch, creating branch_name as is."""
+    return branch_name
+
+
+def _offline_config(**defaults):
+    """Return a config for the GitHub tracker with extra [DEFAULT] settings."""
+    config = MagicMock()
+    config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}-{title}", **defaults},
+        "issue-tracker": {"name": "github"},
+    }
+    return config
+
+
+@patch("gibr.cli.create.create_and_push_branch")
+def test_create_dry_run_shows_branch_name_only(mock_branch, git_repo):
+    """--dry-run should fetch the issue and name the branch, creating nothing."""
+    tracker = MagicMock(numeric_issues=True)
+    tracker.get_issue.return_value = Issue(id=7, title="Fix login", assignee=None)
+
+    result = CliRunner().invoke(
+        create,
+        ["7", "--dry-run"],
+        obj={"config": _offline_config(), "tracker": tracker},
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Branch name: 7-fix-login" in result.output
+    mock_branch.assert_not_called()
+    # Nothing cached or reconciled
+    assert not (git_repo / ".git" / "gibr" / "issues.json").exists()
+    tracker.find_issues.assert_not_called()
+
+
+@patch("gibr.cli.create.create_and_push_branch")
+def test_create_dry_run_offline_leaves_cache_unmarked(mock_branch, git_repo):
+    """An offline dry run should not mark cached issues for refetching."""
+    IssueCache.for_repo("github").put({"7": Issue(id=7, title="Fix", assignee=None)})
+
+    result = CliRunner().invoke(
+        create,
+        ["7", "--offline", "--dry-run"],
+        obj={"config": _offline_config(), "tracker_factory": MagicMock()},
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Branch name: 7-fix" in result.output
+    assert IssueCache.for_repo("github").get(["7"])["7"].title == "Fix"
+
+
+@patch("gibr.cli.create.create_and_push_branch", side_effect=_created)
+def test_create_offline_uses_cached_issue_and_queues_push(mock_branch, git_repo):
+    """--offline should not touch the tracker and should queue the push."""
+    IssueCache.for_repo("github").put({"7": Issue(id=7, title="Fix", assignee=None)})
+    factory = MagicMock()
+
+    result = CliRunner().invoke(
+        create,
+        ["7", "--offline"],
+        obj={"config": _offline_config(), "tracker_factory": factory},
+    )
+
+    assert result.exit_code == 0, result.output
+    factory.assert_not_called()
+    assert mock_branch.call_args.args[0] == "7-fix"
+    assert mock_branch.call_args.kwargs["push_async"] is True
+    # Branches on origin come from the tracking refs, without ls-remote
+    assert mock_branch.call_args.kwargs["remote_cache_ttl"] == 0
+    # Used offline, so no longer fresh for online runs
+    assert IssueCache.for_repo("github").get(["7"]) == {}
+
+
+@patch("gibr.cli.create.create_and_push_branch", side_effect=_created)
+def test_create_goes_offline_when_tracker_unreachable(mock_branch, git_repo):
+    """A connection error should fall back to the snapshot, then to --title."""
+    write_snapshot([Issue(id=8, title="From snapshot", assignee=None)])
+    factory = MagicMock(side_effect=requests.ConnectionError("no route to host"))
+    obj = {"config": _offline_config(), "tracker_factory": factory}
+
+    result = CliRunner().invoke(create, ["8"], obj=obj)
+    assert "working offline" in result.output
+    assert mock_branch.call_args.args[0] == "8-from-snapshot"
+
+    result = CliRunner().invoke(create, ["9"], obj=obj)
+    assert result.exit_code == 1
+    assert "Issue 9 is not cached; pass --title" in result.output
+
+    result = CliRunner().invoke(create, ["9", "--title", "Typed title"], obj=obj)
+    assert result.exit_code == 0
+    assert mock_branch.call_args.args[0] == "9-typed-title"
+
+
+@patch("gibr.cli.create.create_and_push_branch", side_effect=_created)
+def test_create_goes_offline_when_tracker_hangs(mock_branch, git_repo):
+    """A tracker not answering within offline_timeout should not block create."""
+    tracker = MagicMock(numeric_issues=True)
+    tracker.get_issue.side_effect = lambda _: time.sleep(5)
+    result = CliRunner().invoke(
+        create,
+        ["10", "--title", "Slow"],
+        obj={"config": _offline_config(offline_timeout="0.05"), "tracker": tracker},
+    )
+    assert "no connection within 0.05s" in result.output
+    assert mock_branch.call_args.args[0] == "10-slow"
+
+
+@patch("gibr.cli.create.PushQueue.spawn_worker")
+@patch("gibr.cli.create.create_and_push_branch", side_effect=_created)
+def test_create_online_reconciles_offline_work(mock_branch, mock_spawn, git_repo):
+    """The next online run should refresh issues used offline and push."""
+    cache = IssueCache.for_repo("github")
+    cache.put({"9": Issue(id="9", title="Typed title", assignee=None)}, offline=True)
+    PushQueue.for_repo().add("origin", ["9-typed-title"])
+    tracker = MagicMock(numeric_issues=True)
+    tracker.get_issue.return_value = Issue(id=7, title="Fix", assignee=None)
+    tracker.find_issues.return_value = {
+        "9": Issue(id=9, title="Real title", assignee=None)
+    }
+
+    result = CliRunner().invoke(
+        create, ["7"], obj={"config": _offline_config(), "tracker": tracker}
+    )
+
+    assert result.exit_code == 0, result.output
+    tracker.find_issues.assert_called_once_with(["9"])
+    assert "Issue 9, used offline, is titled: Real title" in result.output
+    mock_spawn.assert_called_once()
+    assert set(cache.get(["7", "9"])) == {"7", "9"}
+
+
+@patch("gibr.cli.create.error", side_effect=click.Abort)
+def test_create_title_with_several_issues_is_rejected(mock_error):
+    """--title names one issue."""
+    CliRunner().invoke(
+        create,
+        ["7", "8", "--title", "x"],
+        obj={"config": MagicMock(), "tracker": MagicMock(numeric_issues=True)},
+    )
+    mock_error.assert_called_once_with("--title works with a single issue.")
@@ -0,0 +1,51 @@
+"""Tests for gibr.fuzzy."""
+
+import re
+
+from gibr.fuzzy import FuzzyMatcher
+
+TEXTS = ["12 Fix login page", "13 Add logout", "14 Docs: blog", "15 Lint"]
+
+
+def _expected(query, texts):
+    """Return the indices a subsequence regex finds for query."""
+    pattern = re.compile(".*?".join(map(re.escape, query.lower())))
+    return [i for i, text in enumerate(texts) if text and pattern.search(text.lower())]
+
+
+def test_typing_and_deleting_match_like_a_full_scan():
+    """Each query should match what a full scan finds, however it was reached."""
+    matcher = FuzzyMatcher(TEXTS)
+    for query in ["l", "lo", "log", "logo", "log", "lg", "", "DOC", "xyz"]:
+        matcher.set_query(query)
+        assert list(matcher.matches(10)) == sorted(
+            _expected(query, TEXTS), key=lambda i: query.lower() not in TEXTS[i].lower()
+        )
+        assert matcher.count() == len(_expected(query, TEXTS))
+
+
+def test_matches_put_contiguous_matches_first():
+    """Candidates containing the query as is should come before scattered ones."""
+    matcher = FuzzyMatcher(TEXTS)
+    matcher.set_query("log")
+    assert matcher.matches(10) == [0, 1, 2]
+    matcher.set_query("lg")
+    assert matcher.matches(1) == [0]
+    assert matcher.positions(2) == [10, 12]
+
+
+def test_extend_and_replace_keep_levels_consistent():
+    """Added, changed and removed candidates should match the current query."""
+    texts = list(TEXTS)
+    matcher = FuzzyMatcher(texts)
+    matcher.set_query("lo")
+    matcher.extend(["16 Slow", "17 Fast"])
+    texts += ["16 Slow", "17 Fast"]
+    matcher.replace({1: None, 3: "15 Lint logs"})
+    texts[1], texts[3] = "", "15 Lint logs"
+    for query in ["lo", "log", "l", ""]:
+        matcher.set_query(query)
+        assert sorted(matcher.matches(10)) == _expected(query, texts)
+    assert len(matcher) == len(texts) - 1
+    matcher.extend(["18 Loose"])
+    assert len(matcher) == len(texts)
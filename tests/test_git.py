@@ -0,0 +1,396 @@
+"""Tests for gibr.git."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+
+from gibr.git import (
+    RefIndex,
+    create_and_push_branch,
+    create_branches,
+    create_in_repos,
+    fetch_base,
+    find_submodules,
+    free_branch_name,
+    warn_if_dirty,
+)
+from gibr.gitbackend import GitBackend, GitBackendError
+from gibr.remotecache import RemoteRefCache
+from tests.conftest import git
+
+
+@pytest.mark.parametrize("git_backend", ["plumbing", "gitpython"])
+def test_create_branches_creates_all_refs_and_pushes_once(git_repo, git_backend):
+    """create_branches should create every branch without switching HEAD."""
+    with patch("gibr.git.success") as mock_success:
+        create_branches(["12-a", "13-b", "12-a"], is_push=True, git_backend=git_backend)
+
+    assert git(git_repo, "branch", "--show-current") == "main"
+    assert git(git_repo, "branch", "--list", "1*", "--format=%(refname:short)") == (
+        "12-a\n13-b"
+    )
+    remote = git(git_repo, "ls-remote", "--heads", "origin")
+    assert "refs/heads/12-a" in remote and "refs/heads/13-b" in remote
+    mock_success.assert_any_call("Pushed 2 branch(es) to origin.")
+
+
+def test_create_branches_numbers_taken_names(git_repo):
+    """With the prompt policy, names taken locally or on origin get numbered."""
+    git(git_repo, "branch", "12-a")
+    git(git_repo, "push", "-q", "origin", "HEAD:refs/heads/13-b")
+    with patch("gibr.git.success"), patch("gibr.git.info") as mock_info:
+        created = create_branches(["12-a", "13-b", "14-c"], is_push=True)
+
+    assert created == {"12-a": "12-a-2", "13-b": "13-b-2", "14-c": "14-c"}
+    mock_info.assert_any_call("Branch already exists, using '13-b-2' instead.")
+    remote = git(git_repo, "ls-remote", "--heads", "origin")
+    assert "refs/heads/12-a-2" in remote and "refs/heads/13-b-2" in remote
+
+
+@patch("gibr.git.queue_push")
+def test_create_branches_async_push_queues_branches(mock_queue_push, git_repo):
+    """With push_async the branches should be queued instead of pushed."""
+    with patch("gibr.git.success"), patch("gibr.git.info") as mock_info:
+        create_branches(["12-a"], is_push=True, push_async=True)
+
+    mock_queue_push.assert_called_once_with(
+        (git_repo / ".git").resolve(), "origin", ["12-a"]
+    )
+    mock_info.assert_called_once_with(
+        "Pushing 1 branch(es) to origin in the background."
+    )
+    assert "12-a" not in git(git_repo, "ls-remote", "--heads", "origin")
+
+
+@patch("gibr.git.queue_push")
+def test_create_and_push_branch_async_push(mock_queue_push, git_repo):
+    """create_and_push_branch should check out and queue the push."""
+    with patch("gibr.git.success"), patch("gibr.git.info"):
+        create_and_push_branch("12-a", is_push=True, push_async=True)
+
+    assert git(git_repo, "branch", "--show-current") == "12-a"
+    mock_queue_push.assert_called_once_with(
+        (git_repo / ".git").resolve(), "origin", ["12-a"]
+    )
+
+
+def _clone(git_repo, name):
+    """Clone the fixture's origin into a new repo with its own bare origin."""
+    origin = git_repo.parent / f"{name}.git"
+    path = git_repo.parent / name
+    git(git_repo.parent, "clone", "-q", "--bare", "origin.git", str(origin))
+    git(git_repo.parent, "clone", "-q", str(origin), str(path))
+    return path
+
+
+@pytest.mark.parametrize("git_backend", ["plumbing", "gitpython"])
+def test_create_in_repos_reports_per_repo_results(git_repo, git_backend):
+    """create_in_repos should handle each repo independently."""
+    other = _clone(git_repo, "other")
+    git(other, "branch", "12-a")
+
+    results = create_in_repos(
+        "12-a", [str(git_repo), str(other), "missing"], git_backend=git_backend
+    )
+
+    assert results[0] == (str(git_repo), True, "created and checked out, pushed")
+    assert results[1] == (str(other), True, "checked out existing branch, pushed")
+    assert results[2][0] == "missing" and results[2][1] is False
+    assert git(git_repo, "branch", "--show-current") == "12-a"
+    assert git(other, "branch", "--show-current") == "12-a"
+
+
+@patch("gibr.git.queue_push")
+def test_create_in_repos_async_push_and_empty_repo(mock_queue_push, git_repo):
+    """Async pushes should be queued; repos without commits should fail."""
+    empty = git_repo.parent / "empty"
+    git(git_repo.parent, "init", "-q", str(empty))
+
+    results = create_in_repos(
+        "12-a", [str(git_repo), str(empty)], is_push=True, push_async=True
+    )
+
+    assert results[0][2] == "created and checked out, push queued"
+    assert results[1] == (str(empty), False, "no commits yet")
+    mock_queue_push.assert_called_once()
+
+
+def test_find_submodules_is_recursive(git_repo):
+    """find_submodules should list nested submodules too."""
+    lib = _clone(git_repo, "lib")
+    git(
+        lib,
+        "-c",
+        "protocol.file.allow=always",
+        "submodule",
+        "add",
+        "-q",
+        str(git_repo.parent / "origin.git"),
+        "nested",
+    )
+    git(lib, "commit", "-qm", "add nested")
+    git(
+        git_repo,
+        "-c",
+        "protocol.file.allow=always",
+        "submodule",
+        "add",
+        "-q",
+        str(lib),
+        "lib",
+    )
+    git(
+        git_repo,
+        "-c",
+        "protocol.file.allow=always",
+        "submodule",
+        "update",
+        "-q",
+        "--init",
+        "--recursive",
+    )
+
+    assert find_submodules(str(git_repo)) == [
+        str(git_repo / "lib"),
+        str(git_repo / "lib" / "nested"),
+    ]
+
+
+def test_create_and_push_branch_only_moves_head(git_repo):
+    """The new branch should be checked out by writing refs only."""
+    (git_repo / "README.md").write_text("changed\n")
+    with (
+        patch("gibr.git.success"),
+        patch("gibr.git.warning") as mock_warning,
+    ):
+        create_and_push_branch("12-a", is_push=False)
+
+    mock_warning.assert_called_once_with(
+        "Working tree is dirty — uncommitted changes present."
+    )
+    assert git(git_repo, "symbolic-ref", "HEAD") == "refs/heads/12-a"
+    assert (git_repo / "README.md").read_text() == "changed\n"
+    assert git(git_repo, "rev-parse", "12-a") == git(git_repo, "rev-parse", "main")
+    assert "checkout: moving from main to 12-a" in git(git_repo, "reflog", "-1")
+
+
+def test_create_and_push_branch_from_detached_head(git_repo):
+    """A detached HEAD should be warned about and used as the start point."""
+    sha = git(git_repo, "rev-parse", "HEAD")
+    git(git_repo, "checkout", "-q", "--detach")
+    with (
+        patch("gibr.git.success") as mock_success,
+        patch("gibr.git.warning") as mock_warning,
+    ):
+        create_and_push_branch("12-a", is_push=False, dirty_check_timeout=0)
+
+    mock_warning.assert_called_once_with("HEAD is detached (not on a branch).")
+    mock_success.assert_any_call(f"Created branch '12-a' from {sha[:7]}.")
+    assert git(git_repo, "branch", "--show-current") == "12-a"
+
+
+def test_dirty_check_over_budget_is_skipped():
+    """A dirty check that fails or times out should not block creation."""
+    backend = MagicMock(spec=GitBackend)
+    backend.run.side_effect = GitBackendError("git status timed out after 0.5s")
+    backend.is_dirty = lambda timeout: GitBackend.is_dirty(backend, timeout)
+    with patch("gibr.git.warning") as mock_warning:
+        warn_if_dirty(backend, timeout=0.5)
+        warn_if_dirty(backend, timeout=0)
+    mock_warning.assert_not_called()
+    backend.run.assert_called_once_with(
+        "status", "--porcelain", "--untracked-files=no", timeout=0.5
+    )
+
+
+def _make_refs(git_repo):
+    """Create branches and an annotated tag to query the ref index with."""
+    for name in ("12-a", "12-b", "12/nested", "123-c", "13-d"):
+        git(git_repo, "branch", name)
+    git(git_repo, "tag", "-a", "v1", "-m", "v1")
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_ref_index_queries(git_repo, packed):
+    """Existence and prefix queries should work for loose and packed refs."""
+    _make_refs(git_repo)
+    if packed:
+        git(git_repo, "pack-refs", "--all")
+        assert not (git_repo / ".git" / "refs" / "heads" / "12-a").exists()
+    git(git_repo, "branch", "12-loose")
+
+    refs = RefIndex.for_path(git_repo)
+    for name in ("main", "12-a", "12/nested", "13-d", "12-loose"):
+        assert refs.branch_exists(name)
+    for name in ("12", "12-", "14", "a", "zz"):
+        assert not refs.branch_exists(name)
+    assert refs.exists("refs/tags/v1")
+    assert refs.with_prefix("refs/heads/12-") == [
+        "refs/heads/12-a",
+        "refs/heads/12-b",
+        "refs/heads/12-loose",
+    ]
+    assert refs.with_prefix("refs/heads/12") == [
+        "refs/heads/12-a",
+        "refs/heads/12-b",
+        "refs/heads/12-loose",
+        "refs/heads/12/nested",
+        "refs/heads/123-c",
+    ]
+    assert refs.with_prefix("refs/heads/9") == []
+
+
+def test_ref_index_unsorted_packed_refs(tmp_path):
+    """packed-refs without the sorted trait should still be searched correctly."""
+    sha = "0" * 40
+    (tmp_path / "packed-refs").write_text(
+        "# pack-refs with: peeled\n"
+        f"{sha} refs/tags/v1\n^{sha}\n"
+        f"{sha} refs/heads/b\n"
+        f"{sha} refs/heads/a\n"
+    )
+    refs = RefIndex(tmp_path)
+    assert refs.branch_exists("a") and refs.branch_exists("b")
+    assert refs.exists("refs/tags/v1")
+    assert refs.with_prefix("refs/heads/") == ["refs/heads/a", "refs/heads/b"]
+
+
+def test_ref_index_outside_repository(tmp_path, monkeypatch):
+    """RefIndex.for_path should fail outside a git repository."""
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    with pytest.raises(GitBackendError):
+        RefIndex.for_path(tmp_path)
+
+
+def test_ref_index_reftable_uses_git(tmp_path):
+    """Reftable repositories should be queried through git for-each-ref."""
+    (tmp_path / "reftable").mkdir()
+    refs = RefIndex(tmp_path)
+    with patch("gibr.git.subprocess.run") as mock_run:
+        mock_run.return_value.stdout = "refs/heads/12-a\nrefs/heads/13-b\n"
+        assert refs.branch_exists("12-a")
+        assert refs.with_prefix("refs/heads/12") == ["refs/heads/12-a"]
+    assert mock_run.call_args.args[0][-1] == "refs/heads/"
+
+
+def test_free_branch_name_policies(git_repo):
+    """Suffixes should skip names taken locally or on origin."""
+    git(git_repo, "branch", "12-a")
+    git(git_repo, "branch", "12-a-2")
+    git(git_repo, "update-ref", "refs/remotes/origin/12-a-3", "HEAD")
+    refs = RefIndex.for_path(git_repo)
+    remote_refs = RemoteRefCache(refs, ttl=0)
+
+    assert free_branch_name(refs, remote_refs, "12-a", "number") == "12-a-4"
+    assert free_branch_name(refs, remote_refs, "13-b", "number") == "13-b"
+    assert (
+        free_branch_name(refs, remote_refs, "12-a", "hash", "abcdef123")
+        == "12-a-abcdef1"
+    )
+    with patch("gibr.git.date") as mock_date:
+        mock_date.today.return_value = date(2024, 5, 1)
+        assert free_branch_name(refs, remote_refs, "12-a", "date") == "12-a-20240501"
+
+
+def test_create_and_push_branch_suffixes_remote_collision(git_repo):
+    """A branch that only exists on origin should get a suffix, not a failed push."""
+    git(git_repo, "push", "-q", "origin", "main:refs/heads/12-a")
+    with (
+        patch("gibr.git.success"),
+        patch("gibr.git.info") as mock_info,
+        patch("gibr.git.warning") as mock_warning,
+    ):
+        create_and_push_branch("12-a", is_push=True, dirty_check_timeout=0)
+
+    mock_warning.assert_called_once_with("Branch '12-a' already exists on origin.")
+    mock_info.assert_called_once_with("Creating new branch '12-a-2' instead.")
+    assert git(git_repo, "branch", "--show-current") == "12-a-2"
+    assert "refs/heads/12-a-2" in git(git_repo, "ls-remote", "--heads", "origin")
+
+
+@patch("gibr.git.error", side_effect=click.Abort)
+@patch("gibr.git.get_git_backend")
+def test_create_branches_closes_backend_on_error(mock_get_backend, _mock_error):
+    """The backend should be closed even when a git command fails."""
+    backend = mock_get_backend.return_value.return_value
+    backend.head.side_effect = GitBackendError("boom")
+
+    with pytest.raises(click.Abort):
+        create_branches(["12-a"])
+
+    backend.close.assert_called_once_with()
+
+
+def test_create_branches_with_suffix_policy(git_repo):
+    """With a suffix policy, existing branches should be renamed, not skipped."""
+    git(git_repo, "branch", "12-a")
+    with patch("gibr.git.success"), patch("gibr.git.info"):
+        create_branches(["12-a", "13-b"], is_push=False, suffix_policy="number")
+
+    assert git(git_repo, "branch", "--list", "1*", "--format=%(refname:short)") == (
+        "12-a\n12-a-2\n13-b"
+    )
+
+
+def _advance_origin(git_repo, branch="main"):
+    """Push a new commit to origin's branch without fetching it; return its sha."""
+    other = git_repo.parent / "other"
+    git(git_repo.parent, "clone", "-q", str(git_repo.parent / "origin.git"), "other")
+    (other / "new.txt").write_text("new\n")
+    git(other, "add", "new.txt")
+    git(other, "commit", "-q", "-m", "new")
+    git(other, "push", "-q", "origin", f"HEAD:{branch}")
+    return git(other, "rev-parse", "HEAD")
+
+
+@pytest.mark.parametrize("git_backend", ["plumbing", "gitpython"])
+def test_fetch_base_fetches_single_branch(git_repo, git_backend):
+    """fetch_base should fetch only the requested branch, without tags."""
+    sha = _advance_origin(git_repo)
+    git(git_repo.parent / "other", "tag", "v1")
+    git(git_repo.parent / "other", "push", "-q", "origin", "v1", "HEAD:refs/heads/x")
+
+    with patch("gibr.git.info") as mock_info:
+        assert fetch_base("origin/main", git_backend=git_backend) == "origin/main"
+
+    mock_info.assert_called_once_with("Fetching origin/main.")
+    assert git(git_repo, "rev-parse", "origin/main") == sha
+    assert git(git_repo, "tag") == ""
+    assert "refs/remotes/origin/x" not in git(git_repo, "for-each-ref")
+
+
+def test_fetch_base_resolves_remote_default_branch(git_repo):
+    """A bare remote name should mean the remote's default branch."""
+    with patch("gibr.git.info"):
+        assert fetch_base("origin") == "origin/main"
+    assert fetch_base("main") == "main"
+
+
+def test_create_and_push_branch_from_fetched_base(git_repo):
+    """Branching from a fetched base should check out its commit."""
+    sha = _advance_origin(git_repo)
+    with patch("gibr.git.info"), patch("gibr.git.success") as mock_success:
+        start_point = fetch_base("origin/main", fetch_filter="blob:none")
+        create_and_push_branch(
+            "12-a", is_push=False, dirty_check_timeout=0, start_point=start_point
+        )
+
+    mock_success.assert_any_call("Created branch '12-a' from origin/main.")
+    assert git(git_repo, "branch", "--show-current") == "12-a"
+    assert git(git_repo, "rev-parse", "HEAD") == sha
+    assert (git_repo / "new.txt").exists()
+    assert "branch.12-a.merge" not in git(git_repo, "config", "--list")
+
+
+def test_create_branches_from_start_point(git_repo):
+    """Batch-created branches should start at the given start point."""
+    sha = _advance_origin(git_repo)
+    git(git_repo, "fetch", "-q", "origin")
+    with patch("gibr.git.success"):
+        create_branches(["12-a", "13-b"], is_push=False, start_point="origin/main")
+
+    assert git(git_repo, "rev-parse", "12-a") == sha
+    assert git(git_repo, "rev-parse", "13-b") == sha
+    assert git(git_repo, "branch", "--show-current") == "main"
@@ -0,0 +1,113 @@
+"""Tests for gibr.gitbackend."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from gibr.git import create_and_push_branch
+from gibr.gitbackend import (
+    GitBackendError,
+    GitPythonBackend,
+    PlumbingBackend,
+    get_git_backend,
+)
+from tests.conftest import git
+
+BACKENDS = [PlumbingBackend, GitPythonBackend]
+
+
+@pytest.mark.parametrize("backend_cls", BACKENDS)
+def test_head_on_branch_and_detached(git_repo, backend_cls):
+    """head() should report the commit and branch, or no branch if detached."""
+    sha = git(git_repo, "rev-parse", "HEAD")
+    backend = backend_cls(".")
+    assert backend.head() == (sha, "main")
+    assert backend.common_dir == (git_repo / ".git").resolve()
+
+    git(git_repo, "checkout", "-q", "--detach")
+    assert backend_cls(".").head() == (sha, None)
+
+
+@pytest.mark.parametrize("backend_cls", BACKENDS)
+def test_head_without_commits(tmp_path, backend_cls):
+    """A repository without commits should have no HEAD commit."""
+    git(tmp_path, "init", "-q", "-b", "main")
+    assert backend_cls(str(tmp_path)).head() == (None, None)
+
+
+@pytest.mark.parametrize("backend_cls", BACKENDS)
+def test_run_and_dirty_check(git_repo, backend_cls):
+    """run() should return git's output and raise GitBackendError on failure."""
+    backend = backend_cls(".")
+    assert backend.rev_parse("main") == git(git_repo, "rev-parse", "HEAD")
+    assert backend.is_dirty(timeout=5) is False
+    (git_repo / "README.md").write_text("changed\n")
+    assert backend.is_dirty(timeout=5) is True
+    with pytest.raises(GitBackendError):
+        backend.rev_parse("no-such-branch")
+
+
+@pytest.mark.parametrize("backend_cls", BACKENDS)
+def test_push(git_repo, backend_cls):
+    """push() should push the branch and raise when the push is rejected."""
+    git(git_repo, "branch", "12-a")
+    backend = backend_cls(".")
+    backend.push("origin", "12-a")
+    assert "refs/heads/12-a" in git(git_repo, "ls-remote", "origin")
+    assert git(git_repo, "rev-parse", "--abbrev-ref", "12-a@{upstream}") == (
+        "origin/12-a"
+    )
+
+    git(git_repo, "commit", "-q", "--allow-empty", "-m", "other")
+    git(git_repo, "push", "-q", "origin", "HEAD:12-a")
+    with pytest.raises(GitBackendError):
+        backend.push("origin", "12-a")
+    backend.close()
+
+
+def test_plumbing_timeout_and_outside_repository(tmp_path):
+    """Timeouts and missing repositories should raise GitBackendError."""
+    backend = PlumbingBackend(str(tmp_path))
+    with pytest.raises(GitBackendError):
+        backend.head()
+    with (
+        patch(
+            "gibr.gitbackend.subprocess.run",
+            side_effect=subprocess.TimeoutExpired("git", 1),
+        ),
+        pytest.raises(GitBackendError, match="timed out after 1s"),
+    ):
+        backend.run("status", timeout=1)
+
+
+def test_get_git_backend():
+    """Backends should be looked up by name."""
+    assert get_git_backend("plumbing") is PlumbingBackend
+    assert get_git_backend("gitpython") is GitPythonBackend
+    with pytest.raises(ValueError, match="Unsupported git backend: svn"):
+        get_git_backend("svn")
+
+
+@pytest.mark.parametrize("name", ["plumbing", "gitpython"])
+def test_create_and_push_branch_with_each_backend(git_repo, name):
+    """Both backends should create, check out and push the branch alike."""
+    with patch("gibr.git.success") as mock_success:
+        create_and_push_branch("12-a", is_push=True, git_backend=name)
+
+    mock_success.assert_any_call("Created branch '12-a' from main.")
+    mock_success.assert_any_call("Pushed branch '12-a' to origin.")
+    assert git(git_repo, "branch", "--show-current") == "12-a"
+    assert "checkout: moving from main to 12-a" in git(git_repo, "reflog", "-1")
+    assert "refs/heads/12-a" in git(git_repo, "ls-remote", "origin")
+
+
+@patch("gibr.git.error")
+def test_create_and_push_branch_without_commits(mock_error, tmp_path, monkeypatch):
+    """An empty repository should be reported rather than crash."""
+    git(tmp_path, "init", "-q", "-b", "main")
+    monkeypatch.chdir(tmp_path)
+    create_and_push_branch("12-a", is_push=False)
+    mock_error.assert_called_once_with(
+        "Please make an initial commit before using gibr."
+    )
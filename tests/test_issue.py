@@ -24,3 +24,11 @@ def test_sanitized_title_uses_slugify_and_default_issue(mock_slugify):
 
     mock_slugify.assert_called_once_with("Example Title")
     assert result == "fake-slug"
+
+
+@patch("gibr.issue.slugify", return_value="fake-slug")
+def test_sanitized_title_is_computed_once(mock_slugify):
+    """Repeated access should not slugify the title again."""
+    issue = Issue(id=1, title="Example Title", assignee=None)
+    assert issue.sanitized_title == issue.sanitized_title == "fake-slug"
+    mock_slugify.assert_called_once()
@@ -0,0 +1,75 @@
+"""Tests for gibr.issuecache."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from gibr.issue import Issue
+from gibr.issuecache import IssueCache
+
+
+def _tracker(*issues):
+    """Return a tracker whose find_issues knows issues."""
+    known = {str(issue.id): issue for issue in issues}
+    tracker = MagicMock()
+    tracker.find_issues.side_effect = lambda ids: {
+        i: known[i] for i in ids if i in known
+    }
+    return tracker
+
+
+def test_find_issues_fetches_only_stale_issues(git_repo):
+    """Fresh cached issues should not be fetched again."""
+    one = Issue(id=1, title="One", assignee=None, state="open")
+    two = Issue(id=2, title="Two", assignee="me", state="closed", closed=True)
+    tracker = _tracker(one, two)
+    cache = IssueCache.for_repo("github")
+
+    assert cache.find_issues(tracker, ["1", "9"]) == {"1": one}
+    assert cache.find_issues(tracker, ["1", "2", "2"]) == {"1": one, "2": two}
+    assert [c.args[0] for c in tracker.find_issues.call_args_list] == [
+        ["1", "9"],
+        ["2"],
+    ]
+
+    with patch("gibr.issuecache.time.time", return_value=time.time() + 3600):
+        cache.find_issues(tracker, ["1"])
+    tracker.find_issues.assert_called_with(["1"])
+
+
+def test_zero_ttl_always_fetches(git_repo):
+    """With a TTL of 0 the cache should only be written, never read."""
+    tracker = _tracker(Issue(id="PROJ-1", title="One", assignee=None))
+    IssueCache.for_repo("jira").find_issues(tracker, ["PROJ-1"])
+    IssueCache.for_repo("jira", ttl=0).find_issues(tracker, ["proj-1"])
+    assert tracker.find_issues.call_count == 2  # noqa: PLR2004
+    assert IssueCache.for_repo("jira").get(["proj-1"])["proj-1"].title == "One"
+    assert IssueCache.for_repo("linear").get(["proj-1"]) == {}
+
+
+def test_for_repo_outside_repository():
+    """There is no cache outside a repository."""
+    assert IssueCache.for_repo("github") is None
+
+
+def test_reconcile_refetches_issues_used_offline(git_repo):
+    """Issues used offline should be stale until fetched again."""
+    cache = IssueCache.for_repo("github")
+    cache.put({"1": Issue(id=1, title="Cached", assignee=None)})
+    cache.put(
+        {
+            "2": Issue(id=2, title="Typed", assignee=None),
+            "3": Issue(id=3, title="Gone", assignee=None),
+        },
+        offline=True,
+    )
+    assert set(cache.get(["1", "2", "3"])) == {"1"}
+
+    renamed = Issue(id=2, title="Real", assignee=None)
+    tracker = _tracker(renamed)
+    assert [(used.id, now) for used, now in cache.reconcile(tracker)] == [
+        (2, renamed),
+        (3, None),
+    ]
+    tracker.find_issues.assert_called_once_with(["2", "3"])
+    assert cache.get(["2", "3"]) == {"2": renamed}
+    assert cache.reconcile(tracker) == []
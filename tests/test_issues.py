@@ -0,0 +1,74 @@
+"""Tests for the issues command."""
+
+from unittest.mock import MagicMock
+
+from click.testing import CliRunner
+
+from gibr.cli.issues import issues
+from gibr.issue import Issue
+from tests.conftest import git
+
+
+def _invoke(args, tracker_issues, branch_name_format="{issue}-{title}"):
+    """Run `gibr issues` with a tracker returning tracker_issues."""
+    config = MagicMock()
+    config.config = {"DEFAULT": {"branch_name_format": branch_name_format}}
+    tracker = MagicMock()
+    tracker.list_issues.return_value = tracker_issues
+    return CliRunner().invoke(
+        issues, args, obj={"config": config, "tracker": tracker}
+    ), tracker
+
+
+def _rows(output):
+    """Return the cells of each table row, keyed by issue ID."""
+    rows = {}
+    for line in output.splitlines()[2:]:
+        cells = [cell.strip() for cell in line.strip("|").split("|")]
+        rows[cells[0]] = cells
+    return rows
+
+
+ISSUES = [
+    Issue(id=12, title="Fix login", assignee="jane"),
+    Issue(id=13, title="Add logout", assignee=None),
+    Issue(id=14, title="New thing", assignee=None),
+]
+
+
+def test_issues_lists_issues():
+    """Issues should be listed without branch names by default."""
+    result, _ = _invoke([], ISSUES)
+    assert result.exit_code == 0
+    assert "Branch" not in result.output
+    assert _rows(result.output)["12"] == ["12", "issue", "Fix login", "jane"]
+
+
+def test_issues_branch_names_marks_existing_branches(git_repo):
+    """Branch names should show whether they exist locally or on origin."""
+    git(git_repo, "branch", "12-fix-login")
+    git(git_repo, "push", "-q", "origin", "12-fix-login", "main:13-add-logout")
+
+    result, _ = _invoke(["--branch-names"], ISSUES)
+
+    assert result.exit_code == 0
+    rows = _rows(result.output)
+    assert rows["12"][4:] == ["12-fix-login", "local, origin"]
+    assert rows["13"][4:] == ["13-add-logout", "origin"]
+    assert rows["14"][4:] == ["14-new-thing", ""]
+
+
+def test_issues_branch_names_outside_repo_and_without_assignee():
+    """Outside a repository nothing exists; missing assignees leave no name."""
+    result, _ = _invoke(["--branch-names"], ISSUES, "{assignee}/{issue}")
+    rows = _rows(result.output)
+    assert rows["12"][4:] == ["jane/12", ""]
+    assert rows["13"][4:] == ["", ""]
+
+
+def test_issues_branch_names_rejects_bad_format():
+    """An invalid format should be reported before asking the tracker."""
+    result, tracker = _invoke(["--branch-names"], ISSUES, "{id}")
+    assert result.exit_code == 1
+    assert "Unknown placeholder in format: id" in result.output
+    tracker.list_issues.assert_not_called()
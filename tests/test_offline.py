@@ -0,0 +1,55 @@
+"""Tests for gibr.offline."""
+
+import time
+
+import click
+import pytest
+import requests
+
+from gibr.offline import OfflineError, call_with_deadline, is_connection_error
+from tests.conftest import SLOW_SECONDS
+
+
+def test_is_connection_error_follows_the_exception_chain():
+    """Errors raised from a network error should count as network errors."""
+    try:
+        try:
+            raise requests.ConnectionError("refused")
+        except requests.ConnectionError as e:
+            raise RuntimeError("client library error") from e
+    except RuntimeError as e:
+        assert is_connection_error(e)
+    assert not is_connection_error(ValueError("bad"))
+
+
+def test_call_with_deadline_returns_or_raises_like_func():
+    """Results and other errors should come through unchanged."""
+    assert call_with_deadline(lambda: 42) == 42  # noqa: PLR2004
+    assert call_with_deadline(lambda: 42, timeout=0) == 42  # noqa: PLR2004
+
+    def abort():
+        raise click.Abort
+
+    with pytest.raises(click.Abort):
+        call_with_deadline(abort)
+
+
+def test_call_with_deadline_raises_offline_error():
+    """Connection errors and calls past the deadline mean offline."""
+
+    def refuse():
+        raise ConnectionRefusedError("refused")
+
+    with pytest.raises(OfflineError, match="refused"):
+        call_with_deadline(refuse, timeout=0)
+    with pytest.raises(OfflineError, match="no connection within 0.05s"):
+        call_with_deadline(lambda: time.sleep(5), timeout=0.05)
+
+
+def test_call_with_deadline_waits_for_slow_connected_tracker(http_server):
+    """A tracker that connects in time is waited for, however slow it is."""
+
+    def fetch():
+        return requests.get(f"{http_server}/slow").text
+
+    assert call_with_deadline(fetch, timeout=SLOW_SECONDS / 10) == "hello"
@@ -0,0 +1,134 @@
+"""Tests for the pick command."""
+
+from unittest.mock import MagicMock, patch
+
+import click
+from click.testing import CliRunner
+
+from gibr.cli.pick import Picker, Screen, load_issues, pick
+from gibr.completion import lookup, write_snapshot
+from gibr.issue import Issue
+
+ISSUES = [
+    Issue(id=12, title="Fix login", assignee=None),
+    Issue(id=13, title="Add logout", assignee=None),
+    Issue(id=14, title="Write docs", assignee=None),
+]
+DOWN = "\x1b[B"
+UP = "\x1b[A"
+
+
+def _picker():
+    """Return a picker over ISSUES."""
+    return Picker([(issue.id, issue.title) for issue in ISSUES])
+
+
+def test_picker_filters_as_keys_are_typed():
+    """Typing should narrow the issues and editing keys should widen them."""
+    picker = _picker()
+    for key in "lout":
+        assert picker.handle(key) is None
+    assert picker.selection() == ("13", "Add logout")
+    picker.handle("\x7f")
+    assert [picker.issues[i][0] for i in picker.visible()] == ["13"]
+    picker.handle("\x15")
+    assert picker.query == ""
+    picker.handle("do")
+    picker.handle(" x")
+    picker.handle("\x17")
+    assert picker.query == "do"
+    assert picker.handle("\x1b") == "cancel"
+
+
+def test_picker_moves_selection_within_matches():
+    """Arrow keys should move the selection without leaving the matches."""
+    picker = _picker()
+    picker.handle(UP)
+    assert picker.selection() == ("12", "Fix login")
+    for _ in range(5):
+        picker.handle(DOWN)
+    assert picker.selection() == ("14", "Write docs")
+    assert picker.handle("\r") == "pick"
+    picker.handle("zzz")
+    picker.handle(DOWN)
+    assert picker.selection() is None
+    assert picker.handle("\r") is None
+
+
+def test_picker_merges_fresh_issues():
+    """Fresh issues should be added, renamed or dropped in place."""
+    picker = _picker()
+    picker.handle("log")
+    picker.merge([(13, "Add sign out"), (15, "Blog post")])
+    picker.keep_only([13, 14, 15])
+    assert [picker.issues[i] for i in picker.visible()] == [("15", "Blog post")]
+    lines = [click.unstyle(line) for line in picker.lines(width=80)]
+    assert lines == ["> log  1/3 (loading)", "▶ 15 Blog post"]
+
+
+def test_load_issues_streams_into_picker_and_saves_snapshot(git_repo):
+    """Loaded issues should replace the cached ones and the snapshot."""
+    write_snapshot([Issue(id=11, title="Closed since", assignee=None)])
+    picker = Picker(lookup(""))
+    tracker = MagicMock()
+    tracker.iter_issues.return_value = iter(ISSUES)
+    with patch.object(Screen, "draw"):
+        load_issues(lambda: tracker, Screen(picker))
+    assert [picker.issues[i][0] for i in picker.visible()] == ["12", "13", "14"]
+    assert picker.status == ""
+    assert [issue_id for issue_id, _ in lookup("1")] == ["12", "13", "14"]
+
+
+def test_load_issues_keeps_cached_issues_when_offline():
+    """A failing tracker should leave the cached issues to pick from."""
+    picker = _picker()
+    tracker = MagicMock()
+    tracker.iter_issues.side_effect = ConnectionError("offline")
+    with patch.object(Screen, "draw"):
+        load_issues(lambda: tracker, Screen(picker))
+    assert picker.status == "offline"
+    assert len(picker.visible()) == len(ISSUES)
+
+
+def test_load_issues_builds_tracker_in_background():
+    """A tracker that can't even be built should also mean offline."""
+    picker = _picker()
+    factory = MagicMock(side_effect=ConnectionError("no route to host"))
+    with patch.object(Screen, "draw"):
+        load_issues(factory, Screen(picker))
+    factory.assert_called_once_with()
+    assert picker.status == "offline"
+
+
+@patch("gibr.cli.pick._is_interactive", return_value=True)
+@patch("gibr.cli.pick.create")
+@patch("gibr.cli.pick.click.getchar")
+def test_pick_creates_branch_for_picked_issue(
+    mock_getchar, mock_create, _mock_interactive, git_repo
+):
+    """Enter should create the branch of the selected issue."""
+    write_snapshot(ISSUES)
+    mock_getchar.side_effect = ["o", "c", DOWN, "\r"]
+    tracker = MagicMock()
+    tracker.iter_issues.return_value = iter(ISSUES)
+    result = CliRunner().invoke(pick, obj={"tracker_factory": lambda: tracker})
+    assert result.exit_code == 0, result.output
+    mock_create.assert_called_once_with(issue_numbers=("14",))
+
+
+@patch("gibr.cli.pick._is_interactive", return_value=True)
+@patch("gibr.cli.pick.create")
+@patch("gibr.cli.pick.click.getchar", side_effect=KeyboardInterrupt)
+def test_pick_cancelled(_mock_getchar, mock_create, _mock_interactive):
+    """Ctrl-C should leave without creating a branch."""
+    result = CliRunner().invoke(pick, obj={"tracker_factory": MagicMock()})
+    assert result.exit_code == 0
+    assert "No issue picked." in result.output
+    mock_create.assert_not_called()
+
+
+def test_pick_needs_a_terminal():
+    """Without a terminal, pick should point to create."""
+    result = CliRunner().invoke(pick, obj={"tracker_factory": MagicMock()})
+    assert result.exit_code == 1
+    assert "interactive terminal" in result.output
@@ -0,0 +1,129 @@
+"""Tests for gibr.prompt and the status command."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from gibr.branchindex import BranchIndex
+from gibr.cli.status import status
+from gibr.issue import Issue
+from gibr.prompt import branch_issue, branch_pattern, main, prompt_text
+from tests.conftest import git
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+def _checkout_recorded(issue_id, title, branch_name):
+    """Create and check out a branch recorded for an issue."""
+    git(".", "checkout", "-q", "-b", branch_name)
+    issue = Issue(id=issue_id, title=title, assignee=None)
+    BranchIndex.for_repo().record("jira", issue, branch_name)
+
+
+def test_prompt_text_from_branch_index(git_repo):
+    """A branch created by gibr should show its issue and title."""
+    _checkout_recorded("PROJ-12", "Fix login", "proj-12-fix-login")
+    assert prompt_text() == "PROJ-12 Fix login"
+    assert branch_issue() == ("proj-12-fix-login", "PROJ-12", "Fix login")
+
+    _checkout_recorded("PROJ-13", "A" * 50, "proj-13-long")
+    assert prompt_text() == "PROJ-13 " + "A" * 39 + "…"
+
+
+def test_prompt_text_from_branch_name_format(git_repo):
+    """Other branches should be matched against branch_name_format."""
+    (git_repo / ".gibrconfig").write_text(
+        "[DEFAULT]\nbranch_name_format = feature/{issue}-{title}\n"
+        "[issue-tracker]\nname = jira\n"
+    )
+    _checkout_recorded("PROJ-12", "Fix login", "feature/PROJ-12-fix-login")
+    git(git_repo, "checkout", "-q", "-b", "feature/PROJ-12-fix-login-2")
+    assert prompt_text() == "PROJ-12 Fix login"
+
+    git(git_repo, "checkout", "-q", "-b", "feature/PROJ-7-other")
+    assert prompt_text() == "PROJ-7"
+
+    git(git_repo, "checkout", "-q", "-b", "experiment")
+    assert prompt_text() == ""
+
+
+def test_prompt_text_without_branch(git_repo, tmp_path, monkeypatch):
+    """Detached heads, worktrees and directories outside git are handled."""
+    _checkout_recorded("PROJ-12", "Fix login", "proj-12-fix-login")
+    git(git_repo, "worktree", "add", "-q", str(tmp_path / "wt"), "main")
+    git(tmp_path / "wt", "checkout", "-q", "--detach")
+    monkeypatch.chdir(tmp_path / "wt")
+    assert branch_issue() == (None, "", "")
+
+    git(
+        tmp_path / "wt",
+        "checkout",
+        "-q",
+        "proj-12-fix-login",
+        "--ignore-other-worktrees",
+    )
+    assert prompt_text() == "PROJ-12 Fix login"
+
+    monkeypatch.chdir(tmp_path)
+    assert prompt_text() == ""
+
+
+def test_branch_pattern():
+    """Placeholders should match issue IDs and free text, plus a suffix."""
+    pattern = branch_pattern("{issuetype}/{issue}-{title}")
+    assert pattern.fullmatch("bug/PROJ-1-fix-it")["issue"] == "PROJ-1"
+    assert pattern.fullmatch("bug/12-fix-it-20240101")["issue"] == "12"
+    assert pattern.fullmatch("main") is None
+
+    pattern = branch_pattern("{issuetype|map:bug=fix}/{issue|lower}-{title|truncate:5}")
+    assert pattern.fullmatch("fix/proj-1-fix-i")["issue"] == "proj-1"
+
+
+def test_main_prompt_fast_path_imports(git_repo):
+    """`gibr status --prompt` must not import click, GitPython or trackers."""
+    _checkout_recorded("PROJ-12", "Fix login", "proj-12-fix-login")
+    code = (
+        "import sys\n"
+        "sys.argv = ['gibr', 'status', '--prompt']\n"
+        "from gibr.prompt import main\n"
+        "main()\n"
+        "heavy = {'click', 'git', 'requests', 'gibr.trackers', 'gibr.cli'}\n"
+        "print(sorted(heavy & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC), "PATH": ""},
+        check=True,
+    )
+    assert result.stdout.splitlines() == ["PROJ-12 Fix login", "[]"]
+
+
+def test_main_dispatches_other_commands_to_click():
+    """Anything other than the prompt fast path should run the full CLI."""
+    with (
+        patch.object(sys, "argv", ["gibr", "issues"]),
+        patch("gibr.cli.cli") as mock_cli,
+    ):
+        main()
+    mock_cli.assert_called_once_with()
+
+
+def test_status_command(git_repo):
+    """`gibr status` should describe the branch and its issue."""
+    git(git_repo, "checkout", "-q", "-b", "experiment")
+    result = CliRunner().invoke(status, [])
+    assert "No issue found for branch 'experiment'." in result.output
+    assert CliRunner().invoke(status, ["--prompt"]).output == ""
+
+    _checkout_recorded("PROJ-12", "Fix login", "proj-12-fix-login")
+    result = CliRunner().invoke(status, [])
+    assert "On branch 'proj-12-fix-login' for issue PROJ-12: Fix login" in result.output
+    assert CliRunner().invoke(status, ["--prompt"]).output == "PROJ-12 Fix login\n"
+
+    git(git_repo, "checkout", "-q", "--detach")
+    assert "Not on a branch." in CliRunner().invoke(status, []).output
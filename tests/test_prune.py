@@ -0,0 +1,122 @@
+"""Tests for the prune command."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from click.testing import CliRunner
+
+from gibr.branchindex import BranchIndex
+from gibr.cli.prune import prune
+from gibr.git import delete_branches
+from gibr.gitbackend import GitBackendError
+from gibr.issue import Issue
+from tests.conftest import git
+
+
+def _obj(*closed):
+    """Return the ctx.obj for prune with the given issue numbers closed."""
+    config = MagicMock()
+    config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}-{title}"},
+        "issue-tracker": {"name": "github"},
+    }
+    tracker = MagicMock(numeric_issues=True)
+    tracker.find_issues.side_effect = lambda ids: {
+        i: Issue(
+            id=int(i),
+            title="x",
+            assignee=None,
+            state="closed" if int(i) in closed else "open",
+            closed=int(i) in closed,
+        )
+        for i in ids
+    }
+    return {"config": config, "tracker": tracker}
+
+
+def _branches(git_repo, *names, push=False):
+    """Create branches, optionally pushing them with an upstream."""
+    for name in names:
+        git(git_repo, "branch", name)
+        if push:
+            git(git_repo, "push", "-q", "-u", "origin", name)
+
+
+def test_prune_dry_run_shows_plan(git_repo):
+    """--dry-run should list closed-issue branches and delete nothing."""
+    _branches(git_repo, "12-a", "13-b", "wip")
+
+    result = CliRunner().invoke(prune, ["--dry-run"], obj=_obj(12))
+
+    assert result.exit_code == 0
+    assert "12-a" in result.output
+    assert "13-b" not in result.output
+    assert "12-a" in git(git_repo, "branch", "--list", "12-a")
+
+
+def test_prune_deletes_local_and_remote_branches(git_repo):
+    """Confirmed prunes delete local refs, config and remote branches."""
+    _branches(git_repo, "12-a", "13-b", "14-c", push=True)
+    _branches(git_repo, "15-d")
+    BranchIndex.for_repo().record("github", Issue(12, "A", None), "12-a")
+    git(git_repo, "checkout", "-q", "14-c")
+
+    result = CliRunner().invoke(prune, ["--remote"], obj=_obj(12, 14, 15), input="y\n")
+
+    assert result.exit_code == 0, result.output
+    assert "Deleted 2 local branch(es)." in result.output
+    assert "Deleted 1 branch(es) on origin." in result.output
+    assert git(git_repo, "branch", "--format=%(refname:short)").split() == [
+        "13-b",
+        "14-c",
+        "main",
+    ]
+    remote = git(git_repo, "ls-remote", "--heads", "origin")
+    assert "12-a" not in remote
+    assert "14-c" in remote
+    assert "refs/remotes/origin/12-a" not in git(git_repo, "for-each-ref")
+    assert "branch.12-a" not in git(git_repo, "config", "--list")
+    assert BranchIndex.for_repo().entries("github", 12) == []
+
+
+def test_prune_can_be_declined(git_repo):
+    """Answering no should keep every branch."""
+    _branches(git_repo, "12-a")
+    result = CliRunner().invoke(prune, [], obj=_obj(12), input="n\n")
+    assert "Deleted" not in result.output
+    assert git(git_repo, "branch", "--list", "12-a")
+
+
+def test_prune_reports_failed_remote_deletes(git_repo):
+    """A failed remote delete should be reported, not fatal."""
+    _branches(git_repo, "12-a", push=True)
+    git(git_repo, "branch", "-D", "12-a")
+    CliRunner().invoke(prune, ["--remote", "--dry-run"], obj=_obj(12))
+    git(git_repo, "remote", "set-url", "origin", str(git_repo / "missing.git"))
+
+    result = CliRunner().invoke(prune, ["--remote", "--yes"], obj=_obj(12))
+
+    assert result.exit_code == 0
+    assert "Could not delete '12-a' on origin" in result.output
+    assert "Deleted" not in result.output
+
+
+def test_prune_without_closed_issues(git_repo):
+    """Nothing should happen when no branch belongs to a closed issue."""
+    _branches(git_repo, "12-a")
+    result = CliRunner().invoke(prune, ["--yes"], obj=_obj())
+    assert "No branches belong to closed issues." in result.output
+
+
+def test_prune_outside_repository():
+    """The command should fail outside a repository."""
+    result = CliRunner().invoke(prune, [], obj=_obj())
+    assert "Not inside a git repository." in result.output
+
+
+def test_delete_branches_is_all_or_nothing(git_repo):
+    """A failing ref should leave every branch in place."""
+    _branches(git_repo, "12-a")
+    with pytest.raises(GitBackendError):
+        delete_branches(git_repo / ".git", ["12-a", "bad..name"])
+    assert git(git_repo, "branch", "--list", "12-a")
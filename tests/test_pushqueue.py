@@ -0,0 +1,117 @@
+"""Tests for gibr.pushqueue."""
+
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+import gibr.pushqueue
+from gibr.cli.push import push, report_background_pushes
+from gibr.paths import state_dir
+from gibr.pushqueue import PushQueue, queue_push
+from tests.conftest import git
+
+
+def test_run_pushes_queued_branches_in_one_push(git_repo):
+    """Branches queued for the same remote should be pushed together."""
+    git(git_repo, "branch", "a")
+    git(git_repo, "branch", "b")
+    queue = PushQueue.for_repo()
+    queue.add("origin", ["a", "b"])
+    queue.add("origin", ["a"])  # already queued, not duplicated
+    assert len(queue.pending()) == 2  # noqa: PLR2004
+
+    with patch("gibr.pushqueue._git", wraps=gibr.pushqueue._git) as spy:
+        results = queue.run()
+
+    pushes = [c for c in spy.call_args_list if c.args[1] == "push"]
+    assert len(pushes) == 1
+    assert all(result["ok"] for result in results)
+    assert queue.pending() == []
+    assert "refs/heads/b" in git(git_repo, "ls-remote", "--heads", "origin")
+    assert git(git_repo, "config", "branch.a.remote") == "origin"
+    assert len(queue.take_results()) == 2  # noqa: PLR2004
+    assert queue.take_results() == []
+
+
+def test_failed_push_stays_queued(git_repo):
+    """A failed push should be kept with its error for a later retry."""
+    git(git_repo, "branch", "a")
+    queue = PushQueue.for_repo()
+    queue.add("nowhere", ["a", "gone"])
+
+    results = queue.run(record=False)
+
+    assert [r["ok"] for r in results] == [False, False]
+    jobs = {job["branch"]: job for job in queue.pending()}
+    assert jobs["a"]["attempts"] == 1
+    assert "nowhere" in jobs["a"]["error"]
+    assert jobs["gone"]["error"] == "branch no longer exists locally"
+    assert queue.take_results() == []
+
+
+def test_queue_push_records_and_spawns_worker(git_repo):
+    """queue_push should persist the job before starting the worker."""
+    with patch.object(PushQueue, "spawn_worker") as mock_spawn:
+        queue = queue_push(git_repo / ".git", "origin", ["a"])
+    assert queue.directory == state_dir()
+    assert queue.pending()[0]["branch"] == "a"
+    mock_spawn.assert_called_once()
+
+
+def test_worker_pushes_in_background(git_repo):
+    """The detached worker should drain the queue on its own."""
+    git(git_repo, "branch", "a")
+    queue = PushQueue.for_repo()
+    queue.add("origin", ["a"])
+    with patch("gibr.pushqueue.subprocess.Popen") as mock_popen:
+        queue.spawn_worker()
+    args = mock_popen.call_args.args[0]
+    assert args[1:] == ["-m", "gibr.pushqueue", str(queue.directory)]
+
+    queue.run_worker()
+    assert queue.pending() == []
+
+
+@patch("gibr.cli.push.info")
+@patch("gibr.cli.push.warning")
+@patch("gibr.cli.push.success")
+def test_report_background_pushes(mock_success, mock_warning, mock_info, git_repo):
+    """Results from the worker should be reported once, with a retry hint."""
+    report_background_pushes()  # no queue file yet
+    mock_success.assert_not_called()
+
+    git(git_repo, "branch", "a")
+    queue = PushQueue.for_repo()
+    queue.add("origin", ["a", "gone"])
+    queue.run()
+
+    report_background_pushes()
+    mock_success.assert_called_once_with("Pushed branch 'a' to origin.")
+    mock_warning.assert_called_once()
+    mock_info.assert_called_once_with("Run `gibr push --pending` to retry.")
+
+
+def test_push_command_lists_and_retries(git_repo):
+    """`gibr push` lists jobs; `gibr push --pending` pushes them."""
+    runner = CliRunner()
+    result = runner.invoke(push, [])
+    assert "No pending pushes." in result.output
+
+    git(git_repo, "branch", "a")
+    PushQueue.for_repo().add("origin", ["a"])
+    result = runner.invoke(push, [])
+    assert "origin a" in result.output
+    assert "gibr push --pending" in result.output
+
+    result = runner.invoke(push, ["--pending"])
+    assert result.exit_code == 0
+    assert "Pushed branch 'a' to origin." in result.output
+    assert PushQueue.for_repo().pending() == []
+
+
+def test_push_command_outside_repo(tmp_path, monkeypatch):
+    """`gibr push` should fail outside a git repository."""
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(push, [])
+    assert result.exit_code != 0
+    assert "Not inside a git repository." in result.output
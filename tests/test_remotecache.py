@@ -0,0 +1,84 @@
+"""Tests for gibr.remotecache."""
+
+import os
+import time
+from unittest.mock import patch
+
+from gibr.git import RefIndex
+from gibr.remotecache import RemoteRefCache
+from tests.conftest import git
+
+
+def _push(git_repo, *branches):
+    """Create branches on origin without remote-tracking refs for them."""
+    for branch in branches:
+        git(git_repo, "push", "-q", "origin", f"main:refs/heads/{branch}")
+        git(git_repo, "update-ref", "-d", f"refs/remotes/origin/{branch}")
+
+
+def test_refresh_lists_remote_branches_and_head(git_repo):
+    """A cold cache should be filled with a single ls-remote."""
+    _push(git_repo, "12-a", "12-b", "13-c")
+    cache = RemoteRefCache(RefIndex.for_path(git_repo))
+
+    assert cache.branches() == ["12-a", "12-b", "13-c", "main"]
+    assert cache.default_branch() == "main"
+    assert cache.exists("12-a")
+    assert not cache.exists("12")
+    assert cache.with_prefix("12-") == ["12-a", "12-b"]
+    assert cache.with_prefix("9") == []
+
+
+def test_cache_is_reused_within_ttl(git_repo):
+    """A fresh cache should answer queries without going to the network."""
+    refs = RefIndex.for_path(git_repo)
+    RemoteRefCache(refs).branches()
+    _push(git_repo, "12-a")
+
+    with patch("gibr.remotecache.subprocess.run") as mock_run:
+        assert not RemoteRefCache(refs).exists("12-a")
+    mock_run.assert_not_called()
+
+    with patch("gibr.remotecache.time.time", return_value=time.time() + 3600):
+        assert RemoteRefCache(refs).exists("12-a")
+
+
+def test_cache_is_rebuilt_from_tracking_refs_after_fetch(git_repo):
+    """A fetch newer than the cache should be picked up without ls-remote."""
+    refs = RefIndex.for_path(git_repo)
+    RemoteRefCache(refs).branches()
+    git(git_repo, "push", "-q", "origin", "main:refs/heads/12-a")
+    git(git_repo, "fetch", "-q", "origin")
+    future = time.time() + 10
+    os.utime(git_repo / ".git" / "FETCH_HEAD", (future, future))
+
+    with patch("gibr.remotecache.subprocess.run") as mock_run:
+        assert RemoteRefCache(refs).branches() == ["12-a", "main"]
+    mock_run.assert_not_called()
+
+
+def test_zero_ttl_and_offline_use_tracking_refs(git_repo):
+    """Without network access the remote-tracking refs should be used."""
+    _push(git_repo, "12-a")
+    git(git_repo, "remote", "set-head", "origin", "main")
+    refs = RefIndex.for_path(git_repo)
+
+    cache = RemoteRefCache(refs, ttl=0)
+    assert cache.branches() == ["main"]
+    assert cache.default_branch() == "main"
+
+    git(git_repo, "remote", "set-url", "origin", str(git_repo / "missing.git"))
+    assert RemoteRefCache(refs).branches() == ["main"]
+
+
+def test_add_records_pushed_branch(git_repo):
+    """Pushed branches should be added to a loaded cache."""
+    refs = RefIndex.for_path(git_repo)
+    cache = RemoteRefCache(refs)
+    cache.add("12-a")  # not loaded yet, nothing to update
+    cache.branches()
+    cache.add("12-a")
+
+    with patch("gibr.remotecache.subprocess.run") as mock_run:
+        assert RemoteRefCache(refs).branches() == ["12-a", "main"]
+    mock_run.assert_not_called()
@@ -0,0 +1,66 @@
+"""Tests for gibr.slug."""
+
+import random
+
+import pytest
+from slugify import slugify as reference_slugify
+
+from gibr.slug import slugify
+
+CORPUS = [
+    "",
+    "Fix login bug",
+    "Add support for OAuth2 / login (beta)",
+    "  --Leading and trailing--  ",
+    "Don't break the 'quoted' words",
+    "Costs 1,000,000 dollars, or 1, 2 and 3",
+    "snake_case and CamelCase and kebab-case",
+    "Tabs\tand\nnewlines\r\n",
+    "[PROJ-12] Crash: null pointer @ startup?!",
+    "100% of `code` ~ ^ * & | < > { }",
+    "Café crème brûlée",
+    "Straße über Ärger",
+    "Ελληνικά και Русский текст",
+    "中文标题 with 日本語 and 한국어",
+    "Emoji 🎉 rocket 🚀 done ✅",
+    "ﬁnance ligature and Ｆｕｌｌｗｉｄｔｈ",
+    "Kelvin K sign and Å ångström",
+    "İstanbul ıı",
+    "Combining é and ä",
+    "Modifier ʼapostrophe and ‘curly’ “quotes”",
+    "½ price, ² squared, № 5",
+    "Tom &amp; Jerry &lt;3",
+    "Decimal &#233; and hex &#xe9; references",
+    "Broken &#99999999999; and &bogus; entities",
+    "＆amp; test",
+    "ﬁle ＆#39;",
+    "\x00 null and \x7f delete",
+    "Arabic العربية and Hebrew עברית",
+    "Devanagari हिन्दी and Thai ภาษาไทย",
+]
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_slugify_matches_python_slugify(text):
+    """Slugs should be byte-identical to python-slugify's."""
+    assert slugify(text) == reference_slugify(text)
+
+
+def test_slugify_decodes_entities_made_by_normalization():
+    """A fullwidth ＆ becomes & before entities are decoded."""
+    assert slugify("＆amp; test") == "test"
+    assert slugify("ﬁle ＆#39;") == "file"
+
+
+def test_slugify_matches_python_slugify_on_random_text():
+    """Random mixes of tricky characters should slugify identically."""
+    alphabet = "aZ09 -_',.&;#x" + "éßÅﬁ½Κж中🎉́ʼ’İ＆\t"
+    rng = random.Random(42)
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+        assert slugify(text) == reference_slugify(text), repr(text)
+
+
+def test_slugify_non_str_falls_back():
+    """Values that are not str should be handled by python-slugify."""
+    assert slugify(b"Bytes Title") == reference_slugify(b"Bytes Title")
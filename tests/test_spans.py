@@ -0,0 +1,148 @@
+"""Tests for phase spans and their OTLP/JSON export."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from gibr import spans
+from gibr.cli import cli
+from gibr.issue import Issue
+from gibr.offline import call_with_deadline
+from gibr.spans import NO_SPAN, SpanRecorder, span
+
+
+def _spans(path):
+    """Return the spans of the single trace in path, by name."""
+    (line,) = path.read_text().splitlines()
+    (resource_spans,) = json.loads(line)["resourceSpans"]
+    (scope_spans,) = resource_spans["scopeSpans"]
+    return {s["name"]: s for s in scope_spans["spans"]}
+
+
+def _attributes(otlp_span):
+    """Return the attributes of an OTLP span as a dict of typed values."""
+    return {a["key"]: a["value"] for a in otlp_span["attributes"]}
+
+
+def test_span_does_nothing_when_not_recording():
+    """Without a recorder every span is the shared no-op."""
+    with span("issue fetch", issues=1) as current:
+        current.set(more=2)
+    assert current is NO_SPAN
+
+
+def test_recorder_nests_spans_and_http_requests(http_server, tmp_path):
+    """Spans nest, and requests are children of the span they are made in."""
+    path = tmp_path / "trace.json"
+    recorder = SpanRecorder(path, "gibr create", **{"gibr.command": "create"})
+    recorder.start()
+    with span("issue fetch", **{"gibr.issue_count": 1}):
+        requests.get(f"{http_server}/issues/7")
+    with pytest.raises(ValueError), span("branch generation"):
+        raise ValueError("too long")
+    assert recorder.finish() == path
+    assert spans._recorder is None
+
+    by_name = _spans(path)
+    root, fetch = by_name["gibr create"], by_name["issue fetch"]
+    assert "parentSpanId" not in root
+    assert fetch["parentSpanId"] == root["spanId"]
+    assert by_name["GET"]["parentSpanId"] == fetch["spanId"]
+    assert by_name["GET"]["kind"] == spans.SPAN_KIND_CLIENT
+    assert {s["traceId"] for s in by_name.values()} == {recorder.trace_id}
+    assert _attributes(fetch)["gibr.issue_count"] == {"intValue": "1"}
+    assert _attributes(by_name["GET"])["url.template"] == {
+        "stringValue": f"{http_server}/issues/{{id}}"
+    }
+    assert by_name["branch generation"]["status"] == {
+        "code": spans.STATUS_ERROR,
+        "message": "ValueError",
+    }
+    assert int(root["endTimeUnixNano"]) >= int(fetch["endTimeUnixNano"])
+
+
+def test_recorder_appends_to_file_and_adds_to_directory(tmp_path):
+    """A file gets one line per trace; a directory one file per trace."""
+    for _ in range(2):
+        recorder = SpanRecorder(tmp_path / "traces.json", "gibr issues")
+        recorder.start()
+        recorder.finish()
+    assert len((tmp_path / "traces.json").read_text().splitlines()) == 2  # noqa: PLR2004
+
+    directory = tmp_path / "traces"
+    directory.mkdir()
+    recorder = SpanRecorder(directory, "gibr issues")
+    recorder.start()
+    written = recorder.finish()
+    assert written.parent == directory
+    assert recorder.trace_id[:8] in written.name
+
+
+def test_call_with_deadline_keeps_the_current_span(tmp_path):
+    """Spans started in the deadline thread stay children of the caller's span."""
+    recorder = SpanRecorder(tmp_path / "trace.json", "gibr create")
+    recorder.start()
+
+    def fetch():
+        with span("tracker construction"):
+            return 1
+
+    with span("issue fetch"):
+        call_with_deadline(fetch, timeout=5)
+    recorder.finish()
+
+    by_name = _spans(tmp_path / "trace.json")
+    assert (
+        by_name["tracker construction"]["parentSpanId"]
+        == by_name["issue fetch"]["spanId"]
+    )
+
+
+@patch("gibr.cli.create.get_tracker_class", return_value=MagicMock())
+@patch("gibr.factory.get_tracker_class")
+@patch("gibr.cli.GibrConfig")
+def test_cli_exports_create_phases(
+    mock_config, mock_tracker_class, _mock_create_class, http_server, git_repo
+):
+    """Create should export its phases, with the tracker's requests."""
+    config = MagicMock()
+    config.config = {
+        "DEFAULT": {"branch_name_format": "{issue}-{title}", "push": "false"},
+        "issue-tracker": {"name": "github"},
+    }
+    mock_config.return_value.load.return_value = config
+    tracker = MagicMock(numeric_issues=True)
+    tracker.get_issue.side_effect = lambda issue_id: (
+        requests.get(f"{http_server}/issues/{issue_id}"),
+        Issue(id=issue_id, title="Fix login", assignee=None),
+    )[1]
+    mock_tracker_class.return_value.from_config.return_value = tracker
+    path = git_repo / "trace.json"
+
+    result = CliRunner().invoke(cli, [f"--otlp-file={path}", "create", "7"])
+
+    assert result.exit_code == 0, result.output
+    by_name = _spans(path)
+    root = by_name["gibr create"]
+    phases = ("config discovery", "tracker construction", "issue fetch")
+    phases += ("branch generation", "ref lookup", "ref creation", "checkout")
+    for phase in phases:
+        assert by_name[phase]["parentSpanId"] == root["spanId"]
+    assert by_name["GET"]["parentSpanId"] == by_name["issue fetch"]["spanId"]
+
+
+@patch("gibr.cli.GibrConfig")
+def test_cli_marks_failed_command(mock_config, tmp_path, monkeypatch):
+    """A command that fails should export a root span with an error status."""
+    mock_config.return_value.load.side_effect = ValueError("bad config")
+    monkeypatch.setenv("GIBR_OTLP_FILE", str(tmp_path / "trace.json"))
+
+    result = CliRunner().invoke(cli, ["issues"])
+
+    assert result.exit_code == 1
+    by_name = _spans(tmp_path / "trace.json")
+    assert by_name["gibr issues"]["status"]["message"] == "ValueError"
+    assert by_name["config discovery"]["status"]["message"] == "ValueError"
@@ -0,0 +1,165 @@
+"""Tests for tracing the issue tracker's HTTP requests."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from click.testing import CliRunner
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from gibr.cli import cli
+from gibr.tracing import HttpTracer, report_trace, url_template
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://api.github.com/repos/o/r/issues/123", "/repos/o/r/issues/{id}"),
+        (
+            "https://x.atlassian.net/rest/api/2/issue/FOO-42",
+            "/rest/api/{id}/issue/{id}",
+        ),
+        (
+            "https://dev.azure.com/o/p/_apis/wit/workitems/7?api-version=7.1",
+            "/o/p/_apis/wit/workitems/{id}?api-version",
+        ),
+        (
+            "https://h/p/0f8fad5b-d9cb-469f-a165-70867728950e/x",
+            "/p/{id}/x",
+        ),
+        ("https://h/search?jql=project%3DFOO&startAt=50", "/search?jql&startAt"),
+    ],
+)
+def test_url_template_replaces_ids_and_drops_query_values(url, expected):
+    """IDs become {id} and only query keys are kept."""
+    assert url_template(url).endswith(expected)
+
+
+def test_url_template_drops_credentials():
+    """Credentials in the URL never reach the trace."""
+    assert url_template("https://user:secret@h:8443/a") == "https://h:8443/a"
+
+
+def test_tracer_records_requests_and_restores_send(http_server):
+    """Each request gets a record; uninstalling restores requests."""
+    original = requests.Session.send
+    with HttpTracer() as tracer:
+        session = requests.Session()
+        session.get(f"{http_server}/repos/o/r/issues/12?state=open")
+        session.post(f"{http_server}/graphql", json={"query": "q"})
+    assert requests.Session.send is original
+
+    get, post = tracer.records
+    assert get["method"] == "GET"
+    assert get["url"] == f"{http_server}/repos/o/r/issues/{{id}}?state"
+    assert get["status"] == 200  # noqa: PLR2004
+    assert get["bytes_in"] == 5  # noqa: PLR2004
+    assert post["status"] == 201  # noqa: PLR2004
+    assert post["bytes_out"] == len(json.dumps({"query": "q"}))
+    for record in tracer.records:
+        assert record["connect_ms"] > 0
+        assert record["total_ms"] >= record["ttfb_ms"] > 0
+        assert record["end_ns"] >= record["start_ns"]
+
+
+def test_tracer_counts_retries(http_server):
+    """Retries made by urllib3 are counted on the final request."""
+    session = requests.Session()
+    retry = Retry(total=2, status_forcelist=[503], backoff_factor=0)
+    session.mount("http://", HTTPAdapter(max_retries=retry))
+    with HttpTracer() as tracer:
+        session.get(f"{http_server}/flaky")
+    assert tracer.records[0]["status"] == 200  # noqa: PLR2004
+    assert tracer.records[0]["retries"] == 1
+
+
+def test_tracer_records_failed_requests():
+    """Requests that fail to connect are recorded with their error."""
+    with HttpTracer() as tracer, pytest.raises(requests.ConnectionError):
+        requests.get("http://localhost:1/", timeout=1)
+    assert tracer.records[0]["status"] is None
+    assert tracer.records[0]["error"] == "ConnectionError"
+
+
+def test_report_trace_prints_summary_table(http_server, capsys):
+    """Requests are grouped by method, URL template and status."""
+    tracer = HttpTracer()
+    tracer.install()
+    session = requests.Session()
+    session.get(f"{http_server}/issues/1")
+    session.get(f"{http_server}/issues/2")
+    report_trace(tracer)
+    err = capsys.readouterr().err
+    row = next(line for line in err.splitlines() if "/issues/{id}" in line)
+    cells = [cell.strip() for cell in row.split("|")]
+    assert cells[1:5] == ["GET", f"{http_server}/issues/{{id}}", "200", "2"]
+    assert "Total" in err
+
+
+def test_report_trace_without_requests(capsys):
+    """An empty trace says so."""
+    tracer = HttpTracer()
+    tracer.install()
+    report_trace(tracer)
+    assert "No tracker requests were made." in capsys.readouterr().err
+
+
+def test_report_trace_writes_ndjson(http_server, tmp_path):
+    """A trace file gets one JSON object per request."""
+    path = tmp_path / "trace.ndjson"
+    tracer = HttpTracer()
+    tracer.install()
+    requests.get(f"{http_server}/issues/1")
+    report_trace(tracer, str(path))
+    (line,) = path.read_text().splitlines()
+    assert json.loads(line)["url"] == f"{http_server}/issues/{{id}}"
+
+
+@patch("gibr.cli.alias.party", return_value=None)
+@patch("gibr.cli.alias.success", return_value=None)
+@patch("git.GitConfigParser", return_value=MagicMock())
+@patch("gibr.cli.get_tracker")
+@patch("gibr.cli.GibrConfig", return_value=MagicMock())
+def test_cli_trace_option_reports_after_the_command(
+    _mock_config,
+    mock_get_tracker,
+    _mock_gitconfig,
+    _mock_success,
+    _mock_party,
+    http_server,
+):
+    """--trace prints the table once the command is done."""
+    mock_get_tracker.side_effect = lambda config: requests.get(
+        f"{http_server}/issues/1"
+    )
+
+    result = CliRunner().invoke(cli, ["--trace", "alias"])
+
+    assert result.exit_code == 0, result.output
+    assert f"{http_server}/issues/{{id}}" in result.stderr
+    assert requests.Session.send.__name__ == "send"
+
+
+@patch("gibr.cli.alias.party", return_value=None)
+@patch("gibr.cli.alias.success", return_value=None)
+@patch("git.GitConfigParser", return_value=MagicMock())
+@patch("gibr.cli.get_tracker", return_value=MagicMock())
+@patch("gibr.cli.GibrConfig", return_value=MagicMock())
+def test_cli_trace_file_option_writes_ndjson(
+    _mock_config,
+    _mock_get_tracker,
+    _mock_gitconfig,
+    _mock_success,
+    _mock_party,
+    tmp_path,
+):
+    """--trace-file writes the trace instead of the table."""
+    path = tmp_path / "trace.ndjson"
+
+    result = CliRunner().invoke(cli, [f"--trace-file={path}", "alias"])
+
+    assert result.exit_code == 0, result.output
+    assert path.read_text() == ""
+    assert f"Traced 0 request(s) to {path}." in result.stderr
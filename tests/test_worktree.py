@@ -0,0 +1,94 @@
+"""Tests for gibr.worktree and the worktrees command."""
+
+import shutil
+from unittest.mock import MagicMock, patch
+
+import click
+import pytest
+from click.testing import CliRunner
+from git import Repo
+
+from gibr.cli.worktrees import worktrees
+from gibr.worktree import create_worktree, fill_pool, list_worktrees
+from tests.conftest import git
+
+
+@patch("gibr.worktree.info")
+@patch("gibr.worktree.success")
+def test_create_worktree_leaves_checkout_untouched(_s, _i, git_repo):
+    """The branch should be checked out in a new worktree, not here."""
+    target = create_worktree("12-fix/login", is_push=True)
+
+    assert target == git_repo.parent / "repo.worktrees" / "12-fix" / "login"
+    assert (target / "README.md").exists()
+    assert git(git_repo, "branch", "--show-current") == "main"
+    assert git(target, "branch", "--show-current") == "12-fix/login"
+    assert "refs/heads/12-fix/login" in git(git_repo, "ls-remote", "origin")
+
+
+@patch("gibr.worktree.info")
+@patch("gibr.worktree.success")
+def test_create_worktree_sparse(_s, _i, git_repo):
+    """--sparse should only materialize the requested directories."""
+    for name in ("a", "b"):
+        (git_repo / name).mkdir()
+        (git_repo / name / "f.txt").write_text(name)
+    git(git_repo, "add", ".")
+    git(git_repo, "commit", "-qm", "dirs")
+
+    target = create_worktree(
+        "12-a", path=str(git_repo.parent / "wt"), sparse_paths=("a",), is_push=False
+    )
+
+    assert (target / "a" / "f.txt").exists()
+    assert not (target / "b").exists()
+    assert git(target, "status", "--porcelain") == ""
+
+
+@patch("gibr.worktree.queue_push")
+@patch("gibr.worktree.info")
+@patch("gibr.worktree.success")
+def test_create_worktree_reuses_pool(_s, _i, mock_queue_push, git_repo):
+    """A pooled worktree should be moved into place instead of added."""
+    repo = Repo(".")
+    assert fill_pool(repo, 2, worktree_dir="../trees") == 2  # noqa: PLR2004
+    assert fill_pool(repo, 2, worktree_dir="../trees") == 0
+    git(git_repo, "commit", "--allow-empty", "-qm", "newer")
+
+    target = create_worktree(
+        "12-a", worktree_dir="../trees", is_push=True, push_async=True
+    )
+
+    assert target == git_repo.parent / "trees" / "12-a"
+    assert git(target, "rev-parse", "HEAD") == git(git_repo, "rev-parse", "HEAD")
+    pooled = [w for w in list_worktrees(repo) if ".pool" in w["path"]]
+    assert len(pooled) == 1
+    mock_queue_push.assert_called_once()
+
+
+@patch("gibr.worktree.error", side_effect=click.Abort)
+def test_create_worktree_existing_path(mock_error, git_repo):
+    """An existing target directory should be rejected."""
+    with pytest.raises(click.Abort):
+        create_worktree("12-a", path=str(git_repo), is_push=False)
+    mock_error.assert_called_once_with(f"Worktree path already exists: {git_repo}")
+
+
+@patch("gibr.worktree.info")
+@patch("gibr.worktree.success")
+def test_worktrees_command_lists_pools_and_prunes(_s, _i, git_repo):
+    """`gibr worktrees` should list, fill the pool and prune stale entries."""
+    target = create_worktree("12-a", is_push=False)
+    shutil.rmtree(target)
+    obj = {"config": MagicMock(config={"DEFAULT": {}})}
+    runner = CliRunner()
+
+    result = runner.invoke(worktrees, [], obj=obj)
+    assert "12-a" in result.output
+
+    result = runner.invoke(worktrees, ["--prune", "--pool", "1"], obj=obj)
+    assert result.exit_code == 0
+    assert "Pruned" in result.output
+    assert "Added 1 worktree(s) to the pool." in result.output
+    assert "12-a" not in result.output.split("Pruned")[1].split("\n", 1)[1]
+    assert "(detached)" in result.output
@@ -523,3 +523,70 @@ def test_import_error_called_when_azure_missing(mock_import_error):
             )
 
     mock_import_error.assert_called_once_with("azure-devops", "azure")
+
+
+@patch("azure.devops.connection.Connection")
+@patch("msrest.authentication.BasicAuthentication")
+def test_get_issues_uses_batch_api(
+    _mock_auth, mock_connection_cls, mock_connection, mock_wit_client, mock_work_item
+):
+    """get_issues should fetch all work items in one batch call."""
+    mock_connection_cls.return_value = mock_connection
+    mock_wit_client.get_work_items.return_value = [mock_work_item, None]
+    tracker = AzureTracker("url", "token", "project", "team", ["Done"])
+
+    issues = tracker.get_issues(["42"])
+
+    mock_wit_client.get_work_items.assert_called_once_with([42], error_policy="Omit")
+    assert issues == [tracker._to_issue(mock_work_item)]
+
+
+@patch("gibr.trackers.azure.error", side_effect=click.Abort)
+@patch("azure.devops.connection.Connection")
+@patch("msrest.authentication.BasicAuthentication")
+def test_get_issues_reports_missing(
+    _mock_auth, mock_connection_cls, mock_error, mock_connection, mock_wit_client
+):
+    """get_issues should error for ids omitted from the batch response."""
+    mock_connection_cls.return_value = mock_connection
+    mock_wit_client.get_work_items.return_value = []
+    tracker = AzureTracker("url", "token", "project", "team", ["Done"])
+
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["7"])
+    mock_error.assert_called_once_with("Issues not found: 7")
+
+
+@patch("gibr.trackers.azure.error", side_effect=click.Abort)
+@patch("azure.devops.connection.Connection")
+@patch("msrest.authentication.BasicAuthentication")
+def test_get_issues_batch_failure(
+    _mock_auth, mock_connection_cls, mock_error, mock_connection, mock_wit_client
+):
+    """get_issues should error when the batch call raises."""
+    mock_connection_cls.return_value = mock_connection
+    mock_wit_client.get_work_items.side_effect = Exception("boom")
+    tracker = AzureTracker("url", "token", "project", "team", ["Done"])
+
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["7"])
+    assert "Failed to get issues" in mock_error.call_args[0][0]
+
+
+@patch("azure.devops.connection.Connection")
+@patch("msrest.authentication.BasicAuthentication")
+def test_find_issues_skips_missing_and_reads_state(
+    _mock_auth, mock_connection_cls, mock_connection, mock_wit_client, mock_work_item
+):
+    """find_issues should leave out omitted ids and mark closed states."""
+    mock_connection_cls.return_value = mock_connection
+    mock_work_item.fields["System.State"] = "Done"
+    mock_wit_client.get_work_items.return_value = [mock_work_item, None]
+    tracker = AzureTracker("url", "token", "project", "team", ["Done"])
+
+    found = tracker.find_issues(["42", "7", "42"])
+
+    mock_wit_client.get_work_items.assert_called_once_with([42, 7], error_policy="Omit")
+    assert list(found) == ["42"]
+    assert found["42"].state == "Done"
+    assert found["42"].closed
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import click
 import pytest
-from github.GithubException import UnknownObjectException
+from github.GithubException import GithubException, UnknownObjectException
 
 from gibr.issue import Issue
 from gibr.trackers.github import GithubTracker
@@ -14,7 +14,9 @@ from gibr.trackers.github import GithubTracker
 def mock_github_repo():
     """Fixture returning a mock repo with fake issues."""
     mock_repo = MagicMock()
-    mock_issue = MagicMock(number=123, title="Fix login bug", pull_request=None)
+    mock_issue = MagicMock(
+        number=123, title="Fix login bug", state="open", pull_request=None
+    )
     mock_repo.get_issue.return_value = mock_issue
     mock_repo.get_issues.return_value = [mock_issue]
     return mock_repo
@@ -193,3 +195,106 @@ def test_import_error_called_when_github_missing(mock_import_error):
             GithubTracker(repo="user/repo", token="tok")
 
     mock_import_error.assert_called_once_with("PyGithub", "github")
+
+
+@patch("github.Github")
+def test_get_issues_uses_single_graphql_query(
+    mock_github_cls, mock_github_client, mock_github_repo
+):
+    """get_issues should fetch all issues in one aliased GraphQL query."""
+    mock_github_cls.return_value = mock_github_client
+    mock_github_repo.full_name = "owner/repo"
+    requester = mock_github_client.requester
+    requester.requestJsonAndCheck.return_value = (
+        {},
+        {
+            "data": {
+                "repository": {
+                    "i1": {
+                        "number": 1,
+                        "title": "One",
+                        "state": "OPEN",
+                        "assignees": {"nodes": []},
+                    },
+                    "i2": {
+                        "number": 2,
+                        "title": "Two",
+                        "state": "CLOSED",
+                        "assignees": {"nodes": [{"login": "me"}]},
+                    },
+                }
+            }
+        },
+    )
+    tracker = GithubTracker(repo="owner/repo", token="t")
+
+    issues = tracker.get_issues(["2", "1"])
+
+    assert issues == [
+        Issue(id=2, title="Two", assignee="me", state="closed", closed=True),
+        Issue(id=1, title="One", assignee=None, state="open"),
+    ]
+    requester.requestJsonAndCheck.assert_called_once()
+    payload = requester.requestJsonAndCheck.call_args.kwargs["input"]
+    assert "i1: issue(number: 1)" in payload["query"]
+    assert payload["variables"] == {"owner": "owner", "name": "repo"}
+
+
+@patch("gibr.trackers.github.error", side_effect=click.Abort)
+@patch("github.Github")
+def test_get_issues_missing_issue_errors(
+    mock_github_cls, mock_error, mock_github_client, mock_github_repo
+):
+    """get_issues should error when an alias comes back empty."""
+    mock_github_cls.return_value = mock_github_client
+    mock_github_repo.full_name = "owner/repo"
+    mock_github_client.requester.requestJsonAndCheck.return_value = (
+        {},
+        {"data": {"repository": {"i9": None}}, "errors": [{"type": "NOT_FOUND"}]},
+    )
+    tracker = GithubTracker(repo="owner/repo", token="t")
+
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["9"])
+    mock_error.assert_called_once_with("Issue #9 not found in repository.")
+
+
+@patch("github.Github")
+def test_find_issues_batches_and_skips_missing(
+    mock_github_cls, mock_github_client, mock_github_repo
+):
+    """find_issues should query in batches and leave out unknown numbers."""
+    mock_github_cls.return_value = mock_github_client
+    mock_github_repo.full_name = "owner/repo"
+    issue = {"number": 1, "title": "One", "state": "OPEN", "assignees": {"nodes": []}}
+    mock_github_client.requester.requestJsonAndCheck.side_effect = [
+        ({}, {"data": {"repository": {"i1": issue, "i2": None}}}),
+        ({}, {"data": {"repository": {"i3": None}}}),
+    ]
+    tracker = GithubTracker(repo="owner/repo", token="t")
+    tracker.BATCH_SIZE = 2
+
+    found = tracker.find_issues(["1", "2", "3", "1"])
+
+    assert found == {"1": Issue(id=1, title="One", assignee=None, state="open")}
+    expected_call_count = 2
+    requester = mock_github_client.requester
+    assert requester.requestJsonAndCheck.call_count == expected_call_count
+
+
+@patch("gibr.trackers.github.error", side_effect=click.Abort)
+@patch("github.Github")
+def test_find_issues_request_failure(
+    mock_github_cls, mock_error, mock_github_client, mock_github_repo
+):
+    """A failed GraphQL request should be reported through error()."""
+    mock_github_cls.return_value = mock_github_client
+    mock_github_repo.full_name = "owner/repo"
+    mock_github_client.requester.requestJsonAndCheck.side_effect = GithubException(
+        502, "Bad Gateway", None
+    )
+    tracker = GithubTracker(repo="owner/repo", token="t")
+
+    with pytest.raises(click.Abort):
+        tracker.find_issues(["1"])
+    mock_error.assert_called_once()
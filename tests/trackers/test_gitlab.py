@@ -110,6 +110,20 @@ def test_list_issues_returns_list(
     assert issues[0].type == "issue"
 
 
+@patch("gitlab.Gitlab")
+def test_iter_issues_pages_lazily(
+    mock_gitlab_cls, mock_gitlab_client, mock_gitlab_project
+):
+    """iter_issues should ask for a lazy iterator instead of every page at once."""
+    mock_gitlab_cls.return_value = mock_gitlab_client
+    tracker = GitlabTracker(url="https://gitlab.com", token="tok", project="group/proj")
+    issues = list(tracker.iter_issues())
+    mock_gitlab_project.issues.list.assert_called_once_with(
+        state="opened", iterator=True
+    )
+    assert [issue.title for issue in issues] == ["Fix pipeline bug"]
+
+
 def test_describe_config_returns_expected_format():
     """describe_config() should return a formatted summary of the config."""
     config = {"url": "https://gitlab.com", "project": "group/proj", "token": "tok"}
@@ -173,3 +187,60 @@ def test_import_error_called_when_gitlab_missing(mock_import_error):
             GitlabTracker(url="https://gitlab.com", token="tok", project="group/proj")
 
     mock_import_error.assert_called_once_with("python-gitlab", "gitlab")
+
+
+@patch("gitlab.Gitlab")
+def test_get_issues_filters_by_iids(
+    mock_gitlab_cls, mock_gitlab_client, mock_gitlab_project
+):
+    """get_issues should fetch all issues in a single iids-filtered list call."""
+    mock_gitlab_cls.return_value = mock_gitlab_client
+    mock_gitlab_project.issues.list.return_value = [
+        MagicMock(iid=1, title="One", assignees=[], assignee=None, state="opened"),
+        MagicMock(iid=2, title="Two", assignees=[], assignee=None, state="closed"),
+    ]
+    tracker = GitlabTracker(url="u", token="t", project="p")
+
+    issues = tracker.get_issues(["2", "1"])
+
+    assert [issue.id for issue in issues] == [2, 1]
+    assert [issue.closed for issue in issues] == [True, False]
+    mock_gitlab_project.issues.list.assert_called_once_with(
+        iids=[2, 1], per_page=2, all=True
+    )
+
+
+@patch("gitlab.Gitlab")
+def test_find_issues_batches_and_skips_missing(
+    mock_gitlab_cls, mock_gitlab_client, mock_gitlab_project
+):
+    """find_issues should list iids in batches and leave out unknown ones."""
+    mock_gitlab_cls.return_value = mock_gitlab_client
+    mock_gitlab_project.issues.list.side_effect = [
+        [MagicMock(iid=1, title="One", assignees=[], assignee=None, state="opened")],
+        [],
+    ]
+    tracker = GitlabTracker(url="u", token="t", project="p")
+    tracker.BATCH_SIZE = 2
+
+    found = tracker.find_issues(["1", "2", "3"])
+
+    assert list(found) == ["1"]
+    assert found["1"].state == "opened"
+    expected_call_count = 2
+    assert mock_gitlab_project.issues.list.call_count == expected_call_count
+
+
+@patch("gibr.trackers.gitlab.error", side_effect=click.Abort)
+@patch("gitlab.Gitlab")
+def test_get_issues_reports_missing(
+    mock_gitlab_cls, mock_error, mock_gitlab_client, mock_gitlab_project
+):
+    """get_issues should error listing the iids that were not returned."""
+    mock_gitlab_cls.return_value = mock_gitlab_client
+    mock_gitlab_project.issues.list.return_value = []
+    tracker = GitlabTracker(url="u", token="t", project="p")
+
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["5"])
+    mock_error.assert_called_once_with("Issues not found in GitLab project p: 5")
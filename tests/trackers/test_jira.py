@@ -23,6 +23,8 @@ def mock_jira_client():
     mock_issue.fields.issuetype.name = "Task"
     mock_issue.fields.assignee = MagicMock()
     mock_issue.fields.assignee.name = "username"
+    mock_issue.fields.status.name = "In Progress"
+    mock_issue.fields.status.statusCategory.key = "indeterminate"
 
     client.issue.return_value = mock_issue
     client.search_issues.return_value = [mock_issue]
@@ -329,3 +331,110 @@ def test_import_error_called_when_jira_missing(mock_import_error):
             JiraTracker(url="url.com", user="user", token="tok")
 
     mock_import_error.assert_called_once_with("jira", "jira")
+
+
+@patch("jira.JIRA")
+def test_get_issues_uses_key_in_jql(mock_jira_cls, mock_jira_client):
+    """get_issues should resolve all keys with a single `key in` search."""
+    mock_jira_cls.return_value = mock_jira_client
+    tracker = JiraTracker(url="http://jira", user="u", token="t", project_key="PROJ")
+
+    issues = tracker.get_issues(["123", "PROJ-123"])
+
+    mock_jira_client.search_issues.assert_called_once_with(
+        "key in (PROJ-123)",
+        maxResults=1,
+        validate_query=False,
+        fields="summary,issuetype,assignee,status",
+    )
+    assert [issue.id for issue in issues] == ["PROJ-123", "PROJ-123"]
+    assert issues[0].state == "In Progress"
+    assert not issues[0].closed
+
+
+@patch("jira.JIRA")
+def test_find_issues_skips_unknown_keys(mock_jira_cls, mock_jira_client):
+    """find_issues should leave out keys the search did not return."""
+    mock_jira_cls.return_value = mock_jira_client
+    tracker = JiraTracker(url="http://jira", user="u", token="t", project_key="PROJ")
+    tracker.BATCH_SIZE = 1
+    mock_jira_client.search_issues.side_effect = [
+        mock_jira_client.search_issues.return_value,
+        [],
+    ]
+
+    found = tracker.find_issues(["123", "PROJ-9"])
+
+    assert list(found) == ["123"]
+    assert found["123"].id == "PROJ-123"
+    expected_call_count = 2
+    assert mock_jira_client.search_issues.call_count == expected_call_count
+
+
+@patch("jira.JIRA")
+def test_find_issues_skips_unresolvable_ids(mock_jira_cls, mock_jira_client):
+    """Numeric ids without a project key should be skipped, not an error."""
+    mock_jira_cls.return_value = mock_jira_client
+    tracker = JiraTracker(url="http://jira", user="u", token="t")
+
+    found = tracker.find_issues(["2", "fix-typo", "proj-123"])
+
+    assert list(found) == ["proj-123"]
+    assert found["proj-123"].id == "PROJ-123"
+    mock_jira_client.search_issues.assert_called_once()
+    assert mock_jira_client.search_issues.call_args.args == ("key in (PROJ-123)",)
+
+
+@patch("jira.JIRA")
+def test_find_issues_finds_moved_issues(mock_jira_cls, mock_jira_client):
+    """Issues returned under a new key should be matched by their old key."""
+    mock_jira_cls.return_value = mock_jira_client
+    moved = mock_jira_client.issue.return_value
+
+    def issue(key, fields):
+        if key != "OLD-1":
+            raise JIRAError(text="gone")
+        return moved
+
+    mock_jira_client.issue.side_effect = issue
+    tracker = JiraTracker(url="http://jira", user="u", token="t")
+
+    found = tracker.find_issues(["OLD-1", "OLD-2"])
+
+    assert list(found) == ["OLD-1"]
+    assert found["OLD-1"].id == moved.key
+    mock_jira_client.issue.assert_any_call(
+        "OLD-1", fields="summary,issuetype,assignee,status"
+    )
+
+
+@patch("gibr.trackers.jira.error", side_effect=click.Abort)
+@patch("jira.JIRA")
+def test_get_issues_reports_missing_keys(mock_jira_cls, mock_error, mock_jira_client):
+    """get_issues should error listing keys the search did not return."""
+    mock_jira_cls.return_value = mock_jira_client
+    tracker = JiraTracker(url="http://jira", user="u", token="t", project_key="PROJ")
+
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["123", "124"])
+    mock_error.assert_called_once_with("Issues not found in Jira: PROJ-124")
+
+
+@patch("gibr.trackers.jira.error", side_effect=click.Abort)
+@patch("jira.JIRA")
+def test_get_issues_search_failure(mock_jira_cls, mock_error, mock_jira_client):
+    """get_issues should surface JQL errors through error()."""
+    mock_jira_cls.return_value = mock_jira_client
+    mock_jira_client.search_issues.side_effect = JIRAError(text="bad jql")
+    tracker = JiraTracker(url="http://jira", user="u", token="t", project_key="PROJ")
+
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["123"])
+    mock_error.assert_called_once_with("Failed to fetch Jira issues: bad jql")
+
+
+def test_resolve_issue_id_applies_project_key():
+    """Numbers get the project key; keys and numbers without one are kept."""
+    assert JiraTracker.resolve_issue_id("12", {"project_key": "PROJ"}) == "PROJ-12"
+    assert JiraTracker.resolve_issue_id("FOO-3", {"project_key": "PROJ"}) == "FOO-3"
+    assert JiraTracker.resolve_issue_id("12", {}) == "12"
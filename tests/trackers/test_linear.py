@@ -238,3 +238,103 @@ def test_get_issue_with_numeric_id_and_team_calls_graphql_with_correct_vars(
     # Assert correct call to _graphql_request
     mock_graphql.assert_called_once()
     assert mock_graphql.call_args[0][1] == {"teamKey": "ENG", "number": 45}
+
+
+def test_get_issues_uses_aliased_query(mock_post):
+    """get_issues should fetch all issues in one request, one alias per team."""
+    tracker = LinearTracker(token="t", team="ENG")
+    mock_post.return_value = make_response(
+        json_data={
+            "data": {
+                "b0": {
+                    "nodes": [
+                        {
+                            "identifier": "ENG-1",
+                            "title": "One",
+                            "assignee": None,
+                            "state": {"name": "Done", "type": "completed"},
+                        }
+                    ]
+                },
+                "b1": {
+                    "nodes": [
+                        {
+                            "identifier": "OPS-2",
+                            "title": "Two",
+                            "assignee": {"displayName": "Me"},
+                            "state": {"name": "In Progress", "type": "started"},
+                        }
+                    ]
+                },
+            }
+        }
+    )
+
+    issues = tracker.get_issues(["1", "OPS-2", "ENG-1"])
+
+    assert [issue.id for issue in issues] == ["ENG-1", "OPS-2", "ENG-1"]
+    assert issues[1].assignee == "Me"
+    assert [issue.closed for issue in issues] == [True, False, True]
+    assert issues[1].state == "In Progress"
+    mock_post.assert_called_once()
+    payload = mock_post.call_args.kwargs["json"]
+    assert payload["variables"] == {"t0": "ENG", "n0": [1], "t1": "OPS", "n1": [2]}
+
+
+@patch("gibr.trackers.linear.error", side_effect=click.Abort)
+def test_get_issues_missing_issue(mock_error, mock_post):
+    """get_issues should error when an issue is not returned."""
+    tracker = LinearTracker(token="t", team="ENG")
+    mock_post.return_value = make_response(json_data={"data": {"b0": {"nodes": []}}})
+
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["ENG-9"])
+    mock_error.assert_called_once_with("Issue ENG-9 not found in Linear.")
+
+
+def test_find_issues_batches_numbers(mock_post):
+    """find_issues should split a team's numbers into several aliases."""
+    tracker = LinearTracker(token="t", team="ENG")
+    tracker.BATCH_SIZE = 2
+    mock_post.return_value = make_response(json_data={"data": {}})
+
+    assert tracker.find_issues(["1", "2", "3"]) == {}
+    assert tracker.find_issues([]) == {}
+
+    mock_post.assert_called_once()
+    payload = mock_post.call_args.kwargs["json"]
+    assert payload["variables"] == {"t0": "ENG", "n0": [1, 2], "t1": "ENG", "n1": [3]}
+
+
+def test_find_issues_skips_unresolvable_ids_and_ignores_case(mock_post):
+    """IDs from branch names should be skipped or matched in any case."""
+    tracker = LinearTracker(token="t")
+    mock_post.return_value = make_response(
+        json_data={
+            "data": {
+                "b0": {
+                    "nodes": [
+                        {
+                            "identifier": "ENG-1",
+                            "title": "One",
+                            "assignee": None,
+                            "state": {"name": "Todo", "type": "unstarted"},
+                        }
+                    ]
+                }
+            }
+        }
+    )
+
+    found = tracker.find_issues(["123", "feature-2-cleanup", "eng-1"])
+
+    assert list(found) == ["eng-1"]
+    assert found["eng-1"].id == "ENG-1"
+    payload = mock_post.call_args.kwargs["json"]
+    assert payload["variables"] == {"t0": "ENG", "n0": [1]}
+
+
+def test_resolve_issue_id_applies_team():
+    """Numbers get the team key; issue keys are kept."""
+    assert LinearTracker.resolve_issue_id("12", {"team": "ENG"}) == "ENG-12"
+    assert LinearTracker.resolve_issue_id("OPS-3", {"team": "ENG"}) == "OPS-3"
@@ -199,3 +199,64 @@ def test_get_issue_calls_graphql_with_correct_vars(mock_graphql):
 
     mock_graphql.assert_called_once()
     assert mock_graphql.call_args[0][1] == {"board_id": 123, "item_id": 456}
+
+
+def test_get_issues_uses_items_ids_query(mock_post):
+    """get_issues should fetch all items with a single items(ids:) query."""
+    tracker = MondayTracker(token="t", board_id="123")
+    mock_post.return_value = make_response(
+        json_data={
+            "data": {
+                "items": [
+                    {
+                        "id": "2",
+                        "name": "Two",
+                        "column_values": [{"type": "status", "text": "Done"}],
+                    },
+                    {"id": "1", "name": "One", "column_values": []},
+                ]
+            }
+        }
+    )
+
+    issues = tracker.get_issues(["1", "2"])
+
+    assert [issue.title for issue in issues] == ["One", "Two"]
+    assert [issue.state for issue in issues] == [None, "Done"]
+    assert [issue.closed for issue in issues] == [False, True]
+    mock_post.assert_called_once()
+    assert mock_post.call_args.kwargs["json"]["variables"] == {"item_ids": [1, 2]}
+
+
+def test_find_issues_skips_non_numeric(mock_post):
+    """find_issues should leave out IDs that are not item IDs."""
+    tracker = MondayTracker(token="t", board_id="123")
+    mock_post.return_value = make_response(
+        json_data={"data": {"items": [{"id": "1", "name": "One", "column_values": []}]}}
+    )
+
+    found = tracker.find_issues(["feature-2", "1"])
+
+    assert list(found) == ["1"]
+    assert mock_post.call_args.kwargs["json"]["variables"] == {"item_ids": [1]}
+    assert tracker.find_issues(["feature-2"]) == {}
+    mock_post.assert_called_once()
+
+
+@patch("gibr.trackers.monday.error", side_effect=click.Abort)
+def test_get_issues_rejects_non_numeric(mock_error):
+    """get_issues should reject non-numeric item ids."""
+    tracker = MondayTracker(token="t", board_id="123")
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["abc"])
+    assert "requires numeric item IDs" in mock_error.call_args[0][0]
+
+
+@patch("gibr.trackers.monday.error", side_effect=click.Abort)
+def test_get_issues_reports_missing(mock_error, mock_post):
+    """get_issues should error for items missing from the response."""
+    tracker = MondayTracker(token="t", board_id="123")
+    mock_post.return_value = make_response(json_data={"data": {"items": []}})
+    with pytest.raises(click.Abort):
+        tracker.get_issues(["5"])
+    mock_error.assert_called_once_with("Issues not found on Monday board 123: 5")